@@ -56,8 +56,10 @@ from scenarios import (
     EUCOM_POLAND, INDOPACOM_GUAM,
     DIVISION_READY_BRIGADE, POST_DEPLOYMENT_REFIT,
     RIMPAC_EXERCISE, SOF_SUPPORT,
-    OPFOR_AUGMENTATION, EMERGENCY_EDRE, HURRICANE_DSCA
+    OPFOR_AUGMENTATION, EMERGENCY_EDRE, HURRICANE_DSCA,
+    get_scenario
 )
+from scenario_costs import readiness_filter
 
 # Qualification system imports
 try:
@@ -827,6 +829,8 @@ def initialize_session_state():
         st.session_state.assignments = None
     if 'summary' not in st.session_state:
         st.session_state.summary = None
+    if 'ready_roster' not in st.session_state:
+        st.session_state.ready_roster = None  # Result of a readiness-only scenario
     if 'pareto_solutions' not in st.session_state:
         st.session_state.pareto_solutions = None
     if 'guided_mode' not in st.session_state:
@@ -2567,6 +2571,7 @@ def show_guided_welcome():
             "RIMPAC Exercise": RIMPAC_EXERCISE,
             "SOF Support Package": SOF_SUPPORT,
             "OPFOR Augmentation": OPFOR_AUGMENTATION,
+            "Emergency Deployment Exercise": EMERGENCY_EDRE,
             "Hurricane DSCA": HURRICANE_DSCA
         }
 
@@ -2613,8 +2618,11 @@ def show_guided_welcome():
                     if st.button(f"📋 Load {scenario.name}", key=f"load_{scenario.id}", type="primary" if not is_selected else "secondary", use_container_width=True):
                         # Load scenario configuration
                         st.session_state.selected_scenario = scenario.id
-                        st.session_state.capabilities = scenario.capabilities
-                        st.session_state.workflow_data['weights'] = scenario.optimization_weights
+                        st.session_state.capabilities = [dict(cap) for cap in scenario.capabilities]
+                        st.session_state.workflow_data['weights'] = dict(scenario.optimization_weights)
+                        st.session_state.workflow_data['scenario_id'] = scenario.id
+                        st.session_state.workflow_data['readiness_only'] = scenario.readiness_only
+                        st.session_state.ready_roster = None
                         st.session_state.workflow_data['force_size'] = scenario.force_size
                         st.session_state.workflow_data['location'] = scenario.location
                         st.session_state.exercise_location = scenario.location
@@ -2705,6 +2713,7 @@ def show_guided_welcome():
                 }
 
                 st.session_state.workflow_data['template_used'] = "Demo"
+                st.session_state.workflow_data['readiness_only'] = False
                 st.session_state.workflow_data['location'] = "Fort Irwin"
                 st.session_state.exercise_location = "Fort Irwin"
 
@@ -3135,6 +3144,19 @@ def show_guided_run_optimization():
     if st.button("🚀 Run Optimization", type="primary", use_container_width=True):
         with st.spinner("🔄 Running optimization... This may take 30-60 seconds..."):
             try:
+                # Readiness-only scenarios (e.g. EDRE) have no billets to match;
+                # screen the pool for deployable soldiers instead of running EMD
+                if st.session_state.workflow_data.get('readiness_only'):
+                    scenario = get_scenario(st.session_state.workflow_data['scenario_id'])
+                    st.session_state.ready_roster = readiness_filter(
+                        st.session_state.soldiers_df, scenario, st.session_state.soldiers_ext
+                    )
+                    st.session_state.assignments = None
+                    st.session_state.summary = None
+                    st.success("✅ Readiness screen complete!")
+                    GuidedWorkflow.next_step()
+                    return
+
                 # Get location from workflow data or use default
                 location = st.session_state.workflow_data.get('location', 'Fort Irwin')
                 st.session_state.exercise_location = location
@@ -3431,6 +3453,21 @@ def show_guided_review_results():
                 use_container_width=False
             )
 
+    elif st.session_state.get('ready_roster') is not None:
+        # Readiness-only scenario: report the deployable roster
+        ready = st.session_state.ready_roster
+        total = len(st.session_state.soldiers_df)
+        st.metric("Deployable Soldiers", f"{len(ready):,} of {total:,}",
+                  help="Soldiers meeting every readiness requirement")
+        st.dataframe(ready, use_container_width=True)
+        st.download_button(
+            label="📥 Download Deployable Roster (CSV)",
+            data=ready.to_csv(index=False),
+            file_name="deployable_roster.csv",
+            mime="text/csv",
+            use_container_width=False
+        )
+
     else:
         st.warning("⚠️ No results available. Please run optimization first.")
 
@@ -3472,6 +3509,7 @@ def show_guided_complete():
             st.session_state.capabilities = None
             st.session_state.assignments = None
             st.session_state.summary = None
+            st.session_state.ready_roster = None
             st.rerun()
 
 
@@ -30,6 +30,17 @@ try:
 except Exception:
     SCIPY_AVAILABLE = False
 
+# Billet columns holding JSON-encoded requirement lists (see BilletRequirements.to_dict)
+_BILLET_JSON_REQUIREMENTS = (
+    'languages_required_json',
+    'asi_codes_required_json', 'asi_codes_preferred_json',
+    'sqi_codes_required_json', 'sqi_codes_preferred_json',
+    'badges_required_json', 'badges_preferred_json',
+    'licenses_required_json', 'licenses_preferred_json',
+    'experience_required_json',
+    'awards_required_json',
+)
+
 class EMD:
     # ------------------------
     # Init
@@ -525,7 +536,8 @@ class EMD:
                 self.soldiers,
                 self.billets,
                 self.task_organizer,
-                cohesion_weight=1.0
+                cohesion_weight=1.0,
+                inplace=True
             )
         except ImportError:
             return cost_matrix
@@ -544,28 +556,32 @@ class EMD:
 
         # Import here to avoid circular dependency
         try:
-            from readiness_tracker import ReadinessValidator
+            from readiness_tracker import ReadinessValidator, build_readiness_matrix
             P = self.policies
 
-            # Reset index to ensure sequential 0, 1, 2, ... matching matrix rows
-            S = self.soldiers.reset_index(drop=True)
-
-            for i, soldier_row in S.iterrows():
-                soldier_id = soldier_row["soldier_id"]
-                soldier_ext = self.soldiers_ext.get(soldier_id)
-
-                is_ready, _, failures = ReadinessValidator.validate_soldier(
-                    soldier_row, soldier_ext, self.readiness_profile
-                )
+            # Extended records flattened once, shared by the checks and the currency bonus
+            matrix = build_readiness_matrix(self.soldiers_ext, self.readiness_profile)
 
-                if not is_ready:
-                    # Add penalty to all assignments for this soldier
-                    penalty = P["readiness_failure_penalty"] * len(failures)
-                    cost_matrix[i, :] += penalty
-                else:
-                    # Bonus for soldiers with all training current
-                    if soldier_ext and all(gate.is_current() for gate in soldier_ext.training_gates.values()):
-                        cost_matrix[i, :] += P["training_currency_bonus"]
+            # Failure counts per category for every soldier, aligned to matrix rows
+            checks = ReadinessValidator.validate_soldiers_df(
+                self.soldiers, self.soldiers_ext, self.readiness_profile,
+                readiness_matrix=matrix
+            )
+            is_ready = checks["is_ready"].to_numpy()
+            failure_count = checks["failure_count"].to_numpy()
+
+            # Training currency per soldier, evaluated once per gate
+            rows = matrix.index.get_indexer(self.soldiers["soldier_id"].to_numpy())
+            all_current = np.where(rows >= 0, matrix["gates_all_current"].to_numpy()[rows], False)
+
+            # Penalty per failure for soldiers not ready; bonus for ready soldiers
+            # with all training current
+            adjustment = np.where(
+                is_ready,
+                np.where(all_current, P["training_currency_bonus"], 0.0),
+                P["readiness_failure_penalty"] * failure_count
+            )
+            cost_matrix += adjustment[:, np.newaxis]
 
         except ImportError:
             pass
@@ -770,6 +786,12 @@ class EMD:
                     criticality = billet_row.get('criticality', 2)
                     is_critical = criticality >= 3
 
+                    # Decode the billet's JSON requirement lists once, not once per soldier
+                    billet_reqs = {
+                        col: parse_json_field(billet_row.get(col), [])
+                        for col in _BILLET_JSON_REQUIREMENTS
+                    }
+
                     for i, soldier_row in S.iterrows():
                         try:
                             total_matches += 1
@@ -813,7 +835,7 @@ class EMD:
                             # ========================================
                             langs_required_json = billet_row.get('languages_required_json')
                             if langs_required_json and not pd.isna(langs_required_json):
-                                langs_required = parse_json_field(langs_required_json, [])
+                                langs_required = billet_reqs['languages_required_json']
                                 for lang_req in langs_required:
                                     lang_code = lang_req.get('language_code')
                                     min_level = lang_req.get('min_listening_level', 2)
@@ -849,7 +871,7 @@ class EMD:
                             # Required ASIs
                             asis_required_json = billet_row.get('asi_codes_required_json')
                             if asis_required_json and not pd.isna(asis_required_json):
-                                asis_required = parse_json_field(asis_required_json, [])
+                                asis_required = billet_reqs['asi_codes_required_json']
                                 for asi_code in asis_required:
                                     required_count += 1
                                     if has_asi(soldier_row, asi_code):
@@ -863,7 +885,7 @@ class EMD:
                             # Preferred ASIs
                             asis_preferred_json = billet_row.get('asi_codes_preferred_json')
                             if asis_preferred_json and not pd.isna(asis_preferred_json):
-                                asis_preferred = parse_json_field(asis_preferred_json, [])
+                                asis_preferred = billet_reqs['asi_codes_preferred_json']
                                 for asi_code in asis_preferred:
                                     preferred_count += 1
                                     if has_asi(soldier_row, asi_code):
@@ -873,7 +895,7 @@ class EMD:
                             # Required SQIs
                             sqis_required_json = billet_row.get('sqi_codes_required_json')
                             if sqis_required_json and not pd.isna(sqis_required_json):
-                                sqis_required = parse_json_field(sqis_required_json, [])
+                                sqis_required = billet_reqs['sqi_codes_required_json']
                                 for sqi_code in sqis_required:
                                     required_count += 1
                                     if has_sqi(soldier_row, sqi_code):
@@ -886,7 +908,7 @@ class EMD:
                             # Preferred SQIs
                             sqis_preferred_json = billet_row.get('sqi_codes_preferred_json')
                             if sqis_preferred_json and not pd.isna(sqis_preferred_json):
-                                sqis_preferred = parse_json_field(sqis_preferred_json, [])
+                                sqis_preferred = billet_reqs['sqi_codes_preferred_json']
                                 for sqi_code in sqis_preferred:
                                     preferred_count += 1
                                     if has_sqi(soldier_row, sqi_code):
@@ -899,7 +921,7 @@ class EMD:
                             # Required badges
                             badges_required_json = billet_row.get('badges_required_json')
                             if badges_required_json and not pd.isna(badges_required_json):
-                                badges_required = parse_json_field(badges_required_json, [])
+                                badges_required = billet_reqs['badges_required_json']
                                 for badge_req in badges_required:
                                     badge_code = badge_req.get('badge_code')
                                     is_required = badge_req.get('required', True)
@@ -927,7 +949,7 @@ class EMD:
                             # Preferred badges
                             badges_preferred_json = billet_row.get('badges_preferred_json')
                             if badges_preferred_json and not pd.isna(badges_preferred_json):
-                                badges_preferred = parse_json_field(badges_preferred_json, [])
+                                badges_preferred = billet_reqs['badges_preferred_json']
                                 for badge_req in badges_preferred:
                                     badge_code = badge_req.get('badge_code')
                                     preferred_count += 1
@@ -945,7 +967,7 @@ class EMD:
                             # Required licenses
                             licenses_required_json = billet_row.get('licenses_required_json')
                             if licenses_required_json and not pd.isna(licenses_required_json):
-                                licenses_required = parse_json_field(licenses_required_json, [])
+                                licenses_required = billet_reqs['licenses_required_json']
                                 from qualifications import get_licenses
                                 soldier_licenses = get_licenses(soldier_row)
                                 soldier_license_types = {lic.get('license_type') for lic in soldier_licenses}
@@ -961,7 +983,7 @@ class EMD:
                             # Preferred licenses
                             licenses_preferred_json = billet_row.get('licenses_preferred_json')
                             if licenses_preferred_json and not pd.isna(licenses_preferred_json):
-                                licenses_preferred = parse_json_field(licenses_preferred_json, [])
+                                licenses_preferred = billet_reqs['licenses_preferred_json']
                                 for lic_type in licenses_preferred:
                                     preferred_count += 1
                                     if lic_type in soldier_license_types:
@@ -973,7 +995,7 @@ class EMD:
                             # ========================================
                             experience_required_json = billet_row.get('experience_required_json')
                             if experience_required_json and not pd.isna(experience_required_json):
-                                experiences_required = parse_json_field(experience_required_json, [])
+                                experiences_required = billet_reqs['experience_required_json']
                                 for exp_req in experiences_required:
                                     exp_type = exp_req.get('requirement_type')
                                     is_required = exp_req.get('required', True)
@@ -1043,7 +1065,7 @@ class EMD:
                             # ========================================
                             awards_required_json = billet_row.get('awards_required_json')
                             if awards_required_json and not pd.isna(awards_required_json):
-                                awards_required = parse_json_field(awards_required_json, [])
+                                awards_required = billet_reqs['awards_required_json']
                                 for award_type in awards_required:
                                     required_count += 1
                                     if has_award(soldier_row, award_type):
@@ -9,6 +9,7 @@ Features:
 - Hardcoded database of ~100 major military bases/locations
 - Haversine distance calculation (great-circle distance)
 - Travel cost estimation based on distance and duration
+- Batch (NumPy) distance and cost calculation for whole soldier pools
 - Fallback geocoding API for unknown locations
 - Lead time estimation for CONUS vs OCONUS travel
 
@@ -22,9 +23,12 @@ Classes:
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional
+from typing import Dict, Iterable, Tuple, Optional
+from functools import lru_cache
+import importlib.util
 import math
 import logging
+import numpy as np
 
 # Import error handling utilities
 try:
@@ -40,6 +44,9 @@ except ImportError:
     ERROR_HANDLING_AVAILABLE = False
     logging.basicConfig(level=logging.WARNING)
 
+# Numba is imported (and its kernels compiled) only by the first call large enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
 # Setup logger
 if ERROR_HANDLING_AVAILABLE:
     logger = setup_logging("geolocation")
@@ -100,6 +107,8 @@ class LocationDatabase:
 
     def __init__(self):
         self.locations: Dict[str, GeoLocation] = {}
+        # (name1, name2) -> miles, filled by DistanceCalculator.calculate
+        self._distance_cache: Dict[Tuple[str, str], float] = {}
         self._initialize_database()
 
     def _initialize_database(self):
@@ -221,6 +230,7 @@ class LocationDatabase:
                 logger.warning(f"Adding location with invalid coordinates: {location.name}")
 
             self.locations[key.lower()] = location
+            self._distance_cache.clear()
         except Exception as e:
             logger.error(f"Error adding location {key}: {e}")
 
@@ -299,6 +309,40 @@ class LocationDatabase:
             return []
 
 
+# Arrays at least this long use the Numba haversine / travel cost kernels when Numba is installed
+NUMBA_MIN_POINTS = 100_000
+
+
+@lru_cache(maxsize=None)
+def _haversine_kernel():
+    """Compile (or load from Numba's cache) the parallel haversine kernel."""
+    from numba import njit, prange
+
+    @njit("void(float64[:], float64[:], float64[:], float64[:], float64, float64[:], boolean[:])",
+          parallel=True, cache=True)
+    def _haversine_numba(lat1, lon1, lat2, lon2, radius, distance, valid):
+        """Parallel haversine for DistanceCalculator.haversine_array; flags invalid pairs in valid."""
+        for k in prange(lat1.shape[0]):
+            ok = (abs(lat1[k]) <= 90.0 and abs(lon1[k]) <= 180.0 and
+                  abs(lat2[k]) <= 90.0 and abs(lon2[k]) <= 180.0)
+            lat1_rad = math.radians(lat1[k])
+            lat2_rad = math.radians(lat2[k])
+            dlat = lat2_rad - lat1_rad
+            dlon = math.radians(lon2[k]) - math.radians(lon1[k])
+            a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+            ok = ok and 0.0 <= a <= 1.0
+            distance[k] = 2 * math.asin(math.sqrt(a)) * radius if ok else 0.0
+            valid[k] = ok
+
+    return _haversine_numba
+
+
+@lru_cache(maxsize=None)
+def _default_database() -> LocationDatabase:
+    """Shared LocationDatabase for calls that do not pass one."""
+    return LocationDatabase()
+
+
 class DistanceCalculator:
     """
     Calculate great-circle distances between locations using Haversine formula.
@@ -391,15 +435,27 @@ class DistanceCalculator:
         Args:
             loc1: Location name or GeoLocation object
             loc2: Location name or GeoLocation object
-            db: LocationDatabase (created if None)
+            db: LocationDatabase (shared default if None)
 
         Returns:
             Distance in miles (or default if calculation fails)
         """
-        try:
-            if db is None:
-                db = LocationDatabase()
+        if db is None:
+            db = _default_database()
+
+        # Name pairs are memoized on the database (cleared when locations are added)
+        if isinstance(loc1, str) and isinstance(loc2, str):
+            key = (loc1, loc2)
+            distance = db._distance_cache.get(key)
+            if distance is None:
+                distance = db._distance_cache[key] = DistanceCalculator._calculate(loc1, loc2, db)
+            return distance
+        return DistanceCalculator._calculate(loc1, loc2, db)
 
+    @staticmethod
+    def _calculate(loc1: str | GeoLocation, loc2: str | GeoLocation, db: LocationDatabase) -> float:
+        """Uncached distance between two locations (see calculate)."""
+        try:
             # Resolve location names to GeoLocation objects
             if isinstance(loc1, str):
                 geo1 = db.get(loc1)
@@ -429,6 +485,94 @@ class DistanceCalculator:
             logger.error(f"Error calculating distance between {loc1} and {loc2}: {e}")
             return GeoConfig.DEFAULT_DISTANCE if ERROR_HANDLING_AVAILABLE else 1000.0
 
+    @staticmethod
+    def haversine_array(lat1, lon1, lat2, lon2, unit: str = "miles") -> np.ndarray:
+        """
+        Vectorized haversine over arrays of points (scalars broadcast).
+
+        Same formula and fallbacks as haversine(): pairs with out-of-range
+        coordinates, a domain error, or an invalid resulting distance get the
+        default distance.
+
+        Returns:
+            float64 array of distances in the specified unit
+        """
+        default = GeoConfig.DEFAULT_DISTANCE if ERROR_HANDLING_AVAILABLE else 1000.0
+        lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (lat1, lon1, lat2, lon2))
+        )
+        radius = DistanceCalculator.EARTH_RADIUS_KM if unit == "km" else DistanceCalculator.EARTH_RADIUS_MILES
+
+        if NUMBA_AVAILABLE and lat1.size >= NUMBA_MIN_POINTS:
+            shape = lat1.shape
+            distance = np.empty(lat1.size)
+            valid = np.empty(lat1.size, dtype=bool)
+            _haversine_kernel()(*(np.ascontiguousarray(v).ravel() for v in (lat1, lon1, lat2, lon2)),
+                                radius, distance, valid)
+            distance = distance.reshape(shape)
+            valid = valid.reshape(shape)
+        else:
+            valid = ((np.abs(lat1) <= 90) & (np.abs(lon1) <= 180) &
+                     (np.abs(lat2) <= 90) & (np.abs(lon2) <= 180))
+
+            lat1_rad, lon1_rad, lat2_rad, lon2_rad = map(np.radians, (lat1, lon1, lat2, lon2))
+            dlat = lat2_rad - lat1_rad
+            dlon = lon2_rad - lon1_rad
+            a = np.sin(dlat/2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon/2)**2
+            valid &= (a >= 0) & (a <= 1)
+
+            c = 2 * np.arcsin(np.sqrt(np.where(valid, a, 0.0)))
+            distance = c * radius
+
+        if ERROR_HANDLING_AVAILABLE:
+            valid &= (distance >= GeoConfig.MIN_DISTANCE) & (distance <= GeoConfig.MAX_DISTANCE)
+
+        if not valid.all():
+            logger.warning(f"{int((~valid).sum())} invalid coordinate pairs, using default distance")
+        return np.where(valid, distance, default)
+
+    @staticmethod
+    def calculate_batch(locations: Iterable[str], destination: str | GeoLocation,
+                        db: Optional[LocationDatabase] = None) -> np.ndarray:
+        """
+        Distances in miles from many location names to one destination.
+
+        Names are factorized to integer codes, each distinct name is looked up
+        once, and the distances over the distinct locations (a small lookup
+        table) are gathered back by code.
+        Unknown or invalid locations get the default distance, as in calculate().
+
+        Args:
+            locations: Location names (e.g. a soldiers' base column)
+            destination: Destination name or GeoLocation
+            db: LocationDatabase (shared default if None)
+
+        Returns:
+            float64 array of distances, one per location
+        """
+        default = GeoConfig.DEFAULT_DISTANCE if ERROR_HANDLING_AVAILABLE else 1000.0
+        if db is None:
+            db = _default_database()
+
+        # Row -> code of its distinct location name (missing names get a code too).
+        # pandas is imported here so importing geolocation alone stays light.
+        import pandas as pd
+        codes, names = pd.factorize(np.asarray(locations, dtype=object), use_na_sentinel=False)
+
+        dest = db.get(destination) if isinstance(destination, str) else destination
+        if dest is None or (ERROR_HANDLING_AVAILABLE and not dest.is_valid()):
+            logger.warning(f"Location not found or invalid: {destination}, using default distance")
+            return np.full(len(codes), default)
+
+        geos = [db.get(name) if isinstance(name, str) else None for name in names]
+        found = np.array([geo is not None and (not ERROR_HANDLING_AVAILABLE or geo.is_valid()) for geo in geos],
+                         dtype=bool)
+        lats = np.array([geo.lat if ok else 0.0 for geo, ok in zip(geos, found)], dtype=np.float64)
+        lons = np.array([geo.lon if ok else 0.0 for geo, ok in zip(geos, found)], dtype=np.float64)
+
+        distances = np.where(found, DistanceCalculator.haversine_array(lats, lons, dest.lat, dest.lon), default)
+        return distances[codes]
+
 
 class TravelCostEstimator:
     """
@@ -519,6 +663,63 @@ class TravelCostEstimator:
             logger.error(f"Unexpected error in travel cost estimation: {e}")
             return GeoConfig.DEFAULT_COST if ERROR_HANDLING_AVAILABLE else 3000.0
 
+    @staticmethod
+    def estimate_travel_cost_batch(distances, duration_days: int, is_oconus: bool = False) -> np.ndarray:
+        """
+        Vectorized estimate_travel_cost over an array of distances.
+
+        Distances outside the valid range fall back to the default distance
+        and out-of-range totals to the default cost, element by element.
+
+        Args:
+            distances: Distances to travel (miles)
+            duration_days: Duration of TDY/deployment (shared by all)
+            is_oconus: Whether destination is OCONUS
+
+        Returns:
+            float64 array of estimated costs in USD
+        """
+        distances = np.asarray(distances, dtype=np.float64)
+
+        if ERROR_HANDLING_AVAILABLE:
+            invalid = (distances < GeoConfig.MIN_DISTANCE) | (distances > GeoConfig.MAX_DISTANCE)
+            if invalid.any():
+                logger.warning(f"{int(invalid.sum())} invalid distances, using default distance")
+                distances = np.where(invalid, GeoConfig.DEFAULT_DISTANCE, distances)
+
+            is_valid_dur, msg_dur = validate_duration(duration_days)
+            if not is_valid_dur:
+                logger.warning(msg_dur)
+                duration_days = GeoConfig.DEFAULT_DURATION
+            duration_days = safe_int_conversion(duration_days, GeoConfig.DEFAULT_DURATION, "duration")
+        else:
+            distances = np.where(distances > 0, distances, 1000.0)
+            duration_days = int(duration_days) if duration_days > 0 else 14
+
+        # Per diem
+        per_diem_rate = TravelCostEstimator.PER_DIEM_OCONUS if is_oconus else TravelCostEstimator.PER_DIEM_CONUS
+        per_diem_cost = duration_days * per_diem_rate
+
+        if NUMBA_AVAILABLE and distances.size >= NUMBA_MIN_POINTS:
+            total_cost = _travel_cost_kernel()(distances, float(per_diem_cost))
+        else:
+            # Transportation cost: ground, domestic flight, international flight
+            transport_cost = np.select(
+                [distances < 500, distances < 3000],
+                [150 + distances * TravelCostEstimator.IRS_MILEAGE_RATE,
+                 TravelCostEstimator.DOMESTIC_FLIGHT_BASE + distances * TravelCostEstimator.DOMESTIC_FLIGHT_PER_MILE],
+                TravelCostEstimator.INTERNATIONAL_FLIGHT_BASE + distances * TravelCostEstimator.INTERNATIONAL_FLIGHT_PER_MILE
+            )
+            total_cost = transport_cost + per_diem_cost
+
+        if ERROR_HANDLING_AVAILABLE:
+            invalid = (total_cost < GeoConfig.MIN_COST) | (total_cost > GeoConfig.MAX_COST)
+            if invalid.any():
+                logger.warning(f"{int(invalid.sum())} invalid costs, using default cost")
+                total_cost = np.where(invalid, GeoConfig.DEFAULT_COST, total_cost)
+
+        return total_cost
+
     @staticmethod
     def estimate_lead_time(distance_miles: float, is_oconus: bool = False) -> int:
         """
@@ -590,6 +791,33 @@ class TravelCostEstimator:
             return "Unknown"
 
 
+# Rates read once here and compiled into the travel cost kernel as constants
+_IRS_MILEAGE_RATE = TravelCostEstimator.IRS_MILEAGE_RATE
+_DOMESTIC_FLIGHT_BASE = TravelCostEstimator.DOMESTIC_FLIGHT_BASE
+_DOMESTIC_FLIGHT_PER_MILE = TravelCostEstimator.DOMESTIC_FLIGHT_PER_MILE
+_INTERNATIONAL_FLIGHT_BASE = TravelCostEstimator.INTERNATIONAL_FLIGHT_BASE
+_INTERNATIONAL_FLIGHT_PER_MILE = TravelCostEstimator.INTERNATIONAL_FLIGHT_PER_MILE
+
+
+@lru_cache(maxsize=None)
+def _travel_cost_kernel():
+    """Compile (or load from Numba's cache) the travel cost ufunc."""
+    from numba import vectorize
+
+    @vectorize(["float64(float64, float64)"], cache=True)
+    def _travel_cost_numba(distance_miles, per_diem_cost):
+        """Transport + per diem for one distance (ufunc for TravelCostEstimator.estimate_travel_cost_batch)."""
+        if distance_miles < 500:
+            transport_cost = 150 + distance_miles * _IRS_MILEAGE_RATE
+        elif distance_miles < 3000:
+            transport_cost = _DOMESTIC_FLIGHT_BASE + distance_miles * _DOMESTIC_FLIGHT_PER_MILE
+        else:
+            transport_cost = _INTERNATIONAL_FLIGHT_BASE + distance_miles * _INTERNATIONAL_FLIGHT_PER_MILE
+        return transport_cost + per_diem_cost
+
+    return _travel_cost_numba
+
+
 class GeocodingService:
     """
     Fallback geocoding service for locations not in database.
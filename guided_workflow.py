@@ -105,14 +105,17 @@ class GuidedWorkflow:
             # Optional step, can always proceed
             return True
         elif step == WorkflowStep.MANNING_REQUIREMENTS:
-            # Need capabilities defined
+            # Need capabilities defined (readiness-only scenarios screen the pool instead)
+            if st.session_state.workflow_data.get('readiness_only'):
+                return True
             return st.session_state.get('capabilities') and len(st.session_state.capabilities) > 0
         elif step == WorkflowStep.OPTIMIZATION_SETUP:
             # Configuration is optional, can proceed
             return True
         elif step == WorkflowStep.RUN_OPTIMIZATION:
-            # Need optimization results
-            return st.session_state.get('assignments') is not None
+            # Need optimization results (or a readiness screen)
+            return (st.session_state.get('assignments') is not None
+                    or st.session_state.get('ready_roster') is not None)
         elif step == WorkflowStep.REVIEW_RESULTS:
             return True
 
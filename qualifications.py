@@ -30,11 +30,37 @@ Tracks comprehensive soldier qualifications including:
 Fully integrated with EMD optimization, filtering, and reporting.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple
+from dataclasses import dataclass, field, fields, MISSING
+from typing import List, Optional, Dict, Tuple, FrozenSet, NamedTuple, Iterable, Sequence
 from datetime import date, datetime
 from enum import Enum
+from operator import attrgetter
+from pathlib import Path
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+import functools
+import importlib.util
 import json
+import sys
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba is imported (and its kernel compiled) only by the first roster large enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
 
 # ==============================
@@ -53,6 +79,19 @@ class EducationLevel(Enum):
     PROFESSIONAL = "Professional Degree (MD, JD, etc.)"
 
 
+# Numeric education level for comparisons (SoldierProfileExtended.get_education_level_value)
+_EDU_LEVEL_VALUE = MappingProxyType({
+    EducationLevel.HS: 1,
+    EducationLevel.GED: 1,
+    EducationLevel.SOME_COLLEGE: 2,
+    EducationLevel.AA: 3,
+    EducationLevel.BA: 4,
+    EducationLevel.MA: 5,
+    EducationLevel.PHD: 6,
+    EducationLevel.PROFESSIONAL: 6
+})
+
+
 class DLPTLevel(Enum):
     """Defense Language Proficiency Test levels (0-5)."""
     LEVEL_0 = 0  # No proficiency
@@ -81,11 +120,52 @@ class AwardType(Enum):
     FOREIGN = "Foreign Award"
 
 
+# Direct member lookups for deserialization (skips Enum.__getitem__ / __call__ dispatch)
+_EDU_BY_NAME: Dict[str, EducationLevel] = {m.name: m for m in EducationLevel}
+_DLPT_BY_VALUE: Dict[int, DLPTLevel] = {m.value: m for m in DLPTLevel}
+_BADGE_BY_NAME: Dict[str, BadgeType] = {m.name: m for m in BadgeType}
+_AWARD_BY_NAME: Dict[str, AwardType] = {m.name: m for m in AwardType}
+
+
+# Date that expiry checks treat as "today"; set for a batch with as_of()
+_AS_OF: ContextVar[Optional[date]] = ContextVar("qualifications_as_of", default=None)
+
+
+@contextmanager
+def as_of(check_date: date):
+    """
+    Evaluate currency checks (is_current, has_asi, has_license, ...) as of check_date.
+
+    Example:
+        with as_of(date(2024, 6, 1)):
+            report = [p.has_license("CDL_A") for p in profiles]
+    """
+    token = _AS_OF.set(check_date)
+    try:
+        yield check_date
+    finally:
+        _AS_OF.reset(token)
+
+
+def _today() -> date:
+    return _AS_OF.get() or date.today()
+
+
+def _month_ordinal(d: date) -> int:
+    """Months since year 0, so month differences are a single subtraction."""
+    return d.year * 12 + d.month - 1
+
+
+def _intern_code(code) -> str:
+    """Intern a qualification code so each code is one shared string across the roster."""
+    return sys.intern(str(code))
+
+
 # ==============================
 # DATA CLASSES
 # ==============================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EducationRecord:
     """
     Record of formal education.
@@ -116,17 +196,17 @@ class EducationRecord:
     def from_dict(data: Dict) -> 'EducationRecord':
         """Create from dictionary."""
         return EducationRecord(
-            level=EducationLevel[data["level"]],
+            level=_EDU_BY_NAME[data["level"]],
             institution=data["institution"],
             degree_name=data.get("degree_name"),
             major=data.get("major"),
-            graduation_date=datetime.fromisoformat(data["graduation_date"]).date() if data.get("graduation_date") else None,
+            graduation_date=date.fromisoformat(data["graduation_date"]) if data.get("graduation_date") else None,
             gpa=data.get("gpa"),
             verified=data.get("verified", False)
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LanguageProficiency:
     """
     Language proficiency with DLPT scores.
@@ -142,6 +222,9 @@ class LanguageProficiency:
     expiration_date: Optional[date] = None
     native_speaker: bool = False
 
+    def __post_init__(self):
+        object.__setattr__(self, "language_code", _intern_code(self.language_code))
+
     def overall_level(self) -> int:
         """Get overall proficiency (average of listening/reading)."""
         return (self.listening_level.value + self.reading_level.value) // 2
@@ -155,7 +238,7 @@ class LanguageProficiency:
         """Check if DLPT is current (not expired)."""
         if not self.expiration_date:
             return True
-        check_date = as_of_date or date.today()
+        check_date = as_of_date or _today()
         return check_date <= self.expiration_date
 
     def to_dict(self) -> Dict:
@@ -176,15 +259,15 @@ class LanguageProficiency:
         return LanguageProficiency(
             language_code=data["language_code"],
             language_name=data["language_name"],
-            listening_level=DLPTLevel(data["listening_level"]),
-            reading_level=DLPTLevel(data["reading_level"]),
-            test_date=datetime.fromisoformat(data["test_date"]).date() if data.get("test_date") else None,
-            expiration_date=datetime.fromisoformat(data["expiration_date"]).date() if data.get("expiration_date") else None,
+            listening_level=_DLPT_BY_VALUE[data["listening_level"]],
+            reading_level=_DLPT_BY_VALUE[data["reading_level"]],
+            test_date=date.fromisoformat(data["test_date"]) if data.get("test_date") else None,
+            expiration_date=date.fromisoformat(data["expiration_date"]) if data.get("expiration_date") else None,
             native_speaker=data.get("native_speaker", False)
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AdditionalSkillIdentifier:
     """
     Additional Skill Identifier (ASI).
@@ -198,11 +281,14 @@ class AdditionalSkillIdentifier:
     award_date: Optional[date] = None
     expiration_date: Optional[date] = None
 
+    def __post_init__(self):
+        object.__setattr__(self, "code", _intern_code(self.code))
+
     def is_current(self, as_of_date: Optional[date] = None) -> bool:
         """Check if ASI is current (not expired)."""
         if not self.expiration_date:
             return True
-        check_date = as_of_date or date.today()
+        check_date = as_of_date or _today()
         return check_date <= self.expiration_date
 
     def to_dict(self) -> Dict:
@@ -220,12 +306,12 @@ class AdditionalSkillIdentifier:
         return AdditionalSkillIdentifier(
             code=data["code"],
             name=data["name"],
-            award_date=datetime.fromisoformat(data["award_date"]).date() if data.get("award_date") else None,
-            expiration_date=datetime.fromisoformat(data["expiration_date"]).date() if data.get("expiration_date") else None
+            award_date=date.fromisoformat(data["award_date"]) if data.get("award_date") else None,
+            expiration_date=date.fromisoformat(data["expiration_date"]) if data.get("expiration_date") else None
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpecialQualificationIdentifier:
     """
     Special Qualification Identifier (SQI).
@@ -237,6 +323,9 @@ class SpecialQualificationIdentifier:
     name: str  # Full name
     award_date: Optional[date] = None
 
+    def __post_init__(self):
+        object.__setattr__(self, "code", _intern_code(self.code))
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON storage."""
         return {
@@ -251,11 +340,11 @@ class SpecialQualificationIdentifier:
         return SpecialQualificationIdentifier(
             code=data["code"],
             name=data["name"],
-            award_date=datetime.fromisoformat(data["award_date"]).date() if data.get("award_date") else None
+            award_date=date.fromisoformat(data["award_date"]) if data.get("award_date") else None
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MilitaryBadge:
     """
     Military badge or tab.
@@ -269,6 +358,9 @@ class MilitaryBadge:
     award_date: Optional[date] = None
     device: Optional[str] = None  # Star, Oak Leaf Cluster, etc.
 
+    def __post_init__(self):
+        object.__setattr__(self, "code", _intern_code(self.code))
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON storage."""
         return {
@@ -285,13 +377,13 @@ class MilitaryBadge:
         return MilitaryBadge(
             code=data["code"],
             name=data["name"],
-            badge_type=BadgeType[data["badge_type"]],
-            award_date=datetime.fromisoformat(data["award_date"]).date() if data.get("award_date") else None,
+            badge_type=_BADGE_BY_NAME[data["badge_type"]],
+            award_date=date.fromisoformat(data["award_date"]) if data.get("award_date") else None,
             device=data.get("device")
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Award:
     """
     Military award or decoration.
@@ -306,6 +398,9 @@ class Award:
     device: Optional[str] = None  # "V" device, Oak Leaf Cluster, etc.
     award_number: int = 1  # 1st, 2nd, 3rd award
 
+    def __post_init__(self):
+        object.__setattr__(self, "code", _intern_code(self.code))
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON storage."""
         return {
@@ -323,14 +418,14 @@ class Award:
         return Award(
             code=data["code"],
             name=data["name"],
-            award_type=AwardType[data["award_type"]],
-            award_date=datetime.fromisoformat(data["award_date"]).date() if data.get("award_date") else None,
+            award_type=_AWARD_BY_NAME[data["award_type"]],
+            award_date=date.fromisoformat(data["award_date"]) if data.get("award_date") else None,
             device=data.get("device"),
             award_number=data.get("award_number", 1)
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CivilianLicense:
     """
     Civilian license or certification.
@@ -343,13 +438,16 @@ class CivilianLicense:
     issuing_authority: Optional[str] = None
     issue_date: Optional[date] = None
     expiration_date: Optional[date] = None
-    endorsements: List[str] = field(default_factory=list)
+    endorsements: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "license_type", _intern_code(self.license_type))
 
     def is_current(self, as_of_date: Optional[date] = None) -> bool:
         """Check if license is current (not expired)."""
         if not self.expiration_date:
             return True
-        check_date = as_of_date or date.today()
+        check_date = as_of_date or _today()
         return check_date <= self.expiration_date
 
     def to_dict(self) -> Dict:
@@ -361,7 +459,7 @@ class CivilianLicense:
             "issuing_authority": self.issuing_authority,
             "issue_date": self.issue_date.isoformat() if self.issue_date else None,
             "expiration_date": self.expiration_date.isoformat() if self.expiration_date else None,
-            "endorsements": self.endorsements
+            "endorsements": list(self.endorsements)
         }
 
     @staticmethod
@@ -372,13 +470,13 @@ class CivilianLicense:
             license_name=data["license_name"],
             license_number=data.get("license_number"),
             issuing_authority=data.get("issuing_authority"),
-            issue_date=datetime.fromisoformat(data["issue_date"]).date() if data.get("issue_date") else None,
-            expiration_date=datetime.fromisoformat(data["expiration_date"]).date() if data.get("expiration_date") else None,
-            endorsements=data.get("endorsements", [])
+            issue_date=date.fromisoformat(data["issue_date"]) if data.get("issue_date") else None,
+            expiration_date=date.fromisoformat(data["expiration_date"]) if data.get("expiration_date") else None,
+            endorsements=tuple(data.get("endorsements", ()))
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeploymentRecord:
     """
     Combat deployment or contingency operation.
@@ -392,13 +490,19 @@ class DeploymentRecord:
     end_date: Optional[date] = None
     duration_months: int = 0
     combat_deployment: bool = True
+    _start_mo: int = field(default=0, init=False, repr=False, compare=False)
+    _end_mo: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_start_mo", _month_ordinal(self.start_date))
+        if self.end_date:
+            object.__setattr__(self, "_end_mo", _month_ordinal(self.end_date))
 
     def calculate_duration(self) -> int:
         """Calculate deployment duration in months."""
-        if not self.end_date:
+        if self._end_mo is None:
             return 0
-        delta = (self.end_date.year - self.start_date.year) * 12 + (self.end_date.month - self.start_date.month)
-        return max(0, delta)
+        return max(0, self._end_mo - self._start_mo)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON storage."""
@@ -419,14 +523,14 @@ class DeploymentRecord:
             operation_name=data["operation_name"],
             theater=data["theater"],
             location=data["location"],
-            start_date=datetime.fromisoformat(data["start_date"]).date(),
-            end_date=datetime.fromisoformat(data["end_date"]).date() if data.get("end_date") else None,
+            start_date=date.fromisoformat(data["start_date"]),
+            end_date=date.fromisoformat(data["end_date"]) if data.get("end_date") else None,
             duration_months=data.get("duration_months", 0),
             combat_deployment=data.get("combat_deployment", True)
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DutyAssignment:
     """
     Previous duty assignment history.
@@ -439,12 +543,18 @@ class DutyAssignment:
     start_date: date
     end_date: Optional[date] = None
     duration_months: int = 0
+    _start_mo: int = field(default=0, init=False, repr=False, compare=False)
+    _end_mo: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_start_mo", _month_ordinal(self.start_date))
+        if self.end_date:
+            object.__setattr__(self, "_end_mo", _month_ordinal(self.end_date))
 
     def calculate_duration(self) -> int:
         """Calculate assignment duration in months."""
-        end = self.end_date or date.today()
-        delta = (end.year - self.start_date.year) * 12 + (end.month - self.start_date.month)
-        return max(0, delta)
+        end_mo = self._end_mo if self._end_mo is not None else _month_ordinal(_today())
+        return max(0, end_mo - self._start_mo)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON storage."""
@@ -464,8 +574,8 @@ class DutyAssignment:
             duty_station=data["duty_station"],
             unit=data["unit"],
             position=data["position"],
-            start_date=datetime.fromisoformat(data["start_date"]).date(),
-            end_date=datetime.fromisoformat(data["end_date"]).date() if data.get("end_date") else None,
+            start_date=date.fromisoformat(data["start_date"]),
+            end_date=date.fromisoformat(data["end_date"]) if data.get("end_date") else None,
             duration_months=data.get("duration_months", 0)
         )
 
@@ -474,65 +584,155 @@ class DutyAssignment:
 # MAIN CONTAINER CLASS
 # ==============================
 
-@dataclass
+class _QualificationIndex(NamedTuple):
+    """Lookup tables derived from a SoldierProfileExtended's qualification lists."""
+    language_levels: Dict[str, int]  # code -> best min(listening, reading)
+    proficient_languages: FrozenSet[str]  # codes at 2/2 or better (has_language default)
+    asi_expiry: Dict[str, date]  # code -> latest expiration (date.max if none)
+    sqi_codes: FrozenSet[str]
+    badge_codes: FrozenSet[str]
+    license_expiry: Dict[str, date]  # license_type -> latest expiration (date.max if none)
+
+    @staticmethod
+    def build(profile: 'SoldierProfileExtended') -> '_QualificationIndex':
+        language_levels: Dict[str, int] = {}
+        for lang in profile.languages:
+            level = min(lang.listening_level.value, lang.reading_level.value)
+            if level > language_levels.get(lang.language_code, -1):
+                language_levels[lang.language_code] = level
+        return _QualificationIndex(
+            language_levels=language_levels,
+            proficient_languages=frozenset(code for code, level in language_levels.items() if level >= 2),
+            asi_expiry=_latest_expiry((asi.code, asi.expiration_date) for asi in profile.asi_codes),
+            sqi_codes=frozenset(sqi.code for sqi in profile.sqi_codes),
+            badge_codes=frozenset(badge.code for badge in profile.badges),
+            license_expiry=_latest_expiry(
+                (lic.license_type, lic.expiration_date) for lic in profile.licenses
+            ),
+        )
+
+
+def _record_list(cls: type, items: Optional[List[Dict]]) -> Tuple:
+    """Deserialize a list of record dicts into a tuple of records."""
+    return tuple(cls.from_dict(item) for item in items) if items else ()
+
+
+# SoldierProfileExtended record collections, stored as tuples
+_PROFILE_RECORD_FIELDS = frozenset({
+    "education_records", "languages", "asi_codes", "sqi_codes", "badges",
+    "awards", "licenses", "deployments", "duty_history",
+})
+
+
+def _latest_expiry(pairs) -> Dict[str, date]:
+    """Fold (code, expiration_date) pairs into code -> latest expiry, treating None as never."""
+    latest: Dict[str, date] = {}
+    for code, expiry in pairs:
+        expiry = expiry or date.max
+        if expiry > latest.get(code, date.min):
+            latest[code] = expiry
+    return latest
+
+
+@dataclass(slots=True)
 class SoldierProfileExtended:
     """
     Extended soldier profile with comprehensive qualification data.
 
     Mirrors Army IPPS-A/DTMS structure with full qualification tracking.
     Designed for integration with EMD optimization, filtering, and reporting.
+
+    Record collections are stored as tuples of frozen records. Change them by
+    assigning a new sequence or with add_records(); either way the has_*
+    lookup index is rebuilt on next use.
     """
     # Basic identifiers
     soldier_id: str
 
-    # Education
-    highest_education: EducationLevel = EducationLevel.HS
-    education_records: List[EducationRecord] = field(default_factory=list)
+    # Education (derived from education_records when not given)
+    highest_education: Optional[EducationLevel] = None
+    education_records: Sequence[EducationRecord] = ()
 
     # Languages
-    languages: List[LanguageProficiency] = field(default_factory=list)
+    languages: Sequence[LanguageProficiency] = ()
 
     # Skills & Qualifications
-    asi_codes: List[AdditionalSkillIdentifier] = field(default_factory=list)
-    sqi_codes: List[SpecialQualificationIdentifier] = field(default_factory=list)
+    asi_codes: Sequence[AdditionalSkillIdentifier] = ()
+    sqi_codes: Sequence[SpecialQualificationIdentifier] = ()
 
     # Badges & Awards
-    badges: List[MilitaryBadge] = field(default_factory=list)
-    awards: List[Award] = field(default_factory=list)
+    badges: Sequence[MilitaryBadge] = ()
+    awards: Sequence[Award] = ()
 
     # Licenses
-    licenses: List[CivilianLicense] = field(default_factory=list)
+    licenses: Sequence[CivilianLicense] = ()
 
     # Experience
     time_in_service_months: int = 0
     time_in_grade_months: int = 0
-    deployments: List[DeploymentRecord] = field(default_factory=list)
-    duty_history: List[DutyAssignment] = field(default_factory=list)
+    deployments: Sequence[DeploymentRecord] = ()
+    duty_history: Sequence[DutyAssignment] = ()
+
+    # Membership indices behind the has_* helpers (see _qualification_index)
+    _qual_index: Optional[_QualificationIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name in _PROFILE_RECORD_FIELDS:
+            object.__setattr__(self, name, tuple(value))
+            object.__setattr__(self, "_qual_index", None)
+        else:
+            object.__setattr__(self, name, value)
+
+    def __post_init__(self):
+        if self.highest_education is None:
+            self.highest_education = max(
+                (rec.level for rec in self.education_records),
+                key=_EDU_LEVEL_VALUE.__getitem__,
+                default=EducationLevel.HS
+            )
 
     # Helper Methods
 
+    def _qualification_index(self) -> _QualificationIndex:
+        """
+        Return membership indices over languages, ASIs, SQIs, badges and licenses.
+
+        Built on first use; assigning any record collection clears it.
+        """
+        index = self._qual_index
+        if index is None:
+            index = self._qual_index = _QualificationIndex.build(self)
+        return index
+
+    def add_records(self, attr: str, records: Iterable) -> None:
+        """Append records to the collection attr (e.g. "badges")."""
+        setattr(self, attr, (*getattr(self, attr), *records))
+
     def has_language(self, language_code: str, min_level: int = 2) -> bool:
         """Check if soldier has language at minimum proficiency."""
-        for lang in self.languages:
-            if lang.language_code == language_code and lang.is_proficient(min_level):
-                return True
-        return False
+        index = self._qualification_index()
+        if min_level == 2:
+            return language_code in index.proficient_languages
+        level = index.language_levels.get(language_code)
+        return level is not None and level >= min_level
 
     def has_asi(self, asi_code: str) -> bool:
         """Check if soldier has specific ASI."""
-        return any(asi.code == asi_code and asi.is_current() for asi in self.asi_codes)
+        expiry = self._qualification_index().asi_expiry.get(asi_code)
+        return expiry is not None and _today() <= expiry
 
     def has_sqi(self, sqi_code: str) -> bool:
         """Check if soldier has specific SQI."""
-        return any(sqi.code == sqi_code for sqi in self.sqi_codes)
+        return sqi_code in self._qualification_index().sqi_codes
 
     def has_badge(self, badge_code: str) -> bool:
         """Check if soldier has specific badge."""
-        return any(badge.code == badge_code for badge in self.badges)
+        return badge_code in self._qualification_index().badge_codes
 
     def has_license(self, license_type: str) -> bool:
         """Check if soldier has current license of specific type."""
-        return any(lic.license_type == license_type and lic.is_current() for lic in self.licenses)
+        expiry = self._qualification_index().license_expiry.get(license_type)
+        return expiry is not None and _today() <= expiry
 
     def deployment_count(self, combat_only: bool = False) -> int:
         """Count total deployments."""
@@ -550,17 +750,7 @@ class SoldierProfileExtended:
 
     def get_education_level_value(self) -> int:
         """Get numeric education level (for comparisons)."""
-        levels = {
-            EducationLevel.HS: 1,
-            EducationLevel.GED: 1,
-            EducationLevel.SOME_COLLEGE: 2,
-            EducationLevel.AA: 3,
-            EducationLevel.BA: 4,
-            EducationLevel.MA: 5,
-            EducationLevel.PHD: 6,
-            EducationLevel.PROFESSIONAL: 6
-        }
-        return levels.get(self.highest_education, 1)
+        return _EDU_LEVEL_VALUE.get(self.highest_education, 1)
 
     def to_dict(self) -> Dict:
         """Convert entire profile to dictionary for JSON storage."""
@@ -585,28 +775,470 @@ class SoldierProfileExtended:
         """Create profile from dictionary."""
         return SoldierProfileExtended(
             soldier_id=data["soldier_id"],
-            highest_education=EducationLevel[data.get("highest_education", "HS")],
-            education_records=[EducationRecord.from_dict(r) for r in data.get("education_records", [])],
-            languages=[LanguageProficiency.from_dict(l) for l in data.get("languages", [])],
-            asi_codes=[AdditionalSkillIdentifier.from_dict(a) for a in data.get("asi_codes", [])],
-            sqi_codes=[SpecialQualificationIdentifier.from_dict(s) for s in data.get("sqi_codes", [])],
-            badges=[MilitaryBadge.from_dict(b) for b in data.get("badges", [])],
-            awards=[Award.from_dict(a) for a in data.get("awards", [])],
-            licenses=[CivilianLicense.from_dict(l) for l in data.get("licenses", [])],
+            highest_education=_EDU_BY_NAME[data["highest_education"]] if data.get("highest_education") else None,
+            education_records=_record_list(EducationRecord, data.get("education_records")),
+            languages=_record_list(LanguageProficiency, data.get("languages")),
+            asi_codes=_record_list(AdditionalSkillIdentifier, data.get("asi_codes")),
+            sqi_codes=_record_list(SpecialQualificationIdentifier, data.get("sqi_codes")),
+            badges=_record_list(MilitaryBadge, data.get("badges")),
+            awards=_record_list(Award, data.get("awards")),
+            licenses=_record_list(CivilianLicense, data.get("licenses")),
             time_in_service_months=data.get("time_in_service_months", 0),
             time_in_grade_months=data.get("time_in_grade_months", 0),
-            deployments=[DeploymentRecord.from_dict(d) for d in data.get("deployments", [])],
-            duty_history=[DutyAssignment.from_dict(d) for d in data.get("duty_history", [])]
+            deployments=_record_list(DeploymentRecord, data.get("deployments")),
+            duty_history=_record_list(DutyAssignment, data.get("duty_history"))
         )
 
     def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        """
+        Convert to compact JSON string (orjson when installed).
+
+        NaN/inf floats are written as null with orjson; from_json accepts both.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict()).decode()
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @staticmethod
+    def from_json(json_str) -> 'SoldierProfileExtended':
+        """Create profile from JSON string or bytes."""
+        return SoldierProfileExtended.from_dict(loads_json(json_str))
+
+
+# ==============================
+# COLUMNAR ROSTER STORAGE
+# ==============================
+
+# Record tables: profile list attribute -> record class. Each table has one row
+# per record and a soldier_id column keying it to RosterStore.soldiers.
+ROSTER_TABLES: Dict[str, type] = {
+    "education_records": EducationRecord,
+    "languages": LanguageProficiency,
+    "asi_codes": AdditionalSkillIdentifier,
+    "sqi_codes": SpecialQualificationIdentifier,
+    "badges": MilitaryBadge,
+    "awards": Award,
+    "licenses": CivilianLicense,
+    "deployments": DeploymentRecord,
+    "duty_history": DutyAssignment,
+}
+
+# Enum columns are stored as to_dict() writes them: DLPT levels by value, others by name
+_ENUM_COLUMNS = {
+    "level": (attrgetter("name"), _EDU_BY_NAME.__getitem__),
+    "listening_level": (attrgetter("value"), _DLPT_BY_VALUE.__getitem__),
+    "reading_level": (attrgetter("value"), _DLPT_BY_VALUE.__getitem__),
+    "badge_type": (attrgetter("name"), _BADGE_BY_NAME.__getitem__),
+    "award_type": (attrgetter("name"), _AWARD_BY_NAME.__getitem__),
+}
+
+_SOLDIER_COLUMNS = ("soldier_id", "highest_education", "time_in_service_months", "time_in_grade_months")
+
+
+def _record_fields(cls: type) -> List:
+    return [f for f in fields(cls) if f.init]
+
+
+def _is_date_column(name: str) -> bool:
+    return name.endswith("_date")
+
+
+def _decode_column(name: str, series: pd.Series) -> list:
+    """Turn a stored column back into the Python values a record constructor expects."""
+    if _is_date_column(name):
+        return series.to_numpy("datetime64[D]").astype(object).tolist()  # NaT -> None
+    if name in _ENUM_COLUMNS:
+        decode = _ENUM_COLUMNS[name][1]
+        return [decode(v) for v in series.tolist()]
+    if name == "endorsements":
+        return [tuple(v) for v in series.tolist()]
+    if series.hasnans:
+        series = series.astype(object).where(series.notna(), None)  # NaN -> None (missing GPA, major, ...)
+    return series.tolist()
+
+
+def compute_durations(starts, ends, as_of: Optional[date] = None) -> np.ndarray:
+    """
+    Whole calendar months between each start and end date, vectorized.
+
+    Batched form of DeploymentRecord/DutyAssignment.calculate_duration.
+
+    Args:
+        starts: Start dates (anything np.asarray can turn into datetime64)
+        ends: End dates; NaT marks an open-ended record
+        as_of: End date used for open-ended records (DutyAssignment passes today);
+               if None they count as 0 months (DeploymentRecord behaviour)
+
+    Returns:
+        int32 array of non-negative month counts
+    """
+    starts = np.asarray(starts, dtype="datetime64[M]")
+    ends = np.asarray(ends, dtype="datetime64[M]")
+    open_ended = np.isnat(ends)
+    if as_of is not None:
+        ends = np.where(open_ended, np.datetime64(as_of, "M"), ends)
+    months = (ends - starts).astype(np.int64)
+    months[open_ended & (as_of is None)] = 0
+    return np.maximum(months, 0).astype(np.int32)
+
+
+# Rosters with at least this many soldiers use the Numba filter kernel when Numba is installed
+NUMBA_MIN_SOLDIERS = 100_000
+
+
+@functools.lru_cache(maxsize=None)
+def _filter_mask_kernel():
+    """Compile (or load from Numba's cache) the parallel filter_mask kernel."""
+    from numba import njit, prange
+
+    @njit("boolean[:](uint64[:], uint64, uint64)", parallel=True, cache=True)
+    def _filter_mask_numba(masks, required, forbidden):
+        """Parallel version of filter_mask for large rosters."""
+        out = np.empty(masks.size, dtype=np.bool_)
+        for i in prange(masks.size):
+            m = masks[i]
+            out[i] = (m & required) == required and (m & forbidden) == 0
+        return out
+
+    return _filter_mask_numba
+
+
+def filter_mask(masks: np.ndarray, required, forbidden=0) -> np.ndarray:
+    """
+    Which fingerprints hold every required bit and no forbidden bit.
+
+    Args:
+        masks: uint64 fingerprints (see RosterStore.qualification_masks)
+        required: Bits that must all be set (see qualification_mask)
+        forbidden: Bits that must all be clear
+
+    Returns:
+        Boolean array aligned with masks
+    """
+    required = np.uint64(required)
+    forbidden = np.uint64(forbidden)
+    if NUMBA_AVAILABLE and len(masks) >= NUMBA_MIN_SOLDIERS:
+        return _filter_mask_kernel()(masks, required, forbidden)
+    return ((masks & required) == required) & ((masks & forbidden) == 0)
+
+
+class RosterStore:
+    """
+    Column-oriented storage for a roster of extended profiles.
+
+    Holds one DataFrame of per-soldier scalars (``soldiers``) plus one DataFrame
+    per record type (``tables``, keyed as in ROSTER_TABLES) sharing a soldier_id
+    column. Dates are datetime64 columns and enums are stored as in to_dict(),
+    so whole rosters load and save without building a dict per record.
+
+    Example:
+        store = RosterStore.from_profiles(profiles)
+        store.save("roster/")
+        profiles = RosterStore.load("roster/").to_profiles()
+    """
+
+    def __init__(self, soldiers: pd.DataFrame, tables: Dict[str, pd.DataFrame]):
+        self.soldiers = soldiers
+        self.tables = tables
+        self._inverted: Optional[Dict[str, Dict[str, FrozenSet[str]]]] = None
+
+    def __len__(self) -> int:
+        return len(self.soldiers)
+
+    def __getattr__(self, name: str) -> pd.DataFrame:
+        # languages_df, asi_codes_df, deployments_df, ...
+        if name.endswith("_df") and name[:-3] in ROSTER_TABLES:
+            return self.tables[name[:-3]]
+        raise AttributeError(name)
+
+    # --- Construction ---
 
     @staticmethod
-    def from_json(json_str: str) -> 'SoldierProfileExtended':
-        """Create profile from JSON string."""
-        return SoldierProfileExtended.from_dict(json.loads(json_str))
+    def _table(cls: type, soldier_ids: list, columns: Dict[str, list]) -> pd.DataFrame:
+        data = {"soldier_id": pd.Series(soldier_ids, dtype=object)}
+        for f in _record_fields(cls):
+            values = columns[f.name]
+            if _is_date_column(f.name):
+                data[f.name] = np.array(values, dtype="datetime64[D]")
+            elif f.name in _ENUM_COLUMNS:
+                encode = _ENUM_COLUMNS[f.name][0]
+                data[f.name] = [encode(v) for v in values]
+            else:
+                data[f.name] = values
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[SoldierProfileExtended]) -> 'RosterStore':
+        """Build a store from SoldierProfileExtended objects."""
+        profiles = list(profiles)
+        soldiers = pd.DataFrame({
+            "soldier_id": [p.soldier_id for p in profiles],
+            "highest_education": [p.highest_education.name for p in profiles],
+            "time_in_service_months": [p.time_in_service_months for p in profiles],
+            "time_in_grade_months": [p.time_in_grade_months for p in profiles],
+        }, columns=list(_SOLDIER_COLUMNS))
+
+        tables = {}
+        for attr, record_cls in ROSTER_TABLES.items():
+            names = [f.name for f in _record_fields(record_cls)]
+            getters = attrgetter(*names)
+            ids, rows = [], []
+            for p in profiles:
+                for rec in getattr(p, attr):
+                    ids.append(p.soldier_id)
+                    rows.append(getters(rec))
+            columns = dict(zip(names, map(list, zip(*rows)))) if rows else {n: [] for n in names}
+            tables[attr] = cls._table(record_cls, ids, columns)
+        return cls(soldiers, tables)
+
+    @classmethod
+    def from_dicts(cls, profile_dicts: Iterable[Dict]) -> 'RosterStore':
+        """Build a store from SoldierProfileExtended.to_dict() payloads (e.g. parsed JSON)."""
+        profile_dicts = list(profile_dicts)
+        soldiers = pd.DataFrame({
+            "soldier_id": [d["soldier_id"] for d in profile_dicts],
+            "highest_education": [d.get("highest_education", "HS") for d in profile_dicts],
+            "time_in_service_months": [d.get("time_in_service_months", 0) for d in profile_dicts],
+            "time_in_grade_months": [d.get("time_in_grade_months", 0) for d in profile_dicts],
+        }, columns=list(_SOLDIER_COLUMNS))
+
+        tables = {}
+        for attr, record_cls in ROSTER_TABLES.items():
+            ids, records = [], []
+            for d in profile_dicts:
+                items = d.get(attr, [])
+                ids.extend([d["soldier_id"]] * len(items))
+                records.extend(items)
+            raw = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+            data = {"soldier_id": pd.Series(ids, dtype=object)}
+            for f in _record_fields(record_cls):
+                if f.name in raw:
+                    col = raw[f.name]
+                    if _is_date_column(f.name):
+                        col = pd.to_datetime(col).to_numpy("datetime64[D]")  # vectorized ISO parse
+                    data[f.name] = col.to_numpy() if isinstance(col, pd.Series) else col
+                elif _is_date_column(f.name):
+                    data[f.name] = np.full(len(records), np.datetime64("NaT"), dtype="datetime64[D]")
+                elif f.default_factory is not MISSING:
+                    data[f.name] = [f.default_factory() for _ in records]
+                else:
+                    data[f.name] = [f.default] * len(records)
+            tables[attr] = pd.DataFrame(data)
+        return cls(soldiers, tables)
+
+    # --- Derived columns ---
+
+    def deployment_durations(self) -> np.ndarray:
+        """Months per row of deployments_df, from start/end dates (see compute_durations)."""
+        deployments = self.tables["deployments"]
+        return compute_durations(deployments["start_date"], deployments["end_date"])
+
+    def duty_durations(self, as_of: Optional[date] = None) -> np.ndarray:
+        """Months per row of duty_history_df; open assignments run to as_of (default today)."""
+        duty = self.tables["duty_history"]
+        return compute_durations(duty["start_date"], duty["end_date"], as_of or _today())
+
+    def total_deployment_months(self) -> pd.Series:
+        """Sum of recorded duration_months per soldier (batched total_deployment_months)."""
+        deployments = self.tables["deployments"]
+        totals = deployments.groupby("soldier_id", sort=False)["duration_months"].sum()
+        return totals.reindex(self.soldiers["soldier_id"], fill_value=0).astype(np.int64)
+
+    # --- Qualification fingerprints ---
+
+    def qualification_masks(self, table: str, as_of: Optional[date] = None) -> np.ndarray:
+        """
+        Per-soldier bitmask of the codes held in a record table.
+
+        Args:
+            table: "badges", "asi_codes", "sqi_codes" or "licenses"
+            as_of: Date for expiry checks on ASIs and licenses (default: today),
+                   matching has_asi/has_license
+
+        Returns:
+            uint64 array aligned with self.soldiers; bit positions from the *_INDEX tables
+        """
+        column, index = _MASK_TABLES[table]
+        records = self.tables[table]
+        bits = records[column].map(index)
+        keep = bits.notna().to_numpy(copy=True)
+        if "expiration_date" in records:
+            expiry = records["expiration_date"].to_numpy("datetime64[D]")
+            keep &= np.isnat(expiry) | (expiry >= np.datetime64(as_of or _today(), "D"))
+
+        rows = pd.Index(self.soldiers["soldier_id"]).get_indexer(records["soldier_id"])[keep]
+        masks = np.zeros(len(self.soldiers), dtype=np.uint64)
+        np.bitwise_or.at(masks, rows, np.left_shift(np.uint64(1), bits.to_numpy()[keep].astype(np.uint64)))
+        return masks
+
+    def filter(self,
+               badges: Iterable[str] = (),
+               asi_codes: Iterable[str] = (),
+               sqi_codes: Iterable[str] = (),
+               licenses: Iterable[str] = (),
+               exclude_badges: Iterable[str] = (),
+               exclude_asi_codes: Iterable[str] = (),
+               exclude_sqi_codes: Iterable[str] = (),
+               exclude_licenses: Iterable[str] = (),
+               as_of: Optional[date] = None) -> np.ndarray:
+        """
+        Soldier IDs holding every listed qualification and none of the excluded ones.
+
+        Each record table is screened with one filter_mask pass over the
+        roster's fingerprints. ASIs and licenses count only if current as of as_of.
+        """
+        keep = np.ones(len(self.soldiers), dtype=bool)
+        for table, codes, excluded in (("badges", badges, exclude_badges),
+                                       ("asi_codes", asi_codes, exclude_asi_codes),
+                                       ("sqi_codes", sqi_codes, exclude_sqi_codes),
+                                       ("licenses", licenses, exclude_licenses)):
+            codes, excluded = list(codes), list(excluded)
+            if codes or excluded:
+                index = _MASK_TABLES[table][1]
+                keep &= filter_mask(self.qualification_masks(table, as_of),
+                                    qualification_mask(codes, index),
+                                    qualification_mask(excluded, index))
+        return self.soldiers["soldier_id"].to_numpy()[keep]
+
+    # --- Inverted index ---
+
+    def _inverted_index(self) -> Dict[str, Dict[str, FrozenSet[str]]]:
+        """
+        code -> soldier IDs for badges, ASIs, SQIs and 2/2+ languages, built on first query.
+
+        ASIs count only if current on the as-of date (see as_of) when the index is built.
+        """
+        if self._inverted is None:
+            def holders(records: pd.DataFrame, column: str) -> Dict[str, FrozenSet[str]]:
+                return {code: frozenset(ids) for code, ids
+                        in records.groupby(column, sort=False)["soldier_id"]}
+
+            asi = self.tables["asi_codes"]
+            expiry = asi["expiration_date"].to_numpy("datetime64[D]")
+            current = np.isnat(expiry) | (expiry >= np.datetime64(_today(), "D"))
+            languages = self.tables["languages"]
+            proficient = np.minimum(languages["listening_level"], languages["reading_level"]) >= 2
+            self._inverted = {
+                "badges": holders(self.tables["badges"], "code"),
+                "asi_codes": holders(asi[current], "code"),
+                "sqi_codes": holders(self.tables["sqi_codes"], "code"),
+                "languages": holders(languages[proficient], "language_code"),
+            }
+        return self._inverted
+
+    @property
+    def by_badge(self) -> Dict[str, FrozenSet[str]]:
+        return self._inverted_index()["badges"]
+
+    @property
+    def by_asi(self) -> Dict[str, FrozenSet[str]]:
+        return self._inverted_index()["asi_codes"]
+
+    @property
+    def by_sqi(self) -> Dict[str, FrozenSet[str]]:
+        return self._inverted_index()["sqi_codes"]
+
+    @property
+    def by_language_min2(self) -> Dict[str, FrozenSet[str]]:
+        return self._inverted_index()["languages"]
+
+    def find_soldiers(self,
+                      badges: Iterable[str] = (),
+                      asi_codes: Iterable[str] = (),
+                      sqi_codes: Iterable[str] = (),
+                      languages: Iterable[str] = ()) -> set:
+        """
+        Soldier IDs holding every listed badge, ASI, SQI and language (at 2/2 or better).
+
+        Intersects the inverted index sets, so cost scales with the matches
+        rather than the roster. With no criteria, returns every soldier.
+        """
+        index = self._inverted_index()
+        groups = [
+            [index[table].get(code, frozenset()) for code in codes]
+            for table, codes in (("badges", badges), ("asi_codes", asi_codes),
+                                 ("sqi_codes", sqi_codes), ("languages", languages))
+        ]
+        sets = sorted((s for group in groups for s in group), key=len)
+        if not sets:
+            return set(self.soldiers["soldier_id"])
+        return set(sets[0]).intersection(*sets[1:])
+
+    # --- Reconstruction ---
+
+    @staticmethod
+    def _records(record_cls: type, table: pd.DataFrame) -> list:
+        columns = [_decode_column(f.name, table[f.name]) for f in _record_fields(record_cls)]
+        return [record_cls(*row) for row in zip(*columns)]
+
+    def _build_profiles(self, soldiers: pd.DataFrame, tables: Dict[str, pd.DataFrame]) -> List[SoldierProfileExtended]:
+        profiles = [
+            SoldierProfileExtended(
+                soldier_id=sid,
+                highest_education=_EDU_BY_NAME[edu],
+                time_in_service_months=int(tis),
+                time_in_grade_months=int(tig),
+            )
+            for sid, edu, tis, tig in zip(*(soldiers[c].tolist() for c in _SOLDIER_COLUMNS))
+        ]
+        by_id = {p.soldier_id: p for p in profiles}
+        for attr, record_cls in ROSTER_TABLES.items():
+            table = tables[attr]
+            grouped: Dict[str, list] = {}
+            for sid, rec in zip(table["soldier_id"].tolist(), self._records(record_cls, table)):
+                grouped.setdefault(sid, []).append(rec)
+            for sid, records in grouped.items():
+                setattr(by_id[sid], attr, records)
+        return profiles
+
+    def to_profiles(self) -> List[SoldierProfileExtended]:
+        """Rebuild SoldierProfileExtended objects, in soldiers-table order."""
+        return self._build_profiles(self.soldiers, self.tables)
+
+    def profile(self, soldier_id: str) -> Optional[SoldierProfileExtended]:
+        """Rebuild one soldier's profile (None if the soldier is not in the store)."""
+        soldiers = self.soldiers[self.soldiers["soldier_id"] == soldier_id]
+        if soldiers.empty:
+            return None
+        tables = {attr: t[t["soldier_id"] == soldier_id] for attr, t in self.tables.items()}
+        return self._build_profiles(soldiers.iloc[:1], tables)[0]
+
+    def to_dict(self, soldier_id: str) -> Optional[Dict]:
+        """SoldierProfileExtended.to_dict() payload for one soldier (compatibility shim)."""
+        profile = self.profile(soldier_id)
+        return profile.to_dict() if profile is not None else None
+
+    # --- Persistence ---
+
+    def save(self, directory) -> Path:
+        """
+        Write one file per table into directory.
+
+        Uses Parquet when pyarrow is installed, otherwise pandas pickles.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, df in {"soldiers": self.soldiers, **self.tables}.items():
+            if PYARROW_AVAILABLE:
+                pq.write_table(pa.Table.from_pandas(df, preserve_index=False), directory / f"{name}.parquet")
+            else:
+                df.to_pickle(directory / f"{name}.pkl")
+        return directory
+
+    @classmethod
+    def load(cls, directory) -> 'RosterStore':
+        """Load a store written by save()."""
+        directory = Path(directory)
+
+        def read(name: str) -> pd.DataFrame:
+            parquet = directory / f"{name}.parquet"
+            if parquet.exists():
+                if not PYARROW_AVAILABLE:
+                    raise ImportError(f"pyarrow is required to read {parquet}")
+                return pq.read_table(parquet).to_pandas()
+            return pd.read_pickle(directory / f"{name}.pkl")
+
+        return cls(read("soldiers"), {attr: read(attr) for attr in ROSTER_TABLES})
 
 
 # ==============================
@@ -718,6 +1350,35 @@ COMMON_LICENSE_TYPES = {
     "CRANE": "Crane Operator",
 }
 
+# Bit positions for qualification fingerprints (RosterStore.qualification_masks)
+BADGE_INDEX: Dict[str, int] = {code: i for i, code in enumerate(COMMON_BADGES)}
+ASI_INDEX: Dict[str, int] = {code: i for i, code in enumerate(COMMON_ASI_CODES)}
+SQI_INDEX: Dict[str, int] = {code: i for i, code in enumerate(COMMON_SQI_CODES)}
+LICENSE_INDEX: Dict[str, int] = {code: i for i, code in enumerate(COMMON_LICENSE_TYPES)}
+
+# Roster table -> (code column, bit index)
+_MASK_TABLES = {
+    "badges": ("code", BADGE_INDEX),
+    "asi_codes": ("code", ASI_INDEX),
+    "sqi_codes": ("code", SQI_INDEX),
+    "licenses": ("license_type", LICENSE_INDEX),
+}
+
+
+def qualification_mask(codes: Iterable[str], index: Dict[str, int]) -> np.uint64:
+    """
+    Combine codes into a fingerprint bitmask using a *_INDEX table.
+
+    Raises:
+        ValueError: if a code has no bit (not in the COMMON_* reference data)
+    """
+    mask = 0
+    for code in codes:
+        if code not in index:
+            raise ValueError(f"No fingerprint bit for qualification code '{code}'")
+        mask |= 1 << index[code]
+    return np.uint64(mask)
+
 # ===== SECTION 2: Profile Generator (profile_generator.py) =====
 
 """
@@ -1418,6 +2079,21 @@ except ImportError:
 # JSON Parsing Helpers
 # ============================================================================
 
+def loads_json(text: str) -> Any:
+    """
+    Decode a JSON string, using orjson when it is installed.
+
+    Falls back to the standard library for input orjson rejects but json
+    accepts (e.g. NaN literals), so results match json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def parse_json_field(value: Any, default: Any = None) -> Any:
     """
     Safely parse a JSON field from a DataFrame.
@@ -1443,7 +2119,7 @@ def parse_json_field(value: Any, default: Any = None) -> Any:
 
     if isinstance(value, str):
         try:
-            return json.loads(value)
+            return loads_json(value)
         except (json.JSONDecodeError, ValueError):
             return default if default is not None else []
 
@@ -1549,7 +2225,7 @@ def has_asi(soldier_row: pd.Series, asi_code: str) -> bool:
             # Parse date if string
             if isinstance(exp_date, str):
                 exp_date = datetime.fromisoformat(exp_date).date()
-            return exp_date >= date.today()
+            return exp_date >= _today()
     return False
 
 
@@ -1644,6 +2320,13 @@ def has_theater_experience(soldier_row: pd.Series, theater: str) -> bool:
     return any(deploy.get('theater') == theater for deploy in deployments)
 
 
+# Education level names (education_level column) -> comparison value
+_EDU_NAME_LEVEL = {
+    'NONE': 0, 'GED': 1, 'HS': 2, 'SOME_COLLEGE': 3,
+    'AA': 4, 'BA': 5, 'MA': 6, 'PHD': 7, 'PROFESSIONAL': 7
+}
+
+
 def get_education_level_value(soldier_row: pd.Series) -> int:
     """
     Get numeric value of education level for comparisons.
@@ -1653,11 +2336,7 @@ def get_education_level_value(soldier_row: pd.Series) -> int:
     """
     edu = soldier_row.get('education_level', 'HS')
     if isinstance(edu, str):
-        edu_map = {
-            'NONE': 0, 'GED': 1, 'HS': 2, 'SOME_COLLEGE': 3,
-            'AA': 4, 'BA': 5, 'MA': 6, 'PHD': 7, 'PROFESSIONAL': 7
-        }
-        return edu_map.get(edu, 2)
+        return _EDU_NAME_LEVEL.get(edu, 2)
     return 2  # Default to HS
 
 
@@ -1673,12 +2352,8 @@ def has_minimum_education(soldier_row: pd.Series,
     Returns:
         True if soldier meets or exceeds requirement
     """
-    edu_map = {
-        'NONE': 0, 'GED': 1, 'HS': 2, 'SOME_COLLEGE': 3,
-        'AA': 4, 'BA': 5, 'MA': 6, 'PHD': 7, 'PROFESSIONAL': 7
-    }
     soldier_level = get_education_level_value(soldier_row)
-    required_level = edu_map.get(min_level, 2)
+    required_level = _EDU_NAME_LEVEL.get(min_level, 2)
     return soldier_level >= required_level
 
 
@@ -2369,48 +3044,48 @@ class BilletRequirements:
 
         # Parse JSON fields
         if 'languages_required_json' in data:
-            langs_data = json.loads(data['languages_required_json'])
+            langs_data = loads_json(data['languages_required_json'])
             req.languages_required = [LanguageRequirement.from_dict(lang) for lang in langs_data]
 
         if 'asi_codes_required_json' in data:
-            req.asi_codes_required = json.loads(data['asi_codes_required_json'])
+            req.asi_codes_required = loads_json(data['asi_codes_required_json'])
 
         if 'asi_codes_preferred_json' in data:
-            req.asi_codes_preferred = json.loads(data['asi_codes_preferred_json'])
+            req.asi_codes_preferred = loads_json(data['asi_codes_preferred_json'])
 
         if 'sqi_codes_required_json' in data:
-            req.sqi_codes_required = json.loads(data['sqi_codes_required_json'])
+            req.sqi_codes_required = loads_json(data['sqi_codes_required_json'])
 
         if 'sqi_codes_preferred_json' in data:
-            req.sqi_codes_preferred = json.loads(data['sqi_codes_preferred_json'])
+            req.sqi_codes_preferred = loads_json(data['sqi_codes_preferred_json'])
 
         if 'badges_required_json' in data:
-            badges_data = json.loads(data['badges_required_json'])
+            badges_data = loads_json(data['badges_required_json'])
             req.badges_required = [BadgeRequirement.from_dict(badge) for badge in badges_data]
 
         if 'badges_preferred_json' in data:
-            badges_data = json.loads(data['badges_preferred_json'])
+            badges_data = loads_json(data['badges_preferred_json'])
             req.badges_preferred = [BadgeRequirement.from_dict(badge) for badge in badges_data]
 
         if 'licenses_required_json' in data:
-            req.licenses_required = json.loads(data['licenses_required_json'])
+            req.licenses_required = loads_json(data['licenses_required_json'])
 
         if 'licenses_preferred_json' in data:
-            req.licenses_preferred = json.loads(data['licenses_preferred_json'])
+            req.licenses_preferred = loads_json(data['licenses_preferred_json'])
 
         if 'experience_required_json' in data:
-            exp_data = json.loads(data['experience_required_json'])
+            exp_data = loads_json(data['experience_required_json'])
             req.experience_required = [ExperienceRequirement.from_dict(exp) for exp in exp_data]
 
         if 'experience_preferred_json' in data:
-            exp_data = json.loads(data['experience_preferred_json'])
+            exp_data = loads_json(data['experience_preferred_json'])
             req.experience_preferred = [ExperienceRequirement.from_dict(exp) for exp in exp_data]
 
         if 'awards_required_json' in data:
-            req.awards_required = json.loads(data['awards_required_json'])
+            req.awards_required = loads_json(data['awards_required_json'])
 
         if 'awards_preferred_json' in data:
-            req.awards_preferred = json.loads(data['awards_preferred_json'])
+            req.awards_preferred = loads_json(data['awards_preferred_json'])
 
         if 'available_start_date' in data and data['available_start_date']:
             req.available_start_date = date.fromisoformat(data['available_start_date'])
@@ -2748,9 +3423,13 @@ Provides powerful filtering capabilities for the dashboard:
 Used by dashboard for soldier selection and billet matching analysis.
 """
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Any, Set, Tuple, Callable
+from typing import List, Dict, Optional, Any, Set, Tuple, Callable, Hashable
 from dataclasses import dataclass, field
 from datetime import date
 
@@ -2763,6 +3442,45 @@ from qualifications import (
 )
 
 
+# Mask expression per FilterCriterion operator, over `col` (Series) and `value`
+_CRITERION_EXPRESSIONS = {
+    'eq': "col == value",
+    'neq': "col != value",
+    'gt': "col > value",
+    'gte': "col >= value",
+    'lt': "col < value",
+    'lte': "col <= value",
+    'in': "col.isin(value)",
+    'contains': "col.astype(str).str.contains(str(value), case=False, na=False)",
+    'range': "(col >= value[0]) & (col <= value[1])",
+}
+
+
+def _hashable(value: Any) -> Optional[Hashable]:
+    """
+    Return a hashable cache key for a criterion value, or None if it has none.
+
+    Types are part of the key: equal values such as True, 1 and 1.0 can give
+    different masks (e.g. 'contains' matches on str(value)).
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        key = (type(value), tuple((type(item), item) for item in value))
+    else:
+        key = (type(value), value)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _to_bool_array(mask: Any) -> np.ndarray:
+    """Convert a boolean Series (possibly with missing values) to a NumPy mask."""
+    if isinstance(mask, pd.Series):
+        return mask.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(mask, dtype=bool)
+
+
 @dataclass
 class FilterCriterion:
     """
@@ -2803,6 +3521,13 @@ class QualificationFilter:
     specific qualification requirements.
     """
 
+    # Minimum number of groups before filter_with_multiple_groups uses threads
+    PARALLEL_GROUP_THRESHOLD = 4
+
+    # JSON qualification columns covered by search_qualification_text
+    JSON_SEARCH_FIELDS = ['languages_json', 'asi_codes_json', 'sqi_codes_json',
+                          'badges_json', 'awards_json', 'licenses_json']
+
     def __init__(self, soldiers_df: pd.DataFrame):
         """
         Initialize filter with soldiers DataFrame.
@@ -2812,8 +3537,47 @@ class QualificationFilter:
         """
         self.soldiers = soldiers_df
         self.filter_groups: List[FilterGroup] = []
+        self._crit_fn_cache: Dict[Tuple[str, str, Hashable], Callable[[], np.ndarray]] = {}
         self.preset_filters = self._initialize_presets()
 
+        # Derived per-soldier data, built on first use so constructing a filter
+        # (as the dashboard does after every chained filter) stays cheap
+        self._deploy_counts: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._json_index: Optional[Tuple[Dict[str, pd.Series], Dict[str, str]]] = None
+        self._preset_masks: Dict[str, np.ndarray] = {}
+
+    def _deployment_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (all, combat-only) deployment counts per soldier, parsed once from the JSON."""
+        if self._deploy_counts is None:
+            counts = np.zeros(len(self.soldiers), dtype=np.int32)
+            combat_counts = np.zeros(len(self.soldiers), dtype=np.int32)
+            if 'deployments_json' in self.soldiers.columns:
+                for i, value in enumerate(self.soldiers['deployments_json']):
+                    deployments = parse_json_field(value, [])
+                    counts[i] = len(deployments)
+                    combat_counts[i] = sum(
+                        1 for d in deployments if d.get('combat_deployment', False)
+                    )
+            self._deploy_counts = (counts, combat_counts)
+        return self._deploy_counts
+
+    def _json_search_index(self) -> Tuple[Dict[str, pd.Series], Dict[str, str]]:
+        """
+        Return lower-cased JSON text per column, plus each column's text joined
+        into one string so searches can rule out a whole column with one scan.
+        """
+        if self._json_index is None:
+            json_text: Dict[str, pd.Series] = {}
+            json_blob: Dict[str, str] = {}
+            for json_field in self.JSON_SEARCH_FIELDS:
+                if json_field in self.soldiers.columns:
+                    text = self.soldiers[json_field].map(lambda v: str(v).lower() if v else None,
+                                                         na_action='ignore')
+                    json_text[json_field] = text
+                    json_blob[json_field] = '\x00'.join(text.dropna())
+            self._json_index = (json_text, json_blob)
+        return self._json_index
+
     def _initialize_presets(self) -> Dict[str, FilterGroup]:
         """Initialize common preset filters."""
         presets = {}
@@ -2929,10 +3693,8 @@ class QualificationFilter:
         clear_order = {"None": 0, "Secret": 1, "TS": 2}
         min_level = clear_order.get(min_clearance, 1)
 
-        mask = self.soldiers['clearance'].apply(
-            lambda x: clear_order.get(x, 0) >= min_level
-        )
-        return self.soldiers[mask]
+        codes = self.soldiers['clearance'].map(clear_order).fillna(0).to_numpy()
+        return self.soldiers[codes >= min_level]
 
     def filter_by_education(self, min_level: str = "HS") -> pd.DataFrame:
         """Filter soldiers by minimum education level."""
@@ -3004,10 +3766,10 @@ class QualificationFilter:
 
     def filter_by_deployment_count(self, min_count: int = 1, combat_only: bool = False) -> pd.DataFrame:
         """Filter soldiers by minimum deployment count."""
-        mask = self.soldiers.apply(
-            lambda row: get_deployment_count(row, combat_only) >= min_count, axis=1
-        )
-        return self.soldiers[mask]
+        counts, combat_counts = self._deployment_counts()
+        if combat_only:
+            counts = combat_counts
+        return self.soldiers[counts >= min_count]
 
     def filter_by_theater_experience(self, theater: str) -> pd.DataFrame:
         """Filter soldiers with experience in specific theater."""
@@ -3056,85 +3818,120 @@ class QualificationFilter:
     # Advanced Filtering (Criterion-based)
     # ========================================
 
-    def apply_criterion(self, criterion: FilterCriterion) -> pd.DataFrame:
-        """Apply a single filter criterion."""
+    def _criterion_mask(self, criterion: FilterCriterion) -> np.ndarray:
+        """Evaluate a single criterion to a boolean mask over all soldiers."""
         field = criterion.field_name
         op = criterion.operator
         value = criterion.value
+        all_rows = np.ones(len(self.soldiers), dtype=bool)
+        if len(self.soldiers) == 0:
+            return all_rows
 
         # Handle special computed fields
         if field == "_has_combat_experience":
             mask = self.soldiers.apply(has_combat_experience, axis=1)
-            return self.soldiers[mask] if value else self.soldiers[~mask]
+            return _to_bool_array(mask) == bool(value)
 
         if field == "_has_any_language":
             mask = self.soldiers.apply(lambda row: has_any_language(row, 2), axis=1)
-            return self.soldiers[mask] if value else self.soldiers[~mask]
+            return _to_bool_array(mask) == bool(value)
 
         if field == "_has_combat_badge":
             mask = self.soldiers.apply(has_combat_badge, axis=1)
-            return self.soldiers[mask] if value else self.soldiers[~mask]
+            return _to_bool_array(mask) == bool(value)
 
         # Handle regular fields
         if field not in self.soldiers.columns:
-            return self.soldiers  # Field doesn't exist, return all
-
-        # Apply operator
-        if op == "eq":
-            return self.soldiers[self.soldiers[field] == value]
-        elif op == "neq":
-            return self.soldiers[self.soldiers[field] != value]
-        elif op == "gt":
-            return self.soldiers[self.soldiers[field] > value]
-        elif op == "gte":
-            return self.soldiers[self.soldiers[field] >= value]
-        elif op == "lt":
-            return self.soldiers[self.soldiers[field] < value]
-        elif op == "lte":
-            return self.soldiers[self.soldiers[field] <= value]
-        elif op == "in":
-            return self.soldiers[self.soldiers[field].isin(value)]
-        elif op == "contains":
-            mask = self.soldiers[field].astype(str).str.contains(str(value), case=False, na=False)
-            return self.soldiers[mask]
-        elif op == "range":
-            min_val, max_val = value
-            return self.soldiers[(self.soldiers[field] >= min_val) & (self.soldiers[field] <= max_val)]
-        else:
-            return self.soldiers
+            return all_rows  # Field doesn't exist, match all
 
-    def apply_filter_group(self, group: FilterGroup) -> pd.DataFrame:
-        """Apply a filter group (multiple criteria with AND/OR logic)."""
-        if not group.criteria:
-            return self.soldiers
+        criterion_fn = self._compile_criterion(field, op, value)
+        if criterion_fn is None:
+            return all_rows  # Unknown operator, match all
 
-        if group.logic == "AND":
-            # Start with all soldiers, then progressively filter
-            result_indices = set(self.soldiers.index)
+        return criterion_fn()
 
-            for criterion in group.criteria:
-                # Temporarily create a new filter with current result
-                temp_filter = QualificationFilter(self.soldiers[self.soldiers.index.isin(result_indices)])
-                filtered = temp_filter.apply_criterion(criterion)
-                # Intersect with current results
-                result_indices = result_indices.intersection(set(filtered.index))
+    def _compile_criterion(self, field: str, op: str, value: Any) -> Optional[Callable[[], np.ndarray]]:
+        """
+        Return a specialized mask function for a (field, operator, value) triple.
+
+        The function body is generated from the operator's expression template
+        with the column and value bound as defaults, so repeated evaluation of
+        the same criterion skips operator dispatch entirely.
+        """
+        expr = _CRITERION_EXPRESSIONS.get(op)
+        if expr is None:
+            return None
+
+        key = (field, op, _hashable(value))
+        if key[2] is not None and key in self._crit_fn_cache:
+            return self._crit_fn_cache[key]
+
+        namespace = {
+            '_to_bool_array': _to_bool_array,
+            'col': self.soldiers[field],
+            'value': value,
+        }
+        exec(
+            f"def _criterion_fn(col=col, value=value):\n"
+            f"    return _to_bool_array({expr})\n",
+            namespace
+        )
+        criterion_fn = namespace['_criterion_fn']
 
-            return self.soldiers[self.soldiers.index.isin(result_indices)]
+        if key[2] is not None:
+            self._crit_fn_cache[key] = criterion_fn
+        return criterion_fn
 
+    @staticmethod
+    def _pack(mask: np.ndarray) -> np.ndarray:
+        """Pack a boolean mask into uint64 words (64 rows per word)."""
+        packed = np.packbits(mask)
+        pad = -len(packed) % 8
+        if pad:
+            packed = np.concatenate([packed, np.zeros(pad, dtype=np.uint8)])
+        return packed.view(np.uint64)
+
+    @staticmethod
+    def _unpack(packed: np.ndarray, n: int) -> np.ndarray:
+        """Unpack uint64 words produced by _pack back into an n-row boolean mask."""
+        return np.unpackbits(packed.view(np.uint8), count=n).astype(bool)
+
+    def _group_mask(self, group: FilterGroup) -> np.ndarray:
+        """Evaluate a filter group to a boolean mask over all soldiers."""
+        n = len(self.soldiers)
+        if not group.criteria:
+            return np.ones(n, dtype=bool)
+
+        # Combine criteria on bit-packed words so each &/| covers 64 rows
+        if group.logic == "AND":
+            packed_acc = self._pack(np.ones(n, dtype=bool))
+            for criterion in group.criteria:
+                packed_acc &= self._pack(self._criterion_mask(criterion))
         else:  # OR logic
-            indices = set()
+            packed_acc = self._pack(np.zeros(n, dtype=bool))
             for criterion in group.criteria:
-                filtered = self.apply_criterion(criterion)
-                indices.update(filtered.index)
+                packed_acc |= self._pack(self._criterion_mask(criterion))
 
-            return self.soldiers[self.soldiers.index.isin(indices)]
+        return self._unpack(packed_acc, n)
+
+    def apply_criterion(self, criterion: FilterCriterion) -> pd.DataFrame:
+        """Apply a single filter criterion."""
+        return self.soldiers[self._criterion_mask(criterion)]
+
+    def apply_filter_group(self, group: FilterGroup) -> pd.DataFrame:
+        """Apply a filter group (multiple criteria with AND/OR logic)."""
+        return self.soldiers[self._group_mask(group)]
 
     def apply_preset(self, preset_name: str) -> pd.DataFrame:
         """Apply a preset filter by name."""
         if preset_name not in self.preset_filters:
             return self.soldiers
 
-        return self.apply_filter_group(self.preset_filters[preset_name])
+        # Presets and the soldier table are fixed, so each preset is evaluated once
+        mask = self._preset_masks.get(preset_name)
+        if mask is None:
+            mask = self._preset_masks[preset_name] = self._group_mask(self.preset_filters[preset_name])
+        return self.soldiers[mask]
 
     # ========================================
     # Complex Filtering (Multiple Groups)
@@ -3158,20 +3955,29 @@ class QualificationFilter:
         if not groups:
             return self.soldiers
 
-        if group_logic == "AND":
-            result = self.soldiers.copy()
-            for group in groups:
-                filtered = self.apply_filter_group(group)
-                result = result[result.index.isin(filtered.index)]
-            return result
+        if len(groups) < self.PARALLEL_GROUP_THRESHOLD:
+            # Few groups: accumulate one mask in place and stop once it is settled
+            if group_logic == "AND":
+                mask = np.ones(len(self.soldiers), dtype=bool)
+                for group in groups:
+                    mask &= self._group_mask(group)
+                    if not mask.any():
+                        break
+            else:  # OR logic
+                mask = np.zeros(len(self.soldiers), dtype=bool)
+                for group in groups:
+                    mask |= self._group_mask(group)
+                    if mask.all():
+                        break
+            return self.soldiers[mask]
 
-        else:  # OR logic
-            indices = set()
-            for group in groups:
-                filtered = self.apply_filter_group(group)
-                indices.update(filtered.index)
+        # Groups are independent; evaluate their masks concurrently (NumPy and
+        # pandas release the GIL inside their C loops) and combine once.
+        with ThreadPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as executor:
+            masks = list(executor.map(self._group_mask, groups))
 
-            return self.soldiers[self.soldiers.index.isin(indices)]
+        combine = np.bitwise_and if group_logic == "AND" else np.bitwise_or
+        return self.soldiers[functools.reduce(combine, masks)]
 
     # ========================================
     # Search Functions
@@ -3192,25 +3998,29 @@ class QualificationFilter:
             return self.soldiers[mask]
         return pd.DataFrame()  # Empty if no name field
 
-    def search_qualification_text(self, search_term: str) -> pd.DataFrame:
+    def search_qualification_text(self, search_term: str,
+                                  fields: Optional[List[str]] = None) -> pd.DataFrame:
         """
-        Search across all JSON qualification fields for text match.
+        Search across JSON qualification fields for text match.
 
-        Searches in languages, ASIs, SQIs, badges, awards, licenses.
+        Searches in languages, ASIs, SQIs, badges, awards, licenses, or only
+        in the given `fields` when provided.
         """
-        indices = set()
-
-        json_fields = ['languages_json', 'asi_codes_json', 'sqi_codes_json',
-                      'badges_json', 'awards_json', 'licenses_json']
-
-        for field in json_fields:
-            if field in self.soldiers.columns:
-                for idx, value in self.soldiers[field].items():
-                    if value and not pd.isna(value):
-                        if search_term.lower() in str(value).lower():
-                            indices.add(idx)
+        term = search_term.lower()
+        mask = np.zeros(len(self.soldiers), dtype=bool)
+        json_text, json_blob = self._json_search_index()
+
+        for field in (fields or self.JSON_SEARCH_FIELDS):
+            if field not in json_text:
+                continue
+            # Skip columns whose combined text cannot contain the term
+            if '\x00' not in term and term not in json_blob[field]:
+                continue
+            mask |= _to_bool_array(
+                json_text[field].str.contains(term, regex=False, na=False)
+            )
 
-        return self.soldiers[self.soldiers.index.isin(indices)]
+        return self.soldiers[mask]
 
     # ========================================
     # Statistics and Analysis
@@ -3225,15 +4035,27 @@ class QualificationFilter:
             'total_soldiers': total,
             'filtered_count': filtered,
             'filter_rate': filtered / total if total > 0 else 0,
-            'ranks': filtered_df['paygrade'].value_counts().to_dict() if filtered > 0 else {},
-            'mos': filtered_df['mos'].value_counts().to_dict() if filtered > 0 else {},
-            'bases': filtered_df['base'].value_counts().to_dict() if filtered > 0 else {},
+            'ranks': {},
+            'mos': {},
+            'bases': {},
         }
 
         if filtered > 0:
-            stats['avg_acft'] = filtered_df['acft_score'].mean()
-            stats['avg_dwell'] = filtered_df['dwell_months'].mean()
-            stats['deployable_pct'] = (filtered_df['deployable'] == 1).sum() / filtered
+            # One grouping pass over the categorical columns, split per column
+            counts = filtered_df.groupby(
+                ['paygrade', 'mos', 'base'], dropna=False, observed=True, sort=False
+            ).size()
+            for key, column in (('ranks', 'paygrade'), ('mos', 'mos'), ('bases', 'base')):
+                stats[key] = (
+                    counts.groupby(level=column, sort=False).sum()
+                    .sort_values(ascending=False, kind='stable')
+                    .to_dict()
+                )
+
+            means = filtered_df[['acft_score', 'dwell_months']].mean()
+            stats['avg_acft'] = means['acft_score']
+            stats['avg_dwell'] = means['dwell_months']
+            stats['deployable_pct'] = np.count_nonzero(filtered_df['deployable'].to_numpy() == 1) / filtered
 
         return stats
 
@@ -14,14 +14,19 @@ Classes:
 """
 
 from __future__ import annotations
+import functools
+import importlib.util
 import numpy as np
 import pandas as pd
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, NamedTuple, Optional, Tuple, Set
 from dataclasses import dataclass, field
 
 from unit_types import SoldierExtended, TrainingGate, Equipment, DeploymentRecord, Unit
 
+# Numba is imported (and its kernel compiled) only by the first force large enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
 
 @dataclass
 class ReadinessProfile:
@@ -57,6 +62,194 @@ class ReadinessProfile:
     prefer_high_acft: bool = False
     prefer_marksmanship: bool = False
 
+    def compile(self) -> _CompiledProfile:
+        """
+        Return the profile's requirements as an immutable, hashable snapshot.
+
+        Validators read the compiled form rather than the dataclass, so list
+        fields are converted to tuples once. Compiled profiles are cached by
+        field values; editing the profile simply yields a new snapshot.
+        """
+        return _compile_profile(
+            self.profile_name, tuple(self.required_training), tuple(self.required_equipment),
+            self.min_dwell_months, self.max_deployment_count, self.max_med_cat,
+            self.max_dental_cat, self.prefer_deployment_experience, self.prefer_high_acft,
+            self.prefer_marksmanship,
+        )
+
+
+class _CompiledProfile(NamedTuple):
+    """Frozen view of a ReadinessProfile consumed by the validators."""
+    profile_name: str
+    required_training: Tuple[str, ...]
+    required_equipment: Tuple[str, ...]
+    min_dwell_months: int
+    max_deployment_count: Optional[int]
+    max_med_cat: int
+    max_dental_cat: int
+    prefer_deployment_experience: bool
+    prefer_high_acft: bool
+    prefer_marksmanship: bool
+
+    def compile(self) -> _CompiledProfile:
+        return self
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_profile(*fields) -> _CompiledProfile:
+    return _CompiledProfile(*fields)
+
+
+def build_readiness_matrix(
+    soldiers_ext: Dict[int, SoldierExtended],
+    profile: ReadinessProfile,
+    check_date: Optional[date] = None
+) -> pd.DataFrame:
+    """
+    Flatten extended soldier records into per-requirement columns.
+
+    Walks soldiers_ext once and emits one row per soldier (indexed by
+    soldier_id) so readiness checks become column operations:
+    - train_<gate>_present: bool, required training gate on record
+    - train_<gate>_current: bool, required training gate present and current
+    - train_<gate>_days_expired: int32, days since a held gate lapsed (0 if current or absent)
+    - equip_<type>_valid: bool, valid qualification on required equipment
+    - deployment_count: int32
+    - gates_all_current: bool, every training gate on record is current
+
+    Accepts a ReadinessProfile or its compiled form. Callers that check the
+    same roster several times (e.g. unit by unit) can build the matrix once
+    and pass it to the validators as readiness_matrix.
+    """
+    check_date = check_date or date.today()
+    profile = profile.compile()
+
+    n = len(soldiers_ext)
+    soldier_ids = np.empty(n, dtype=np.int64)
+    equip_valid = {e: np.zeros(n, dtype=bool) for e in profile.required_equipment}
+    deployment_count = np.zeros(n, dtype=np.int32)
+
+    # Completion dates and currency windows gathered for vectorized date math:
+    # per required gate (None where not on record) and flat over every gate held
+    required_completed = {g: [None] * n for g in profile.required_training}
+    required_currency = {g: np.zeros(n, dtype=np.int64) for g in profile.required_training}
+    held_owner, held_completed, held_currency = [], [], []
+
+    for i, (soldier_id, soldier_ext) in enumerate(soldiers_ext.items()):
+        soldier_ids[i] = soldier_id
+        gates = soldier_ext.training_gates
+        for gate_name, completed in required_completed.items():
+            gate = gates.get(gate_name)
+            if gate is not None:
+                completed[i] = gate.completion_date
+                required_currency[gate_name][i] = gate.currency_days
+        if equip_valid:
+            expiry_by_type = soldier_ext.equipment_expiry_by_type()
+            for eq_type, column in equip_valid.items():
+                expiry = expiry_by_type.get(eq_type)
+                column[i] = expiry is not None and check_date <= expiry
+        deployment_count[i] = len(soldier_ext.deployment_history)
+        for gate in gates.values():
+            held_owner.append(i)
+            held_completed.append(gate.completion_date)
+            held_currency.append(gate.currency_days)
+
+    today = np.datetime64(check_date, "D")
+    columns = {}
+    for g in profile.required_training:
+        expiry = (np.array(required_completed[g], dtype="datetime64[D]")
+                  + required_currency[g].astype("timedelta64[D]"))
+        present = ~np.isnat(expiry)
+        current = today <= expiry
+        columns[f"train_{g}_present"] = present
+        columns[f"train_{g}_current"] = current
+        columns[f"train_{g}_days_expired"] = np.where(
+            present & ~current, (today - expiry).astype(np.int64), 0
+        ).astype(np.int32)
+    columns.update({f"equip_{e}_valid": col for e, col in equip_valid.items()})
+    columns["deployment_count"] = deployment_count
+
+    held_expiry = (np.array(held_completed, dtype="datetime64[D]")
+                   + np.array(held_currency, dtype=np.int64).astype("timedelta64[D]"))
+    lapsed = np.bincount(
+        np.array(held_owner, dtype=np.int64)[~(today <= held_expiry)], minlength=n
+    )
+    columns["gates_all_current"] = lapsed == 0
+    return pd.DataFrame(columns, index=pd.Index(soldier_ids, name="soldier_id"))
+
+
+# Failure category labels (as reported in failure_counts) -> validate_soldiers_df column
+FAILURE_CATEGORIES = {
+    "Medical": "fail_medical",
+    "Dental": "fail_dental",
+    "Non-deployable status": "fail_deploy",
+    "Dwell": "fail_dwell",
+    "Training": "fail_training",
+    "Equipment": "fail_equipment",
+    "Deployments": "fail_deployments",
+}
+
+# Forces at least this large use the fused Numba kernel when Numba is installed
+NUMBA_MIN_SOLDIERS = 100_000
+
+
+def _reduce_readiness(med, dental, deployable, dwell, train_ok, equip_ok, over_deployed,
+                      max_med, max_dental, min_dwell) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce per-soldier readiness inputs to failure counts and an is_ready mask.
+
+    Returns:
+        (fails, is_ready) where fails is an int32 (n, 7) array of failure counts
+        in FAILURE_CATEGORIES order
+    """
+    n = len(med)
+    fails = np.empty((n, len(FAILURE_CATEGORIES)), dtype=np.int32)
+    # Written as negated passes so missing values fail, as in validate_soldier
+    fails[:, 0] = ~np.asarray(med <= max_med, dtype=bool)
+    fails[:, 1] = ~np.asarray(dental <= max_dental, dtype=bool)
+    fails[:, 2] = ~np.asarray(deployable == 1, dtype=bool)
+    fails[:, 3] = ~np.asarray(dwell >= min_dwell, dtype=bool)
+    fails[:, 4] = (~train_ok).sum(axis=1)
+    fails[:, 5] = (~equip_ok).sum(axis=1)
+    fails[:, 6] = over_deployed
+    return fails, ~fails.any(axis=1)
+
+
+@functools.lru_cache(maxsize=None)
+def _reduce_readiness_kernel():
+    """Compile (or load from Numba's cache) the fused readiness kernel."""
+    from numba import njit, prange
+
+    @njit("Tuple((int32[:, :], boolean[:]))(float64[:], float64[:], float64[:], float64[:], "
+          "boolean[:, :], boolean[:, :], boolean[:], float64, float64, float64)",
+          parallel=True, cache=True)
+    def _reduce_readiness_numba(med, dental, deployable, dwell, train_ok, equip_ok,
+                                over_deployed, max_med, max_dental, min_dwell):
+        """Fused, parallel version of _reduce_readiness for very large forces."""
+        n = med.shape[0]
+        fails = np.zeros((n, 7), dtype=np.int32)
+        is_ready = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            fails[i, 0] = not (med[i] <= max_med)
+            fails[i, 1] = not (dental[i] <= max_dental)
+            fails[i, 2] = not (deployable[i] == 1)
+            fails[i, 3] = not (dwell[i] >= min_dwell)
+            for g in range(train_ok.shape[1]):
+                if not train_ok[i, g]:
+                    fails[i, 4] += 1
+            for e in range(equip_ok.shape[1]):
+                if not equip_ok[i, e]:
+                    fails[i, 5] += 1
+            fails[i, 6] = over_deployed[i]
+            ready = True
+            for k in range(7):
+                if fails[i, k] > 0:
+                    ready = False
+            is_ready[i] = ready
+        return fails, is_ready
+
+    return _reduce_readiness_numba
+
 
 class ReadinessValidator:
     """
@@ -70,24 +263,29 @@ class ReadinessValidator:
         soldier_row: pd.Series,
         soldier_ext: Optional[SoldierExtended],
         profile: ReadinessProfile,
-        as_of_date: Optional[date] = None
-    ) -> Tuple[bool, List[str], List[str]]:
+        as_of_date: Optional[date] = None,
+        fast_fail: bool = False
+    ) -> Tuple[bool, Optional[List[str]], Optional[List[str]]]:
         """
         Validate a soldier against a readiness profile.
 
         Args:
-            soldier_row: DataFrame row from EMD.soldiers
+            soldier_row: DataFrame row from EMD.soldiers (Series or dict)
             soldier_ext: Extended soldier data (if available)
             profile: ReadinessProfile to validate against
             as_of_date: Date to validate against (default: today)
+            fast_fail: Stop at the first failed requirement and return
+                (False, None, None); use when only is_ready is needed
 
         Returns:
             (is_ready, passes, failures)
             - is_ready: True if all requirements met
             - passes: List of requirements passed
             - failures: List of requirements failed with reasons
+            With fast_fail, passes/failures are None for soldiers that are not ready.
         """
         check_date = as_of_date or date.today()
+        profile = profile.compile()
         passes = []
         failures = []
 
@@ -95,23 +293,31 @@ class ReadinessValidator:
         if soldier_row["med_cat"] <= profile.max_med_cat:
             passes.append(f"Medical: C{soldier_row['med_cat']}")
         else:
+            if fast_fail:
+                return False, None, None
             failures.append(f"Medical: C{soldier_row['med_cat']} exceeds max C{profile.max_med_cat}")
 
         if soldier_row["dental_cat"] <= profile.max_dental_cat:
             passes.append(f"Dental: C{soldier_row['dental_cat']}")
         else:
+            if fast_fail:
+                return False, None, None
             failures.append(f"Dental: C{soldier_row['dental_cat']} exceeds max C{profile.max_dental_cat}")
 
         # Deployability
         if soldier_row["deployable"] == 1:
             passes.append("Deployable")
         else:
+            if fast_fail:
+                return False, None, None
             failures.append("Non-deployable status")
 
         # Dwell time
         if soldier_row["dwell_months"] >= profile.min_dwell_months:
             passes.append(f"Dwell: {soldier_row['dwell_months']} months")
         else:
+            if fast_fail:
+                return False, None, None
             failures.append(f"Dwell: {soldier_row['dwell_months']} months < {profile.min_dwell_months} required")
 
         # Extended validation (if available)
@@ -124,34 +330,124 @@ class ReadinessValidator:
                         passes.append(f"Training: {gate_name} current")
                     else:
                         days_expired = -gate.days_until_expiry(check_date)
+                        if fast_fail:
+                            return False, None, None
                         failures.append(f"Training: {gate_name} expired {days_expired} days ago")
                 else:
+                    if fast_fail:
+                        return False, None, None
                     failures.append(f"Training: {gate_name} not completed")
 
             # Equipment qualifications
-            required_equipment = getattr(profile, 'required_equipment', [])
-            for eq_type in required_equipment:
-                qualified = any(
-                    eq.equipment_type == eq_type and eq.is_valid(check_date)
-                    for eq in soldier_ext.equipment_quals
-                )
+            expiry_by_type = soldier_ext.equipment_expiry_by_type() if profile.required_equipment else {}
+            for eq_type in profile.required_equipment:
+                expiry = expiry_by_type.get(eq_type)
+                qualified = expiry is not None and check_date <= expiry
                 if qualified:
                     passes.append(f"Equipment: {eq_type} qualified")
                 else:
+                    if fast_fail:
+                        return False, None, None
                     failures.append(f"Equipment: {eq_type} not qualified or expired")
 
             # Deployment history
-            max_deployment_count = getattr(profile, 'max_deployment_count', None)
+            max_deployment_count = profile.max_deployment_count
             if max_deployment_count is not None:
                 dep_count = len(soldier_ext.deployment_history)
                 if dep_count <= max_deployment_count:
                     passes.append(f"Deployments: {dep_count}/{max_deployment_count}")
                 else:
+                    if fast_fail:
+                        return False, None, None
                     failures.append(f"Deployments: {dep_count} exceeds max {max_deployment_count}")
 
         is_ready = len(failures) == 0
         return is_ready, passes, failures
 
+    @staticmethod
+    def validate_soldiers_df(
+        soldiers_df: pd.DataFrame,
+        soldiers_ext: Dict[int, SoldierExtended],
+        profile: ReadinessProfile,
+        as_of_date: Optional[date] = None,
+        readiness_matrix: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """
+        Validate every soldier in a DataFrame against a readiness profile.
+
+        Same rules as validate_soldier, but the hard checks are evaluated as
+        column-wise NumPy comparisons over the whole frame.
+
+        Args:
+            readiness_matrix: Optional build_readiness_matrix(soldiers_ext, profile,
+                as_of_date) result; pass it when validating several slices of one roster
+
+        Returns:
+            DataFrame aligned to soldiers_df.index with columns:
+            - is_ready: True if all requirements met
+            - fail_medical, fail_dental, fail_deploy, fail_dwell: bool
+            - fail_training, fail_equipment: number of gates/equipment types failed
+            - fail_deployments: bool, deployment count exceeds profile maximum
+            - failure_count: total failures (len(failures) from validate_soldier)
+        """
+        check_date = as_of_date or date.today()
+        profile = profile.compile()
+        n = len(soldiers_df)
+
+        # Extended requirements gathered onto soldiers_df rows; soldiers
+        # without an extended record pass these checks
+        train_ok = np.ones((n, len(profile.required_training)), dtype=bool)
+        equip_ok = np.ones((n, len(profile.required_equipment)), dtype=bool)
+        over_deployed = np.zeros(n, dtype=bool)
+
+        if soldiers_ext:
+            matrix = readiness_matrix
+            if matrix is None:
+                matrix = build_readiness_matrix(soldiers_ext, profile, check_date)
+            rows = matrix.index.get_indexer(soldiers_df["soldier_id"].to_numpy())
+            has_ext = rows >= 0
+            rows = rows[has_ext]
+
+            train_cols = [f"train_{g}_current" for g in profile.required_training]
+            equip_cols = [f"equip_{e}_valid" for e in profile.required_equipment]
+            if train_cols:
+                train_ok[has_ext] = matrix[train_cols].to_numpy()[rows]
+            if equip_cols:
+                equip_ok[has_ext] = matrix[equip_cols].to_numpy()[rows]
+            if profile.max_deployment_count is not None:
+                over_deployed[has_ext] = (
+                    matrix["deployment_count"].to_numpy()[rows] > profile.max_deployment_count
+                )
+
+        med = soldiers_df["med_cat"].to_numpy()
+        dental = soldiers_df["dental_cat"].to_numpy()
+        deployable = soldiers_df["deployable"].to_numpy()
+        dwell = soldiers_df["dwell_months"].to_numpy()
+        limits = (profile.max_med_cat, profile.max_dental_cat, profile.min_dwell_months)
+
+        fails = None
+        if NUMBA_AVAILABLE and n >= NUMBA_MIN_SOLDIERS:
+            try:
+                fails, is_ready = _reduce_readiness_kernel()(
+                    med.astype(np.float64), dental.astype(np.float64),
+                    deployable.astype(np.float64), dwell.astype(np.float64),
+                    train_ok, equip_ok, over_deployed, *map(float, limits)
+                )
+            except (TypeError, ValueError):
+                fails = None  # Non-numeric columns; use the NumPy path
+        if fails is None:
+            fails, is_ready = _reduce_readiness(
+                med, dental, deployable, dwell, train_ok, equip_ok, over_deployed, *limits
+            )
+
+        checks = pd.DataFrame({
+            column: fails[:, k] if column in ("fail_training", "fail_equipment") else fails[:, k] > 0
+            for k, column in enumerate(FAILURE_CATEGORIES.values())
+        }, index=soldiers_df.index)
+        checks["failure_count"] = fails.sum(axis=1)
+        checks["is_ready"] = is_ready
+        return checks
+
     @staticmethod
     def calculate_readiness_score(
         soldier_row: pd.Series,
@@ -196,6 +492,69 @@ class ReadinessValidator:
 
         return min(score, 1.0)
 
+    @staticmethod
+    def calculate_readiness_scores(
+        soldiers_df: pd.DataFrame,
+        soldiers_ext: Dict[int, SoldierExtended],
+        profile: ReadinessProfile,
+        readiness_matrix: Optional[pd.DataFrame] = None
+    ) -> np.ndarray:
+        """
+        Calculate readiness scores for every soldier in a DataFrame.
+
+        Vectorized equivalent of calculate_readiness_score.
+
+        Args:
+            readiness_matrix: Optional prebuilt build_readiness_matrix(soldiers_ext, profile)
+
+        Returns:
+            float32 array of scores (0.0-1.0) aligned to soldiers_df rows
+        """
+        profile = profile.compile()
+        n = len(soldiers_df)
+        score = np.full(n, 0.5, dtype=np.float32)
+
+        # Extended record lookups (deployment history, training currency)
+        has_ext = np.zeros(n, dtype=bool)
+        deployment_count = np.zeros(n, dtype=np.int32)
+        all_current = np.zeros(n, dtype=bool)
+        if soldiers_ext:
+            matrix = readiness_matrix
+            if matrix is None:
+                matrix = build_readiness_matrix(soldiers_ext, profile)
+            rows = matrix.index.get_indexer(soldiers_df["soldier_id"].to_numpy())
+            has_ext = rows >= 0
+            deployment_count[has_ext] = matrix["deployment_count"].to_numpy()[rows[has_ext]]
+            all_current[has_ext] = matrix["gates_all_current"].to_numpy()[rows[has_ext]]
+
+        # Deployment experience
+        if profile.prefer_deployment_experience:
+            score += np.where(deployment_count > 0, 0.15, 0.0).astype(np.float32)
+
+        # ACFT score
+        if profile.prefer_high_acft:
+            acft = soldiers_df["acft_score"].to_numpy() if "acft_score" in soldiers_df else np.zeros(n)
+            score += np.select([acft >= 500, acft >= 450], [0.15, 0.10], 0.0).astype(np.float32)
+
+        # Marksmanship
+        if profile.prefer_marksmanship:
+            m4_score = soldiers_df["m4_score"].to_numpy() if "m4_score" in soldiers_df else np.zeros(n)
+            score += np.select([m4_score >= 38, m4_score >= 36], [0.15, 0.10], 0.0).astype(np.float32)
+
+        # Training currency (all gates current)
+        score += np.where(all_current, 0.05, 0.0).astype(np.float32)
+
+        return np.minimum(score, np.float32(1.0))
+
+
+def index_soldiers_by_uic(soldiers_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Map each uic to the positional row indices of its soldiers.
+
+    Built with a single groupby pass; slice a unit with soldiers_df.iloc[index[uic]].
+    """
+    return soldiers_df.groupby("uic", sort=False).indices
+
 
 class ReadinessAnalyzer:
     """
@@ -207,35 +566,39 @@ class ReadinessAnalyzer:
         unit: Unit,
         soldiers_df: pd.DataFrame,
         soldiers_ext: Dict[int, SoldierExtended],
-        profile: ReadinessProfile
+        profile: ReadinessProfile,
+        unit_index: Optional[Dict[str, np.ndarray]] = None,
+        readiness_matrix: Optional[pd.DataFrame] = None
     ) -> Dict:
         """
         Generate a readiness summary for a unit against a profile.
 
+        Args:
+            unit_index: Optional uic -> row positions map from index_soldiers_by_uic;
+                pass it when summarising many units of the same soldiers_df
+            readiness_matrix: Optional build_readiness_matrix(soldiers_ext, profile)
+                result, likewise shared across units
+
         Returns:
             Dict with readiness metrics (ready_count, ready_pct, failures_by_type, etc.)
         """
         # Filter soldiers in this unit
-        unit_soldiers = soldiers_df[soldiers_df["uic"] == unit.uic]
-
-        ready_count = 0
-        failure_counts = {}
-
-        for idx, soldier_row in unit_soldiers.iterrows():
-            soldier_id = soldier_row["soldier_id"]
-            soldier_ext = soldiers_ext.get(soldier_id)
+        if unit_index is not None:
+            unit_soldiers = soldiers_df.iloc[unit_index.get(unit.uic, [])]
+        else:
+            unit_soldiers = soldiers_df[soldiers_df["uic"] == unit.uic]
 
-            is_ready, passes, failures = ReadinessValidator.validate_soldier(
-                soldier_row, soldier_ext, profile
-            )
+        checks = ReadinessValidator.validate_soldiers_df(
+            unit_soldiers, soldiers_ext, profile, readiness_matrix=readiness_matrix
+        )
+        ready_count = int(checks["is_ready"].sum())
 
-            if is_ready:
-                ready_count += 1
-            else:
-                # Aggregate failure reasons
-                for failure in failures:
-                    category = failure.split(":")[0]  # e.g., "Medical", "Training"
-                    failure_counts[category] = failure_counts.get(category, 0) + 1
+        # Aggregate failure reasons per category (e.g., "Medical", "Training")
+        failure_counts = {}
+        for category, column in FAILURE_CATEGORIES.items():
+            count = int(checks[column].sum())
+            if count > 0:
+                failure_counts[category] = count
 
         total = len(unit_soldiers)
         ready_pct = ready_count / total if total > 0 else 0.0
@@ -264,15 +627,50 @@ class ReadinessAnalyzer:
         Returns:
             DataFrame with columns: uic, unit_name, total, ready_count, ready_pct, etc.
         """
-        summaries = []
-        for uic, unit in units.items():
-            summary = ReadinessAnalyzer.unit_readiness_summary(
-                unit, soldiers_df, soldiers_ext, profile
-            )
-            summaries.append(summary)
+        # Validate the whole force once, then roll up per unit with a groupby
+        checks = ReadinessValidator.validate_soldiers_df(soldiers_df, soldiers_ext, profile)
+        checks["uic"] = soldiers_df["uic"].to_numpy()
+        fail_columns = list(FAILURE_CATEGORIES.values())
+        grouped = checks.groupby("uic", sort=False).agg(
+            total_soldiers=("is_ready", "size"),
+            ready_count=("is_ready", "sum"),
+            **{column: (column, "sum") for column in fail_columns}
+        )
 
-        df = pd.DataFrame(summaries)
-        return df.sort_values("ready_pct", ascending=False)
+        n_units = len(units)
+        uics = np.empty(n_units, dtype=object)
+        unit_names = np.empty(n_units, dtype=object)
+        c_ratings = np.empty(n_units, dtype=object)
+        for i, unit in enumerate(units.values()):
+            uics[i] = unit.uic
+            unit_names[i] = unit.short_name
+            c_ratings[i] = unit.c_rating
+
+        counts = grouped.reindex(uics).fillna(0).to_numpy(dtype=np.int64)
+        total = counts[:, 0]
+        ready = counts[:, 1]
+        fail_counts = counts[:, 2:]
+
+        ready_pct = np.divide(ready, total, out=np.zeros(n_units), where=total > 0)
+        failure_counts = np.empty(n_units, dtype=object)
+        for i, row in enumerate(fail_counts):
+            failure_counts[i] = {
+                category: int(count)
+                for category, count in zip(FAILURE_CATEGORIES, row) if count > 0
+            }
+
+        # Order by readiness (highest first) before building the frame
+        order = np.argsort(-ready_pct, kind="stable")
+        return pd.DataFrame({
+            "uic": uics[order],
+            "unit_name": unit_names[order],
+            "total_soldiers": total[order],
+            "ready_count": ready[order],
+            "ready_pct": ready_pct[order],
+            "not_ready_count": (total - ready)[order],
+            "failure_counts": failure_counts[order],
+            "c_rating": c_ratings[order],
+        }, index=order)
 
     @staticmethod
     def identify_training_gaps(
@@ -286,26 +684,27 @@ class ReadinessAnalyzer:
         Returns:
             DataFrame with columns: training_gate, expired_count, not_completed_count
         """
-        gap_data = {gate: {"expired": 0, "not_completed": 0} for gate in profile.required_training}
+        matrix = build_readiness_matrix(soldiers_ext, profile)
 
-        for soldier_id, soldier_ext in soldiers_ext.items():
-            for gate_name in profile.required_training:
-                if gate_name not in soldier_ext.training_gates:
-                    gap_data[gate_name]["not_completed"] += 1
-                elif not soldier_ext.training_gates[gate_name].is_current():
-                    gap_data[gate_name]["expired"] += 1
+        gates = list(dict.fromkeys(profile.required_training))
+        expired = np.empty(len(gates), dtype=np.int64)
+        not_completed = np.empty(len(gates), dtype=np.int64)
+        for i, gate in enumerate(gates):
+            present = matrix[f"train_{gate}_present"].to_numpy()
+            current = matrix[f"train_{gate}_current"].to_numpy()
+            expired[i] = (present & ~current).sum()
+            not_completed[i] = (~present).sum()
 
-        rows = []
-        for gate, counts in gap_data.items():
-            rows.append({
-                "training_gate": gate,
-                "expired_count": counts["expired"],
-                "not_completed_count": counts["not_completed"],
-                "total_gaps": counts["expired"] + counts["not_completed"]
-            })
+        total_gaps = expired + not_completed
 
-        df = pd.DataFrame(rows)
-        return df.sort_values("total_gaps", ascending=False)
+        # Order by total gaps (largest first) before building the frame
+        order = np.argsort(-total_gaps, kind="stable")
+        return pd.DataFrame({
+            "training_gate": np.array(gates, dtype=object)[order],
+            "expired_count": expired[order],
+            "not_completed_count": not_completed[order],
+            "total_gaps": total_gaps[order],
+        }, index=order)
 
 
 # -------------------------
@@ -387,20 +786,11 @@ def filter_ready_soldiers(
     Returns:
         Filtered DataFrame with only ready soldiers
     """
-    ready_ids = []
-
-    for idx, soldier_row in soldiers_df.iterrows():
-        soldier_id = soldier_row["soldier_id"]
-        soldier_ext_rec = soldiers_ext.get(soldier_id)
-
-        is_ready, _, _ = ReadinessValidator.validate_soldier(
-            soldier_row, soldier_ext_rec, profile
-        )
-
-        if is_ready:
-            ready_ids.append(soldier_id)
+    ready_mask = ReadinessValidator.validate_soldiers_df(
+        soldiers_df, soldiers_ext, profile
+    )["is_ready"].to_numpy()
 
-    return soldiers_df[soldiers_df["soldier_id"].isin(ready_ids)].copy()
+    return soldiers_df[ready_mask].copy()
 
 
 def add_readiness_penalty(
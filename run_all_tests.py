@@ -12,12 +12,23 @@ Usage:
     python run_all_tests.py --report     # Generate detailed report
 """
 
+import os
+import re
 import sys
 import subprocess
+import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+# Markers counted by extract_test_stats
+STAT_MARKER_PATTERN = re.compile(r'\[(?:PASS|FAIL|WARNING)\]|Warning:')
+
+# Lines of each suite's output kept for verbose display and the report
+OUTPUT_TAIL_LINES = 2000
+
 # ANSI color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -55,58 +66,88 @@ def run_test_file(test_file, timeout=300):
     """
     Run a single test file and return results.
 
+    Output is streamed line by line: markers are counted as lines arrive and
+    only the last OUTPUT_TAIL_LINES lines are kept.
+
     Returns:
-        tuple: (passed, duration, output)
+        tuple: (passed, duration, output, stats)
     """
     start_time = time.time()
+    counts = Counter()
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    success_seen = False
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, test_file],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=timeout,
+            bufsize=1,
             cwd=Path(__file__).parent
         )
-
+    except Exception as e:
         duration = time.time() - start_time
+        return False, duration, f"Test failed with error: {e}", stats_from_counts(counts)
 
-        # Check if test passed by looking for SUCCESS in output
-        output = result.stdout + result.stderr
-        passed = (result.returncode == 0 and
-                 ("[SUCCESS]" in output or "All tests passed" in output))
+    timed_out = threading.Event()
 
-        return passed, duration, output
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
 
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
-        return False, duration, f"Test timed out after {timeout}s"
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            tail.append(line)
+            counts.update(m.group(0) for m in STAT_MARKER_PATTERN.finditer(line))
+            # Check if test passed by looking for SUCCESS in output
+            if "[SUCCESS]" in line or "All tests passed" in line:
+                success_seen = True
+        returncode = proc.wait()
     except Exception as e:
+        proc.kill()
         duration = time.time() - start_time
-        return False, duration, f"Test failed with error: {e}"
+        return False, duration, f"Test failed with error: {e}", stats_from_counts(counts)
+    finally:
+        timer.cancel()
+        proc.stdout.close()
 
-def extract_test_stats(output):
+    duration = time.time() - start_time
+    if timed_out.is_set():
+        return False, duration, f"Test timed out after {timeout}s", stats_from_counts(counts)
+
+    passed = returncode == 0 and success_seen
+    return passed, duration, "".join(tail), stats_from_counts(counts)
+
+def stats_from_counts(counts):
     """
-    Extract test statistics from output.
+    Build the test statistics dict from marker counts.
 
     Returns:
         dict with test counts
     """
     stats = {
         'total': 0,
-        'passed': 0,
-        'failed': 0,
-        'warnings': 0
+        'passed': counts['[PASS]'],
+        'failed': counts['[FAIL]'],
+        'warnings': counts['[WARNING]'] + counts['Warning:']
     }
-
-    # Count [PASS] and [FAIL] markers
-    stats['passed'] = output.count('[PASS]')
-    stats['failed'] = output.count('[FAIL]')
-    stats['warnings'] = output.count('[WARNING]') + output.count('Warning:')
     stats['total'] = stats['passed'] + stats['failed']
 
     return stats
 
+def extract_test_stats(output):
+    """
+    Extract test statistics from output.
+
+    Returns:
+        dict with test counts
+    """
+    # Count [PASS]/[FAIL]/warning markers in a single scan
+    return stats_from_counts(Counter(m.group(0) for m in STAT_MARKER_PATTERN.finditer(output)))
+
 def main():
     """Run all tests and generate report."""
     import argparse
@@ -182,8 +223,9 @@ def main():
 
     # Run all tests
     results = []
-    total_duration = 0
+    run_start = time.time()
 
+    runnable = []
     for test in tests_to_run:
         test_file = Path(__file__).parent / test['file']
 
@@ -199,36 +241,48 @@ def main():
             })
             continue
 
-        print_test_start(test['name'])
-
-        # Run test
-        passed, duration, output = run_test_file(str(test_file))
-        total_duration += duration
-
-        # Extract stats
-        stats = extract_test_stats(output)
-
-        # Print result
-        details = f"{stats['passed']} passed, {stats['failed']} failed"
-        if stats['warnings'] > 0:
-            details += f", {stats['warnings']} warnings"
-
-        print_test_result(test['name'], passed, duration, details)
-
-        # Show verbose output if requested
-        if args.verbose and not passed:
-            print(f"\n{Colors.WARNING}--- Test Output ---{Colors.ENDC}")
-            print(output[:2000])  # First 2000 chars
-            print(f"{Colors.WARNING}--- End Output ---{Colors.ENDC}\n")
-
-        # Store results
-        results.append({
-            **test,
-            'passed': passed,
-            'duration': duration,
-            'stats': stats,
-            'output': output
-        })
+        runnable.append((test, test_file))
+
+    # Suites are independent interpreters, so run them concurrently
+    if runnable:
+        max_workers = min(len(runnable), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for test, test_file in runnable:
+                print_test_start(test['name'])
+                futures[executor.submit(run_test_file, str(test_file))] = test
+
+            for future in as_completed(futures):
+                test = futures[future]
+                passed, duration, output, stats = future.result()
+
+                # Print result
+                details = f"{stats['passed']} passed, {stats['failed']} failed"
+                if stats['warnings'] > 0:
+                    details += f", {stats['warnings']} warnings"
+
+                print_test_result(test['name'], passed, duration, details)
+
+                # Show verbose output if requested
+                if args.verbose and not passed:
+                    print(f"\n{Colors.WARNING}--- Test Output ---{Colors.ENDC}")
+                    print(output[-2000:])  # Last 2000 chars (pytest summary and failures)
+                    print(f"{Colors.WARNING}--- End Output ---{Colors.ENDC}\n")
+
+                # Store results
+                results.append({
+                    **test,
+                    'passed': passed,
+                    'duration': duration,
+                    'stats': stats,
+                    'output': output
+                })
+
+    # Wall-clock time; suites overlap, so per-suite durations don't add up
+    total_duration = time.time() - run_start
+
+    # Keep the summary in phase order regardless of completion order
+    results.sort(key=lambda r: r['phase'])
 
     # Print summary
     print_header("TEST SUMMARY")
@@ -0,0 +1,156 @@
+"""
+scenario_costs.py
+-----------------
+
+Soldier x slot cost matrices for scenario vignettes.
+
+Builds the assignment cost matrix directly from a vignette's integer-coded
+demand rows (see scenarios.DEMAND_DTYPE) and weight vector. Kept separate
+from scenarios.py so the optional Numba kernel is only compiled by callers
+that actually build matrices.
+
+Functions:
+- build_scenario_cost_matrix: Cost of assigning each soldier to each demanded slot
+- readiness_filter: Eligibility screen for readiness_only vignettes (no matching)
+"""
+
+from __future__ import annotations
+import functools
+import importlib.util
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+from scenarios import ScenarioVignette, WEIGHT_IDX, encode_mos, encode_ranks
+from readiness_tracker import ReadinessProfile, StandardProfiles, filter_ready_soldiers
+from unit_types import SoldierExtended
+
+# Numba is imported (and its kernel compiled) only by the first matrix large enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+# Base costs (before optimization weights); MOS mismatch matches EMD's mos_mismatch_penalty
+MOS_MISMATCH_COST = 3000.0
+RANK_GAP_COST = 500.0      # per grade between soldier and slot rank
+PRIORITY_BONUS = 100.0     # divided by slot priority, so priority-1 slots attract fills first
+
+# Positions of the weights used here within ScenarioVignette.weight_vector
+_W_FILL = WEIGHT_IDX["fill"]
+_W_CROSS_LEV = WEIGHT_IDX["cross_lev"]
+
+# Matrices with at least this many cells use the Numba kernel when Numba is installed
+NUMBA_MIN_CELLS = 1_000_000
+
+
+def _build_cost(soldier_mos, soldier_rank, slot_mos, slot_rank, slot_prio, weights) -> np.ndarray:
+    """NumPy reference implementation of the cost matrix (see build_scenario_cost_matrix)."""
+    w_fill = weights[_W_FILL]
+    w_cross_lev = weights[_W_CROSS_LEV]
+
+    mismatch = soldier_mos[:, None] != slot_mos[None, :]
+    rank_gap = np.abs(soldier_rank.astype(np.int16)[:, None] - slot_rank.astype(np.int16)[None, :])
+    rank_gap[(soldier_rank == 0)[:, None] | (slot_rank == 0)[None, :]] = 0  # Unknown rank
+
+    cost = w_fill * (MOS_MISMATCH_COST * mismatch - PRIORITY_BONUS / slot_prio.astype(np.float32))
+    cost += w_cross_lev * RANK_GAP_COST * rank_gap
+    return cost.astype(np.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_cost_kernel():
+    """Compile (or load from Numba's cache) the parallel cost matrix kernel."""
+    from numba import njit, prange
+
+    @njit("float32[:, :](uint16[:], uint8[:], uint16[:], uint8[:], uint8[:], float32[:])",
+          parallel=True, cache=True)
+    def _build_cost_numba(soldier_mos, soldier_rank, slot_mos, slot_rank, slot_prio, weights):
+        """Parallel version of _build_cost for large soldier pools."""
+        n, m = soldier_mos.shape[0], slot_mos.shape[0]
+        w_fill = weights[_W_FILL]
+        w_cross_lev = weights[_W_CROSS_LEV]
+        cost = np.empty((n, m), dtype=np.float32)
+        for i in prange(n):
+            for j in range(m):
+                c = -w_fill * PRIORITY_BONUS / slot_prio[j]
+                if soldier_mos[i] != slot_mos[j]:
+                    c += w_fill * MOS_MISMATCH_COST
+                if soldier_rank[i] != 0 and slot_rank[j] != 0:
+                    c += w_cross_lev * RANK_GAP_COST * abs(np.int64(soldier_rank[i]) - np.int64(slot_rank[j]))
+                cost[i, j] = c
+        return cost
+
+    return _build_cost_numba
+
+
+def build_scenario_cost_matrix(soldier_mos, soldier_rank, vignette: ScenarioVignette) -> np.ndarray:
+    """
+    Cost of assigning each soldier to each demanded slot of a vignette.
+
+    Args:
+        soldier_mos: MOS strings (or uint16 codes from scenarios.encode_mos) per soldier
+        soldier_rank: Rank strings (or uint8 codes from scenarios.encode_ranks) per soldier
+        vignette: ScenarioVignette whose demand_rows define the slots (one per billet)
+
+    Raises:
+        ValueError: for readiness_only vignettes, which have no slots to match
+
+    Returns:
+        float32 array of shape (n_soldiers, n_slots); lower is better.
+        cost = w_fill * (MOS mismatch cost - priority bonus) + w_cross_lev * rank gap cost
+    """
+    if vignette.readiness_only:
+        raise ValueError(
+            f"Scenario '{vignette.id}' is readiness-only; screen the pool with readiness_filter() instead"
+        )
+
+    soldier_mos = np.asarray(soldier_mos)
+    soldier_rank = np.asarray(soldier_rank)
+    if soldier_mos.dtype != np.uint16:
+        soldier_mos = encode_mos(soldier_mos)
+    if soldier_rank.dtype != np.uint8:
+        soldier_rank = encode_ranks(soldier_rank)
+
+    # Field views of the (read-only) demand array are copied into contiguous arrays
+    demand = vignette.demand_rows
+    args = (
+        soldier_mos, soldier_rank,
+        np.array(demand["mos"]), np.array(demand["rank"]), np.array(demand["prio"]),
+        vignette.weight_vector,
+    )
+    if NUMBA_AVAILABLE and len(soldier_mos) * len(demand) >= NUMBA_MIN_CELLS:
+        return _build_cost_kernel()(*args)
+    return _build_cost(*args)
+
+
+def readiness_filter(
+    soldiers_df: pd.DataFrame,
+    vignette: ScenarioVignette,
+    soldiers_ext: Optional[Dict[int, SoldierExtended]] = None,
+    profile: Optional[ReadinessProfile] = None
+) -> pd.DataFrame:
+    """
+    Screen a soldier pool for a readiness_only vignette.
+
+    These scenarios (e.g. EDRE) need a deployable roster, not an assignment,
+    so the pool is reduced with the vectorized readiness checks and no cost
+    matrix is built.
+
+    Args:
+        soldiers_df: Soldier pool (EMD.soldiers layout)
+        vignette: Scenario being run
+        soldiers_ext: Extended soldier records, if available
+        profile: Readiness requirements (default: StandardProfiles.combat_deployment())
+
+    Raises:
+        ValueError: for vignettes that are not readiness_only (use build_scenario_cost_matrix)
+
+    Returns:
+        Soldiers in the pool meeting every readiness requirement
+    """
+    if not vignette.readiness_only:
+        raise ValueError(
+            f"Scenario '{vignette.id}' has slots to fill; build its cost matrix with build_scenario_cost_matrix()"
+        )
+    if profile is None:
+        profile = StandardProfiles.combat_deployment()
+    return filter_ready_soldiers(soldiers_df, soldiers_ext or {}, profile)
@@ -7,14 +7,236 @@ Each scenario includes CONOP, requirements, and optimization parameters.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Dict
+import functools
+import inspect
+import math
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, List, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
 from datetime import date, timedelta
 
+# NumPy is imported by the functions that build arrays, so importing this module
+# (e.g. to list scenarios) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+
+__all__ = (
+    # Data model and encodings
+    "ScenarioVignette", "CapabilitySpec", "CapabilityTable", "DEMAND_DTYPE",
+    "RANK_CODES", "WEIGHT_KEYS", "WEIGHT_IDX", "INVALID_MOS_CODE",
+    "mos_code", "encode_mos", "encode_ranks",
+    "PolicyPack", "FOCUS_TEXTS", "CUSTOM_FOCUS_ID", "focus_id", "focus_text",
+    # Vignettes (built lazily on first access)
+    "NTC_BRIGADE_ROTATION", "JRTC_SHORT_NOTICE", "EUCOM_POLAND", "INDOPACOM_GUAM",
+    "DIVISION_READY_BRIGADE", "POST_DEPLOYMENT_REFIT", "RIMPAC_EXERCISE", "SOF_SUPPORT",
+    "OPFOR_AUGMENTATION", "EMERGENCY_EDRE", "HURRICANE_DSCA", "SFAB_ADVISORS",
+    # Registry
+    "ALL_SCENARIOS", "SCENARIOS", "SCENARIOS_BY_CATEGORY", "BY_CATEGORY",
+    "get_scenario", "get_scenarios_by_category", "filter_scenarios",
+    "get_all_scenario_names", "load_scenario_to_session",
+)
+
+
+# Integer codes for capability categoricals, so matchers compare ints not strings
+RANK_CODES: Dict[str, int] = {f"E-{i}": i for i in range(1, 10)}
+RANK_CODES.update({f"W-{i}": 10 + i for i in range(1, 6)})
+RANK_CODES.update({f"O-{i}": 20 + i for i in range(1, 11)})
+
+# MOS codes pack the three characters in base 36 (digits 0-9, letters 10-35);
+# anything that is not a three-character alphanumeric MOS maps to INVALID_MOS_CODE
+INVALID_MOS_CODE = 0xFFFF
+
+
+@functools.lru_cache(maxsize=1024)
+def mos_code(mos: str) -> int:
+    """Encode an MOS such as "11B" or "68W" as a 16-bit integer (< 36**3)."""
+    if not isinstance(mos, str) or len(mos) != 3 or not mos.isalnum() or not mos.isascii():
+        return INVALID_MOS_CODE
+    return int(mos.upper(), 36)
+
+
+def encode_mos(values) -> np.ndarray:
+    """Encode a sequence/column of MOS strings as a uint16 array (see mos_code)."""
+    import numpy as np
+    return np.array([mos_code(v) for v in values], dtype=np.uint16)
+
+
+def encode_ranks(values) -> np.ndarray:
+    """Encode a sequence/column of rank strings as a uint8 array (see RANK_CODES)."""
+    import numpy as np
+    return np.array([RANK_CODES.get(v, 0) for v in values], dtype=np.uint8)
+
+# Fixed layout of ScenarioVignette.weight_vector
+WEIGHT_KEYS: Tuple[str, ...] = ("fill", "cost", "cohesion", "cross_lev")
+WEIGHT_IDX: Dict[str, int] = {key: i for i, key in enumerate(WEIGHT_KEYS)}
+
+
+# Optimization focus statements used by the built-in vignettes; ScenarioVignette.policy
+# refers to them by index. Focus text outside this list gets CUSTOM_FOCUS_ID and is
+# carried as text in PolicyPack.custom_focus.
+FOCUS_TEXTS: Tuple[str, ...] = (
+    "Unit cohesion - keep squads/platoons intact",
+    "Speed - fill positions rapidly with qualified personnel",
+    "Crew integrity - tank/Bradley crews must be certified together",
+    "Readiness - all personnel must be deployment-ready now",
+    "Balanced readiness - spread load fairly across division",
+    "Phased approach - critical fills now, others over time",
+    "Experience - select soldiers with deployment/multinational background",
+    "Qualification match - clearances and ASIs non-negotiable",
+    "Balance - spread OPFOR duty across division fairly",
+    "Speed and accuracy - instant readiness reporting",
+    "Humanitarian - speed and capability over cost",
+    "Quality over quantity - select absolute best advisors",
+)
+_FOCUS_IDX: Mapping[str, int] = MappingProxyType({text: i for i, text in enumerate(FOCUS_TEXTS)})
+CUSTOM_FOCUS_ID = -1
+
+
+def focus_id(text: str) -> int:
+    """Integer id of a built-in focus statement (see FOCUS_TEXTS), else CUSTOM_FOCUS_ID."""
+    return _FOCUS_IDX.get(text, CUSTOM_FOCUS_ID)
+
+
+def focus_text(focus: int) -> str:
+    """Built-in focus statement for an id returned by focus_id."""
+    if not 0 <= focus < len(FOCUS_TEXTS):
+        raise ValueError(f"No built-in focus statement with id {focus}")
+    return FOCUS_TEXTS[focus]
+
+
+class PolicyPack(NamedTuple):
+    """Success criteria of a vignette in compact numeric form."""
+    target_fill: float
+    max_cost: int
+    focus_id: int
+    custom_focus: Optional[str] = None  # Focus text when focus_id is CUSTOM_FOCUS_ID
+
+    @property
+    def focus(self) -> str:
+        """Focus statement, built-in or custom."""
+        if self.focus_id == CUSTOM_FOCUS_ID:
+            return self.custom_focus
+        return FOCUS_TEXTS[self.focus_id]
+
+
+def _weights(**weights: float) -> np.ndarray:
+    """Pack optimization weights into a float32 vector in WEIGHT_KEYS order."""
+    import numpy as np
+    return np.array([weights.get(key, 0.0) for key in WEIGHT_KEYS], dtype=np.float32)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class CapabilitySpec:
+    """Shape of a capability request, shared by every row that asks for it."""
+    name: str
+    mos: str
+    rank: str
+    team_size: int
+    priority: int
+
+
+@functools.lru_cache(maxsize=None)
+def _spec(name: str, mos: str, rank: str, team_size: int, priority: int) -> CapabilitySpec:
+    """Return the shared CapabilitySpec for this shape (one object per distinct shape)."""
+    return CapabilitySpec(name, mos, rank, team_size, priority)
+
+
+@dataclass(frozen=True)
+class CapabilityTable:
+    """
+    Column-wise (structure-of-arrays) form of a capabilities list.
+
+    Row i of every array describes capabilities[i]; specs are shared across
+    vignettes, so identical requests compare by identity. Indexing returns the
+    original dict form, so the table can stand in for read-only callers.
+    """
+    specs: Tuple[CapabilitySpec, ...]
+    mos_codes: np.ndarray   # uint16, see mos_code
+    rank_codes: np.ndarray  # uint8, see RANK_CODES (0 = unknown)
+    quantity: np.ndarray    # uint16
+    team_size: np.ndarray   # uint8
+    priority: np.ndarray    # uint8
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __getitem__(self, i: int) -> Dict:
+        spec = self.specs[i]
+        return {
+            "name": spec.name,
+            "mos": spec.mos,
+            "rank": spec.rank,
+            "quantity": int(self.quantity[i]),
+            "team_size": spec.team_size,
+            "priority": spec.priority,
+        }
+
+    def billets(self) -> np.ndarray:
+        """Billets per capability (quantity x team_size)."""
+        import numpy as np
+        return self.quantity.astype(np.int64) * self.team_size
+
+    def billet_mos_codes(self) -> np.ndarray:
+        """MOS code of every individual billet, i.e. the expanded demand vector."""
+        import numpy as np
+        return np.repeat(self.mos_codes, self.billets())
+
+
+def _compile_capabilities(rows: Sequence[Mapping]) -> CapabilityTable:
+    """Build a CapabilityTable from a list of capability dicts."""
+    import numpy as np
+    specs = tuple(
+        _spec(row["name"], row["mos"], row["rank"], row.get("team_size", 1), row.get("priority", 2))
+        for row in rows
+    )
+    return CapabilityTable(
+        specs=specs,
+        mos_codes=encode_mos([s.mos for s in specs]),
+        rank_codes=encode_ranks([s.rank for s in specs]),
+        quantity=np.array([row.get("quantity", 1) for row in rows], dtype=np.uint16),
+        team_size=np.array([s.team_size for s in specs], dtype=np.uint8),
+        priority=np.array([s.priority for s in specs], dtype=np.uint8),
+    )
+
+
+def _text(block: str) -> str:
+    """Dedent and strip a triple-quoted text block (first line unindented, rest indented)."""
+    return sys.intern(inspect.cleandoc(block))
+
+
+@functools.lru_cache(maxsize=None)
+def _demand_dtype() -> np.dtype:
+    """DEMAND_DTYPE: one row per demanded billet, capability codes plus the capability's row index."""
+    import numpy as np
+    return np.dtype([("mos", np.uint16), ("rank", np.uint8), ("prio", np.uint8), ("cap", np.uint16)])
+
+
+def _expand_demand(table: CapabilityTable) -> np.ndarray:
+    """Expand a CapabilityTable into DEMAND_DTYPE rows, quantity x team_size per capability."""
+    import numpy as np
+    counts = table.billets()
+    demand = np.empty(int(counts.sum()), dtype=_demand_dtype())
+    demand["mos"] = np.repeat(table.mos_codes, counts)
+    demand["rank"] = np.repeat(table.rank_codes, counts)
+    demand["prio"] = np.repeat(table.priority, counts)
+    demand["cap"] = np.repeat(np.arange(len(table), dtype=np.uint16), counts)
+    demand.flags.writeable = False  # Shared by every user of the vignette
+    return demand
+
+
+@dataclass(frozen=True, slots=True)
 class ScenarioVignette:
-    """A complete scenario vignette with CONOP and requirements."""
+    """
+    A complete scenario vignette with CONOP and requirements.
+
+    Vignettes are immutable and hashable (capabilities and weights are left out
+    of the hash), so they can be used as set members and dict keys. Capabilities
+    are stored as a tuple of read-only mappings and the weights as a read-only
+    mapping; callers that edit them (e.g. the dashboard) work on copies.
+    """
     id: str
     name: str
     category: str  # CTC, Deployment, Force Gen, Joint, Specialized
@@ -29,642 +251,786 @@ class ScenarioVignette:
 
     # Force requirements
     force_size: int
-    capabilities: List[Dict]
+    capabilities: Tuple[Mapping, ...] = field(hash=False)  # Any sequence of dicts; frozen in __post_init__
 
     # Optimization parameters
-    optimization_weights: Dict[str, float]
+    optimization_weights: Mapping[str, float] = field(hash=False)
 
     # Success criteria
     target_fill_rate: float
     max_cost: int
     priority_focus: str
 
+    # Pure eligibility screening (no slot matching), e.g. force-wide EDRE accountability
+    readiness_only: bool = False
+
+    # Column-wise copies of capabilities and weights, built on first access (see the properties)
+    _capability_table: Optional[CapabilityTable] = field(default=None, init=False, repr=False, compare=False)
+    _demand_rows: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _weight_vector: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _total_required: int = field(init=False, repr=False, compare=False)
+    _target_headcount: int = field(init=False, repr=False, compare=False)
+    policy: PolicyPack = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Short categorical strings are interned so category/location filters compare by identity
+        for name in ("id", "category", "location", "priority_focus"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        # CONOP text is written as indented triple-quoted blocks; store it dedented
+        for name in ("situation", "mission", "execution", "required_capabilities_summary"):
+            object.__setattr__(self, name, _text(getattr(self, name)))
+        # Frozen copies, so the derived tables below cannot drift from their source
+        object.__setattr__(
+            self, "capabilities", tuple(MappingProxyType(dict(row)) for row in self.capabilities)
+        )
+        object.__setattr__(self, "optimization_weights", MappingProxyType(dict(self.optimization_weights)))
+        object.__setattr__(self, "_total_required", sum(
+            row.get("quantity", 1) * row.get("team_size", 1) for row in self.capabilities
+        ))
+        # Rounded first so float noise (0.95 * 100 = 95.00000000000001) does not add a billet
+        target = math.ceil(round(self.target_fill_rate * self._total_required, 9))
+        object.__setattr__(self, "_target_headcount", target)
+        focus = focus_id(self.priority_focus)
+        object.__setattr__(
+            self, "policy",
+            PolicyPack(float(self.target_fill_rate), int(self.max_cost), focus,
+                       self.priority_focus if focus == CUSTOM_FOCUS_ID else None)
+        )
+
+    @property
+    def capability_table(self) -> CapabilityTable:
+        """Column-wise (CapabilityTable) form of capabilities."""
+        if self._capability_table is None:
+            object.__setattr__(self, "_capability_table", _compile_capabilities(self.capabilities))
+        return self._capability_table
+
+    @property
+    def demand_rows(self) -> np.ndarray:
+        """Read-only DEMAND_DTYPE array with one row per billet."""
+        if self._demand_rows is None:
+            object.__setattr__(self, "_demand_rows", _expand_demand(self.capability_table))
+        return self._demand_rows
+
+    @property
+    def weight_vector(self) -> np.ndarray:
+        """optimization_weights as a float32 vector in WEIGHT_KEYS order."""
+        if self._weight_vector is None:
+            object.__setattr__(self, "_weight_vector", _weights(**self.optimization_weights))
+        return self._weight_vector
+
+    @property
+    def total_required(self) -> int:
+        """Total billets requested (sum of quantity x team_size over capabilities)."""
+        return self._total_required
+
+    @property
+    def target_headcount(self) -> int:
+        """Billets that must be filled to meet target_fill_rate."""
+        return self._target_headcount
+
+
+# Vignettes are built on first use: each is a registered zero-argument builder
+_SCENARIO_BUILDERS: Dict[str, Callable[[], ScenarioVignette]] = {}
+
+# Module attribute name -> scenario id (e.g. "NTC_BRIGADE_ROTATION" -> "ntc_brigade")
+_NAME_TO_ID: Dict[str, str] = {}
+
+
+def _register(scenario_id: str, name: str):
+    """Register a vignette builder under its scenario id and module attribute name."""
+    def decorator(builder: Callable[[], ScenarioVignette]) -> Callable[[], ScenarioVignette]:
+        _SCENARIO_BUILDERS[scenario_id] = builder
+        _NAME_TO_ID[name] = scenario_id
+        return builder
+    return decorator
+
 
 # ============================================================================
 # COMBAT TRAINING CENTER SCENARIOS
 # ============================================================================
 
-NTC_BRIGADE_ROTATION = ScenarioVignette(
-    id="ntc_brigade",
-    name="NTC Brigade Rotation",
-    category="Combat Training Center",
-    duration_days=30,
-    location="Fort Irwin",
-
-    situation="""2-7 Infantry Brigade Combat Team is scheduled for NTC Rotation 25-06
-    in 45 days. Current brigade strength is 82% following 12-month CENTCOM deployment.
-    Need to field a task force of 3,500 soldiers for force-on-force operations against
-    the OPFOR. Priority: maximize training value with intact squads/platoons.""",
-
-    mission="""Build 3,500-soldier task force from available 2-7 IBCT and augment
-    from sister brigades to conduct 30-day NTC rotation focused on combined arms
-    maneuver, sustainment operations, and decisive action training.""",
-
-    execution="""Main Effort: 3x Infantry Battalions (maneuver elements). Supporting
-    Effort: 1x Field Artillery Battalion (indirect fire), 1x Engineer Company (mobility/
-    counter-mobility). Sustainment: Brigade Support Battalion provides medical, supply,
-    maintenance support throughout rotation.""",
-
-    required_capabilities_summary="""Infantry squads (E-6 leaders + E-4/E-3), armor
-    crews (19K), medics (68W), artillery crews (13B), engineers (12B), signal support
-    (25U), logistics specialists (92Y, 92F).""",
-
-    force_size=3500,
-    capabilities=[
-        {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 45, "team_size": 1, "priority": 1},
-        {"name": "Rifleman", "mos": "11B", "rank": "E-4", "quantity": 200, "team_size": 2, "priority": 1},
-        {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 12, "team_size": 1, "priority": 1},
-        {"name": "Tank Crew", "mos": "19K", "rank": "E-4", "quantity": 36, "team_size": 1, "priority": 1},
-        {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 40, "team_size": 1, "priority": 1},
-        {"name": "Artillery Section Chief", "mos": "13B", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
-        {"name": "Cannon Crewmember", "mos": "13B", "rank": "E-4", "quantity": 40, "team_size": 1, "priority": 2},
-        {"name": "Combat Engineer", "mos": "12B", "rank": "E-5", "quantity": 30, "team_size": 2, "priority": 2},
-        {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 25, "team_size": 2, "priority": 2},
-        {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 20, "team_size": 2, "priority": 3},
-    ],
-
-    optimization_weights={
-        "fill": 8.0,  # High - need all positions for realistic training
-        "cost": 3.0,  # Lower - training value more important than travel costs
-        "cohesion": 9.0,  # Critical - intact teams essential for collective training
-        "cross_lev": 4.0  # Moderate concern about unit disruption
-    },
-
-    target_fill_rate=0.95,
-    max_cost=250000,
-    priority_focus="Unit cohesion - keep squads/platoons intact"
-)
-
-
-JRTC_SHORT_NOTICE = ScenarioVignette(
-    id="jrtc_short_notice",
-    name="Short-Notice JRTC Fill",
-    category="Combat Training Center",
-    duration_days=21,
-    location="Fort Polk",
-
-    situation="""4-25 IBCT canceled their JRTC rotation due to emergency CENTCOM tasking.
-    Division has 45 days to field a battalion-sized element (800 soldiers) to fill the
-    training slot. Must source from non-deploying units across division. Time-critical.""",
-
-    mission="""Build composite battalion task force of 800 soldiers in 45 days to execute
-    21-day JRTC rotation, focusing on light infantry operations in complex terrain and
-    urban environments.""",
-
-    execution="""Task organize 3 light infantry companies (C 1-501, B 2-501, A 3-501),
-    augment with field artillery battery, engineer platoon, and forward support company.
-    Conduct 10-day train-up prior to JRTC deployment.""",
-
-    required_capabilities_summary="""Light infantry (11B), mortarmen (11C), scouts (19D),
-    medics (68W), field artillery (13F), engineers (12B), signal (25U), logistics (92Y).""",
-
-    force_size=800,
-    capabilities=[
-        {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 18, "team_size": 1, "priority": 1},
-        {"name": "Rifleman", "mos": "11B", "rank": "E-3", "quantity": 90, "team_size": 2, "priority": 1},
-        {"name": "Mortar Section Leader", "mos": "11C", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 1},
-        {"name": "Mortarman", "mos": "11C", "rank": "E-4", "quantity": 20, "team_size": 1, "priority": 1},
-        {"name": "Scout Team Leader", "mos": "19D", "rank": "E-6", "quantity": 6, "team_size": 1, "priority": 2},
-        {"name": "Cavalry Scout", "mos": "19D", "rank": "E-4", "quantity": 18, "team_size": 1, "priority": 2},
-        {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 16, "team_size": 1, "priority": 1},
-        {"name": "Fire Support Specialist", "mos": "13F", "rank": "E-5", "quantity": 8, "team_size": 1, "priority": 2},
-        {"name": "Combat Engineer", "mos": "12B", "rank": "E-5", "quantity": 12, "team_size": 2, "priority": 2},
-        {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 10, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 9.0,  # Critical - slot must be filled
-        "cost": 5.0,  # Moderate - short notice means higher costs acceptable
-        "cohesion": 7.0,  # Important but time-constrained
-        "cross_lev": 2.0  # Low priority given time constraint
-    },
-
-    target_fill_rate=0.98,
-    max_cost=180000,
-    priority_focus="Speed - fill positions rapidly with qualified personnel"
-)
+@_register("ntc_brigade", "NTC_BRIGADE_ROTATION")
+def _build_ntc_brigade() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="ntc_brigade",
+        name="NTC Brigade Rotation",
+        category="Combat Training Center",
+        duration_days=30,
+        location="Fort Irwin",
+
+        situation="""2-7 Infantry Brigade Combat Team is scheduled for NTC Rotation 25-06
+        in 45 days. Current brigade strength is 82% following 12-month CENTCOM deployment.
+        Need to field a task force of 3,500 soldiers for force-on-force operations against
+        the OPFOR. Priority: maximize training value with intact squads/platoons.""",
+
+        mission="""Build 3,500-soldier task force from available 2-7 IBCT and augment
+        from sister brigades to conduct 30-day NTC rotation focused on combined arms
+        maneuver, sustainment operations, and decisive action training.""",
+
+        execution="""Main Effort: 3x Infantry Battalions (maneuver elements). Supporting
+        Effort: 1x Field Artillery Battalion (indirect fire), 1x Engineer Company (mobility/
+        counter-mobility). Sustainment: Brigade Support Battalion provides medical, supply,
+        maintenance support throughout rotation.""",
+
+        required_capabilities_summary="""Infantry squads (E-6 leaders + E-4/E-3), armor
+        crews (19K), medics (68W), artillery crews (13B), engineers (12B), signal support
+        (25U), logistics specialists (92Y, 92F).""",
+
+        force_size=3500,
+        capabilities=[
+            {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 45, "team_size": 1, "priority": 1},
+            {"name": "Rifleman", "mos": "11B", "rank": "E-4", "quantity": 200, "team_size": 2, "priority": 1},
+            {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 12, "team_size": 1, "priority": 1},
+            {"name": "Tank Crew", "mos": "19K", "rank": "E-4", "quantity": 36, "team_size": 1, "priority": 1},
+            {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 40, "team_size": 1, "priority": 1},
+            {"name": "Artillery Section Chief", "mos": "13B", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
+            {"name": "Cannon Crewmember", "mos": "13B", "rank": "E-4", "quantity": 40, "team_size": 1, "priority": 2},
+            {"name": "Combat Engineer", "mos": "12B", "rank": "E-5", "quantity": 30, "team_size": 2, "priority": 2},
+            {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 25, "team_size": 2, "priority": 2},
+            {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 20, "team_size": 2, "priority": 3},
+        ],
+
+        optimization_weights={
+            "fill": 8.0,  # High - need all positions for realistic training
+            "cost": 3.0,  # Lower - training value more important than travel costs
+            "cohesion": 9.0,  # Critical - intact teams essential for collective training
+            "cross_lev": 4.0  # Moderate concern about unit disruption
+        },
+
+        target_fill_rate=0.95,
+        max_cost=250000,
+        priority_focus="Unit cohesion - keep squads/platoons intact"
+    )
+
+
+@_register("jrtc_short_notice", "JRTC_SHORT_NOTICE")
+def _build_jrtc_short_notice() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="jrtc_short_notice",
+        name="Short-Notice JRTC Fill",
+        category="Combat Training Center",
+        duration_days=21,
+        location="Fort Polk",
+
+        situation="""4-25 IBCT canceled their JRTC rotation due to emergency CENTCOM tasking.
+        Division has 45 days to field a battalion-sized element (800 soldiers) to fill the
+        training slot. Must source from non-deploying units across division. Time-critical.""",
+
+        mission="""Build composite battalion task force of 800 soldiers in 45 days to execute
+        21-day JRTC rotation, focusing on light infantry operations in complex terrain and
+        urban environments.""",
+
+        execution="""Task organize 3 light infantry companies (C 1-501, B 2-501, A 3-501),
+        augment with field artillery battery, engineer platoon, and forward support company.
+        Conduct 10-day train-up prior to JRTC deployment.""",
+
+        required_capabilities_summary="""Light infantry (11B), mortarmen (11C), scouts (19D),
+        medics (68W), field artillery (13F), engineers (12B), signal (25U), logistics (92Y).""",
+
+        force_size=800,
+        capabilities=[
+            {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 18, "team_size": 1, "priority": 1},
+            {"name": "Rifleman", "mos": "11B", "rank": "E-3", "quantity": 90, "team_size": 2, "priority": 1},
+            {"name": "Mortar Section Leader", "mos": "11C", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 1},
+            {"name": "Mortarman", "mos": "11C", "rank": "E-4", "quantity": 20, "team_size": 1, "priority": 1},
+            {"name": "Scout Team Leader", "mos": "19D", "rank": "E-6", "quantity": 6, "team_size": 1, "priority": 2},
+            {"name": "Cavalry Scout", "mos": "19D", "rank": "E-4", "quantity": 18, "team_size": 1, "priority": 2},
+            {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 16, "team_size": 1, "priority": 1},
+            {"name": "Fire Support Specialist", "mos": "13F", "rank": "E-5", "quantity": 8, "team_size": 1, "priority": 2},
+            {"name": "Combat Engineer", "mos": "12B", "rank": "E-5", "quantity": 12, "team_size": 2, "priority": 2},
+            {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 10, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 9.0,  # Critical - slot must be filled
+            "cost": 5.0,  # Moderate - short notice means higher costs acceptable
+            "cohesion": 7.0,  # Important but time-constrained
+            "cross_lev": 2.0  # Low priority given time constraint
+        },
+
+        target_fill_rate=0.98,
+        max_cost=180000,
+        priority_focus="Speed - fill positions rapidly with qualified personnel"
+    )
 
 
 # ============================================================================
 # OPERATIONAL DEPLOYMENT SCENARIOS
 # ============================================================================
 
-EUCOM_POLAND = ScenarioVignette(
-    id="eucom_poland",
-    name="EUCOM Poland Rotation",
-    category="Operational Deployment",
-    duration_days=270,
-    location="Poland",
-
-    situation="""EUCOM requests armored company team for 9-month Enhanced Forward Presence
-    rotation in Poland. Mission supports NATO deterrence operations. Must source from
-    CONUS ABCTs with certified tank crews and support elements. High-visibility mission.""",
-
-    mission="""Deploy company team of 180 soldiers to Poznan, Poland for 9-month EFP
-    rotation conducting combined training with Polish Land Forces and maintaining
-    credible combat power as part of NATO's eastern flank deterrence.""",
-
-    execution="""Main Effort: Armored company (14x M1A2 Abrams tanks). Supporting Effort:
-    Mechanized infantry platoon (4x Bradley), engineer squad, forward support team. Coordinate
-    with 173rd Airborne as higher HQ. Emphasis on interoperability and readiness.""",
-
-    required_capabilities_summary="""Tank commanders/crew (19K), Bradley crew (11B/19K),
-    mechanics (91A, 91M), supply (92Y), medics (68W). All must meet OCONUS deployment criteria.""",
-
-    force_size=180,
-    capabilities=[
-        {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 14, "team_size": 1, "priority": 1},
-        {"name": "Tank Gunner", "mos": "19K", "rank": "E-5", "quantity": 14, "team_size": 1, "priority": 1},
-        {"name": "Tank Driver/Loader", "mos": "19K", "rank": "E-4", "quantity": 28, "team_size": 1, "priority": 1},
-        {"name": "Bradley Commander", "mos": "11B", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 1},
-        {"name": "Bradley Gunner", "mos": "19K", "rank": "E-5", "quantity": 4, "team_size": 1, "priority": 1},
-        {"name": "Bradley Infantry", "mos": "11B", "rank": "E-4", "quantity": 24, "team_size": 1, "priority": 1},
-        {"name": "Tank Mechanic", "mos": "91A", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 1},
-        {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 6, "team_size": 1, "priority": 1},
-        {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 4, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 10.0,  # Maximum - cannot deploy with gaps
-        "cost": 7.0,  # High - OCONUS travel expensive
-        "cohesion": 10.0,  # Maximum - tank crews must train together
-        "cross_lev": 6.0  # Significant concern for unit readiness back home
-    },
-
-    target_fill_rate=1.0,
-    max_cost=400000,
-    priority_focus="Crew integrity - tank/Bradley crews must be certified together"
-)
-
-
-INDOPACOM_GUAM = ScenarioVignette(
-    id="indopacom_guam",
-    name="INDOPACOM Crisis Response",
-    category="Operational Deployment",
-    duration_days=180,
-    location="Guam",
-
-    situation="""INDOPACOM requires rapid deployment of airborne company to Guam within
-    72 hours for exercise turned real-world contingency. 180 soldiers needed. All must be
-    airborne-qualified with current jump status. Pacific theater experience preferred.""",
-
-    mission="""Deploy airborne rifle company of 180 soldiers to Andersen AFB, Guam within
-    72 hours to support Pacific Air Forces and conduct security operations in support of
-    INDOPACOM OPLAN 5077.""",
-
-    execution="""Rapid alert sequence: 6hr - personnel recall, 24hr - equipment prep,
-    48hr - manifest/load, 72hr - wheels up. Main Effort: 3x rifle platoons. Supporting:
-    weapons platoon, HQ element. Conduct in-flight rigging for potential JFEO.""",
-
-    required_capabilities_summary="""Airborne infantry (11B), jumpmaster (additional skill),
-    medics (68W), signal (25U), supply (92Y). All must have current jump status and be
-    medically deployable.""",
-
-    force_size=180,
-    capabilities=[
-        {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 9, "team_size": 1, "priority": 1},
-        {"name": "Airborne Rifleman", "mos": "11B", "rank": "E-4", "quantity": 54, "team_size": 2, "priority": 1},
-        {"name": "Jumpmaster", "mos": "11B", "rank": "E-7", "quantity": 6, "team_size": 1, "priority": 1},
-        {"name": "Weapons Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 1},
-        {"name": "Machine Gunner", "mos": "11B", "rank": "E-4", "quantity": 12, "team_size": 1, "priority": 1},
-        {"name": "Airborne Medic", "mos": "68W", "rank": "E-5", "quantity": 8, "team_size": 1, "priority": 1},
-        {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 6, "team_size": 1, "priority": 2},
-        {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 4, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 10.0,  # Maximum - rapid deployment critical
-        "cost": 9.0,  # Very high - Pacific travel very expensive
-        "cohesion": 10.0,  # Maximum - airborne operations demand team integrity
-        "cross_lev": 7.0  # High concern - specialized airborne skillset
-    },
-
-    target_fill_rate=1.0,
-    max_cost=500000,
-    priority_focus="Readiness - all personnel must be deployment-ready now"
-)
+@_register("eucom_poland", "EUCOM_POLAND")
+def _build_eucom_poland() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="eucom_poland",
+        name="EUCOM Poland Rotation",
+        category="Operational Deployment",
+        duration_days=270,
+        location="Poland",
+
+        situation="""EUCOM requests armored company team for 9-month Enhanced Forward Presence
+        rotation in Poland. Mission supports NATO deterrence operations. Must source from
+        CONUS ABCTs with certified tank crews and support elements. High-visibility mission.""",
+
+        mission="""Deploy company team of 180 soldiers to Poznan, Poland for 9-month EFP
+        rotation conducting combined training with Polish Land Forces and maintaining
+        credible combat power as part of NATO's eastern flank deterrence.""",
+
+        execution="""Main Effort: Armored company (14x M1A2 Abrams tanks). Supporting Effort:
+        Mechanized infantry platoon (4x Bradley), engineer squad, forward support team. Coordinate
+        with 173rd Airborne as higher HQ. Emphasis on interoperability and readiness.""",
+
+        required_capabilities_summary="""Tank commanders/crew (19K), Bradley crew (11B/19K),
+        mechanics (91A, 91M), supply (92Y), medics (68W). All must meet OCONUS deployment criteria.""",
+
+        force_size=180,
+        capabilities=[
+            {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 14, "team_size": 1, "priority": 1},
+            {"name": "Tank Gunner", "mos": "19K", "rank": "E-5", "quantity": 14, "team_size": 1, "priority": 1},
+            {"name": "Tank Driver/Loader", "mos": "19K", "rank": "E-4", "quantity": 28, "team_size": 1, "priority": 1},
+            {"name": "Bradley Commander", "mos": "11B", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 1},
+            {"name": "Bradley Gunner", "mos": "19K", "rank": "E-5", "quantity": 4, "team_size": 1, "priority": 1},
+            {"name": "Bradley Infantry", "mos": "11B", "rank": "E-4", "quantity": 24, "team_size": 1, "priority": 1},
+            {"name": "Tank Mechanic", "mos": "91A", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 1},
+            {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 6, "team_size": 1, "priority": 1},
+            {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 4, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 10.0,  # Maximum - cannot deploy with gaps
+            "cost": 7.0,  # High - OCONUS travel expensive
+            "cohesion": 10.0,  # Maximum - tank crews must train together
+            "cross_lev": 6.0  # Significant concern for unit readiness back home
+        },
+
+        target_fill_rate=1.0,
+        max_cost=400000,
+        priority_focus="Crew integrity - tank/Bradley crews must be certified together"
+    )
+
+
+@_register("indopacom_guam", "INDOPACOM_GUAM")
+def _build_indopacom_guam() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="indopacom_guam",
+        name="INDOPACOM Crisis Response",
+        category="Operational Deployment",
+        duration_days=180,
+        location="Guam",
+
+        situation="""INDOPACOM requires rapid deployment of airborne company to Guam within
+        72 hours for exercise turned real-world contingency. 180 soldiers needed. All must be
+        airborne-qualified with current jump status. Pacific theater experience preferred.""",
+
+        mission="""Deploy airborne rifle company of 180 soldiers to Andersen AFB, Guam within
+        72 hours to support Pacific Air Forces and conduct security operations in support of
+        INDOPACOM OPLAN 5077.""",
+
+        execution="""Rapid alert sequence: 6hr - personnel recall, 24hr - equipment prep,
+        48hr - manifest/load, 72hr - wheels up. Main Effort: 3x rifle platoons. Supporting:
+        weapons platoon, HQ element. Conduct in-flight rigging for potential JFEO.""",
+
+        required_capabilities_summary="""Airborne infantry (11B), jumpmaster (additional skill),
+        medics (68W), signal (25U), supply (92Y). All must have current jump status and be
+        medically deployable.""",
+
+        force_size=180,
+        capabilities=[
+            {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 9, "team_size": 1, "priority": 1},
+            {"name": "Airborne Rifleman", "mos": "11B", "rank": "E-4", "quantity": 54, "team_size": 2, "priority": 1},
+            {"name": "Jumpmaster", "mos": "11B", "rank": "E-7", "quantity": 6, "team_size": 1, "priority": 1},
+            {"name": "Weapons Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 1},
+            {"name": "Machine Gunner", "mos": "11B", "rank": "E-4", "quantity": 12, "team_size": 1, "priority": 1},
+            {"name": "Airborne Medic", "mos": "68W", "rank": "E-5", "quantity": 8, "team_size": 1, "priority": 1},
+            {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 6, "team_size": 1, "priority": 2},
+            {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 4, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 10.0,  # Maximum - rapid deployment critical
+            "cost": 9.0,  # Very high - Pacific travel very expensive
+            "cohesion": 10.0,  # Maximum - airborne operations demand team integrity
+            "cross_lev": 7.0  # High concern - specialized airborne skillset
+        },
+
+        target_fill_rate=1.0,
+        max_cost=500000,
+        priority_focus="Readiness - all personnel must be deployment-ready now"
+    )
 
 
 # ============================================================================
 # FORCE GENERATION & READINESS SCENARIOS
 # ============================================================================
 
-DIVISION_READY_BRIGADE = ScenarioVignette(
-    id="drb_rotation",
-    name="Division Ready Brigade",
-    category="Force Generation",
-    duration_days=90,
-    location="JBLM",
-
-    situation="""Division maintains one brigade on 96-hour recall for contingency operations.
-    Quarterly rotation cycle. Current ready brigade at end of cycle, next brigade at 73%
-    strength. Need to build to 90% within 30 days for assumption of DRB mission.""",
-
-    mission="""Build 1-2 SBCT to 90% strength (3,200 soldiers) within 30 days and maintain
-    DRB readiness posture for 90-day cycle. All soldiers must meet deployment medical/
-    training requirements.""",
-
-    execution="""Cross-level from sister brigades (2-2, 3-2), receive inbound PCS soldiers,
-    integrate new arrivals from OSUT/AIT. Priority: fill infantry, armor, medical, signal.
-    Conduct validation exercise at 30-day mark.""",
-
-    required_capabilities_summary="""Full brigade slice: infantry, armor, artillery,
-    engineers, signal, intelligence, medical, logistics. Emphasis on combat arms fill.""",
-
-    force_size=3200,
-    capabilities=[
-        {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 48, "team_size": 1, "priority": 1},
-        {"name": "Rifleman", "mos": "11B", "rank": "E-4", "quantity": 240, "team_size": 2, "priority": 1},
-        {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 18, "team_size": 1, "priority": 1},
-        {"name": "Tank Crew", "mos": "19K", "rank": "E-4", "quantity": 54, "team_size": 1, "priority": 1},
-        {"name": "Artillery Section Chief", "mos": "13B", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 1},
-        {"name": "Cannon Crewmember", "mos": "13B", "rank": "E-4", "quantity": 60, "team_size": 1, "priority": 1},
-        {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 48, "team_size": 1, "priority": 1},
-        {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 36, "team_size": 2, "priority": 2},
-        {"name": "Intelligence Analyst", "mos": "35F", "rank": "E-5", "quantity": 24, "team_size": 1, "priority": 2},
-        {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 30, "team_size": 2, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 9.0,  # Very high - readiness requirement
-        "cost": 2.0,  # Low - garrison cross-leveling minimal cost
-        "cohesion": 6.0,  # Important but balanced with fill requirement
-        "cross_lev": 5.0  # Moderate - must balance across division
-    },
-
-    target_fill_rate=0.90,
-    max_cost=50000,
-    priority_focus="Balanced readiness - spread load fairly across division"
-)
-
-
-POST_DEPLOYMENT_REFIT = ScenarioVignette(
-    id="post_deployment",
-    name="Post-Deployment Reconstitution",
-    category="Force Generation",
-    duration_days=180,
-    location="Fort Hood",
-
-    situation="""1-9 Cavalry returns from 12-month Iraq deployment at 73% strength due to
-    combat losses, medical evacuations, and ETS. Must rebuild to 90% in 6 months to meet
-    next deployment window. Balance cross-leveling vs. waiting for new accessions.""",
-
-    mission="""Reconstitute 1-9 Cavalry to 90% authorized strength (1,800 soldiers) within
-    180 days through combination of cross-leveling, PCS arrivals, and new accessions.
-    Prioritize critical combat MOSs.""",
-
-    execution="""Phase 1 (Days 1-60): Immediate cross-level for critical shortages (19K,
-    68W, 91A). Phase 2 (Days 61-120): Integrate PCS arrivals, begin new soldier training.
-    Phase 3 (Days 121-180): Final fills, validate training gates, certify ready.""",
-
-    required_capabilities_summary="""Cavalry scouts (19D), tank crews (19K), mechanics
-    (91A, 91M), medics (68W), signal (25U). Priority on experienced NCOs.""",
-
-    force_size=1800,
-    capabilities=[
-        {"name": "Cavalry Scout Leader", "mos": "19D", "rank": "E-6", "quantity": 24, "team_size": 1, "priority": 1},
-        {"name": "Cavalry Scout", "mos": "19D", "rank": "E-4", "quantity": 96, "team_size": 1, "priority": 1},
-        {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 16, "team_size": 1, "priority": 1},
-        {"name": "Tank Crew", "mos": "19K", "rank": "E-4", "quantity": 48, "team_size": 1, "priority": 1},
-        {"name": "Tank Mechanic", "mos": "91A", "rank": "E-6", "quantity": 20, "team_size": 1, "priority": 1},
-        {"name": "Bradley Mechanic", "mos": "91M", "rank": "E-5", "quantity": 16, "team_size": 1, "priority": 1},
-        {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 28, "team_size": 1, "priority": 1},
-        {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 20, "team_size": 1, "priority": 2},
-        {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 16, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 8.0,  # High but not maximum - have time
-        "cost": 3.0,  # Low - mostly garrison sourcing
-        "cohesion": 4.0,  # Lower - building new teams anyway
-        "cross_lev": 6.0  # Higher - minimize impact on donor units
-    },
-
-    target_fill_rate=0.90,
-    max_cost=80000,
-    priority_focus="Phased approach - critical fills now, others over time"
-)
+@_register("drb_rotation", "DIVISION_READY_BRIGADE")
+def _build_drb_rotation() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="drb_rotation",
+        name="Division Ready Brigade",
+        category="Force Generation",
+        duration_days=90,
+        location="JBLM",
+
+        situation="""Division maintains one brigade on 96-hour recall for contingency operations.
+        Quarterly rotation cycle. Current ready brigade at end of cycle, next brigade at 73%
+        strength. Need to build to 90% within 30 days for assumption of DRB mission.""",
+
+        mission="""Build 1-2 SBCT to 90% strength (3,200 soldiers) within 30 days and maintain
+        DRB readiness posture for 90-day cycle. All soldiers must meet deployment medical/
+        training requirements.""",
+
+        execution="""Cross-level from sister brigades (2-2, 3-2), receive inbound PCS soldiers,
+        integrate new arrivals from OSUT/AIT. Priority: fill infantry, armor, medical, signal.
+        Conduct validation exercise at 30-day mark.""",
+
+        required_capabilities_summary="""Full brigade slice: infantry, armor, artillery,
+        engineers, signal, intelligence, medical, logistics. Emphasis on combat arms fill.""",
+
+        force_size=3200,
+        capabilities=[
+            {"name": "Infantry Squad Leader", "mos": "11B", "rank": "E-6", "quantity": 48, "team_size": 1, "priority": 1},
+            {"name": "Rifleman", "mos": "11B", "rank": "E-4", "quantity": 240, "team_size": 2, "priority": 1},
+            {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 18, "team_size": 1, "priority": 1},
+            {"name": "Tank Crew", "mos": "19K", "rank": "E-4", "quantity": 54, "team_size": 1, "priority": 1},
+            {"name": "Artillery Section Chief", "mos": "13B", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 1},
+            {"name": "Cannon Crewmember", "mos": "13B", "rank": "E-4", "quantity": 60, "team_size": 1, "priority": 1},
+            {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 48, "team_size": 1, "priority": 1},
+            {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 36, "team_size": 2, "priority": 2},
+            {"name": "Intelligence Analyst", "mos": "35F", "rank": "E-5", "quantity": 24, "team_size": 1, "priority": 2},
+            {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 30, "team_size": 2, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 9.0,  # Very high - readiness requirement
+            "cost": 2.0,  # Low - garrison cross-leveling minimal cost
+            "cohesion": 6.0,  # Important but balanced with fill requirement
+            "cross_lev": 5.0  # Moderate - must balance across division
+        },
+
+        target_fill_rate=0.90,
+        max_cost=50000,
+        priority_focus="Balanced readiness - spread load fairly across division"
+    )
+
+
+@_register("post_deployment", "POST_DEPLOYMENT_REFIT")
+def _build_post_deployment() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="post_deployment",
+        name="Post-Deployment Reconstitution",
+        category="Force Generation",
+        duration_days=180,
+        location="Fort Hood",
+
+        situation="""1-9 Cavalry returns from 12-month Iraq deployment at 73% strength due to
+        combat losses, medical evacuations, and ETS. Must rebuild to 90% in 6 months to meet
+        next deployment window. Balance cross-leveling vs. waiting for new accessions.""",
+
+        mission="""Reconstitute 1-9 Cavalry to 90% authorized strength (1,800 soldiers) within
+        180 days through combination of cross-leveling, PCS arrivals, and new accessions.
+        Prioritize critical combat MOSs.""",
+
+        execution="""Phase 1 (Days 1-60): Immediate cross-level for critical shortages (19K,
+        68W, 91A). Phase 2 (Days 61-120): Integrate PCS arrivals, begin new soldier training.
+        Phase 3 (Days 121-180): Final fills, validate training gates, certify ready.""",
+
+        required_capabilities_summary="""Cavalry scouts (19D), tank crews (19K), mechanics
+        (91A, 91M), medics (68W), signal (25U). Priority on experienced NCOs.""",
+
+        force_size=1800,
+        capabilities=[
+            {"name": "Cavalry Scout Leader", "mos": "19D", "rank": "E-6", "quantity": 24, "team_size": 1, "priority": 1},
+            {"name": "Cavalry Scout", "mos": "19D", "rank": "E-4", "quantity": 96, "team_size": 1, "priority": 1},
+            {"name": "Tank Commander", "mos": "19K", "rank": "E-7", "quantity": 16, "team_size": 1, "priority": 1},
+            {"name": "Tank Crew", "mos": "19K", "rank": "E-4", "quantity": 48, "team_size": 1, "priority": 1},
+            {"name": "Tank Mechanic", "mos": "91A", "rank": "E-6", "quantity": 20, "team_size": 1, "priority": 1},
+            {"name": "Bradley Mechanic", "mos": "91M", "rank": "E-5", "quantity": 16, "team_size": 1, "priority": 1},
+            {"name": "Combat Medic", "mos": "68W", "rank": "E-5", "quantity": 28, "team_size": 1, "priority": 1},
+            {"name": "Signal Support", "mos": "25U", "rank": "E-5", "quantity": 20, "team_size": 1, "priority": 2},
+            {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 16, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 8.0,  # High but not maximum - have time
+            "cost": 3.0,  # Low - mostly garrison sourcing
+            "cohesion": 4.0,  # Lower - building new teams anyway
+            "cross_lev": 6.0  # Higher - minimize impact on donor units
+        },
+
+        target_fill_rate=0.90,
+        max_cost=80000,
+        priority_focus="Phased approach - critical fills now, others over time"
+    )
 
 
 # Continued in next part due to length...
 # I'll create the remaining 6 scenarios next
 
-RIMPAC_EXERCISE = ScenarioVignette(
-    id="rimpac",
-    name="RIMPAC Exercise Liaison",
-    category="Joint Operations",
-    duration_days=45,
-    location="Hawaii",
-
-    situation="""U.S. Army contributes 120-soldier liaison and training element to
-    RIMPAC 2025 (Rim of the Pacific Exercise). Will work with 26 partner nations.
-    Foreign language skills (Japanese, Korean, Tagalog) and prior multinational
-    experience highly desired.""",
-
-    mission="""Deploy 120-soldier liaison element to Joint Base Pearl Harbor-Hickam
-    for 45-day RIMPAC exercise to facilitate multinational training, provide subject
-    matter expertise, and strengthen Pacific partnerships.""",
-
-    execution="""Organize into 6 multinational liaison teams (MLT) of 20 soldiers each.
-    Teams embed with partner nation forces. Focus areas: combined arms, humanitarian
-    assistance/disaster relief, amphibious operations. Coordinate through III MEF.""",
-
-    required_capabilities_summary="""Infantry advisors (11B), intelligence (35F),
-    logistics planners (92Y), medics (68W), signal (25U). Language and cultural
-    awareness critical.""",
-
-    force_size=120,
-    capabilities=[
-        {"name": "Senior Advisor", "mos": "11B", "rank": "E-7", "quantity": 6, "team_size": 1, "priority": 1},
-        {"name": "Infantry Advisor", "mos": "11B", "rank": "E-6", "quantity": 24, "team_size": 1, "priority": 1},
-        {"name": "Intelligence Advisor", "mos": "35F", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 2},
-        {"name": "Logistics Planner", "mos": "92Y", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 2},
-        {"name": "Medical Advisor", "mos": "68W", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
-        {"name": "Signal Advisor", "mos": "25U", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
-        {"name": "Interpreter/Liaison", "mos": "09L", "rank": "E-5", "quantity": 12, "team_size": 1, "priority": 1},
-    ],
-
-    optimization_weights={
-        "fill": 7.0,  # Important but exercise can adjust
-        "cost": 8.0,  # High - Pacific travel expensive
-        "cohesion": 5.0,  # Moderate - teams forming for exercise
-        "cross_lev": 4.0  # Moderate - distributed sourcing acceptable
-    },
-
-    target_fill_rate=0.95,
-    max_cost=300000,
-    priority_focus="Experience - select soldiers with deployment/multinational background"
-)
+@_register("rimpac", "RIMPAC_EXERCISE")
+def _build_rimpac() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="rimpac",
+        name="RIMPAC Exercise Liaison",
+        category="Joint Operations",
+        duration_days=45,
+        location="Hawaii",
+
+        situation="""U.S. Army contributes 120-soldier liaison and training element to
+        RIMPAC 2025 (Rim of the Pacific Exercise). Will work with 26 partner nations.
+        Foreign language skills (Japanese, Korean, Tagalog) and prior multinational
+        experience highly desired.""",
+
+        mission="""Deploy 120-soldier liaison element to Joint Base Pearl Harbor-Hickam
+        for 45-day RIMPAC exercise to facilitate multinational training, provide subject
+        matter expertise, and strengthen Pacific partnerships.""",
+
+        execution="""Organize into 6 multinational liaison teams (MLT) of 20 soldiers each.
+        Teams embed with partner nation forces. Focus areas: combined arms, humanitarian
+        assistance/disaster relief, amphibious operations. Coordinate through III MEF.""",
+
+        required_capabilities_summary="""Infantry advisors (11B), intelligence (35F),
+        logistics planners (92Y), medics (68W), signal (25U). Language and cultural
+        awareness critical.""",
+
+        force_size=120,
+        capabilities=[
+            {"name": "Senior Advisor", "mos": "11B", "rank": "E-7", "quantity": 6, "team_size": 1, "priority": 1},
+            {"name": "Infantry Advisor", "mos": "11B", "rank": "E-6", "quantity": 24, "team_size": 1, "priority": 1},
+            {"name": "Intelligence Advisor", "mos": "35F", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 2},
+            {"name": "Logistics Planner", "mos": "92Y", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 2},
+            {"name": "Medical Advisor", "mos": "68W", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
+            {"name": "Signal Advisor", "mos": "25U", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
+            {"name": "Interpreter/Liaison", "mos": "09L", "rank": "E-5", "quantity": 12, "team_size": 1, "priority": 1},
+        ],
+
+        optimization_weights={
+            "fill": 7.0,  # Important but exercise can adjust
+            "cost": 8.0,  # High - Pacific travel expensive
+            "cohesion": 5.0,  # Moderate - teams forming for exercise
+            "cross_lev": 4.0  # Moderate - distributed sourcing acceptable
+        },
+
+        target_fill_rate=0.95,
+        max_cost=300000,
+        priority_focus="Experience - select soldiers with deployment/multinational background"
+    )
+
+
+@_register("sof_support", "SOF_SUPPORT")
+def _build_sof_support() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="sof_support",
+        name="SOF Support Package",
+        category="Specialized Mission",
+        duration_days=120,
+        location="OCONUS",
+
+        situation="""JSOC requests 40 conventional enablers to support 4-month special
+        operations. Need mature NCOs (E-6+) with specific ASIs/SQIs. All require TS/SCI
+        clearances and must meet SOF medical standards. High-OPTEMPO environment.""",
+
+        mission="""Provide 40-soldier enabler package to support JSOC task force conducting
+        counter-terrorism operations. Focus areas: medical, signal, intelligence, explosive
+        ordnance disposal.""",
+
+        execution="""Package consists of: 12x Special Operations Medics (SOF-M qualified
+        preferred), 10x Signal Intelligence, 8x All-Source Intelligence, 6x EOD, 4x Civil
+        Affairs. Soldiers must pass SOF screening.""",
+
+        required_capabilities_summary="""SOF medics (68W with W1/F1), SIGINT (35N/35S),
+        intelligence (35F), EOD (89D), civil affairs (38B). TS/SCI required for all.""",
+
+        force_size=40,
+        capabilities=[
+            {"name": "Special Operations Medic", "mos": "68W", "rank": "E-7", "quantity": 12, "team_size": 1, "priority": 1},
+            {"name": "SIGINT Analyst", "mos": "35N", "rank": "E-6", "quantity": 10, "team_size": 1, "priority": 1},
+            {"name": "All-Source Intelligence", "mos": "35F", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 1},
+            {"name": "EOD Technician", "mos": "89D", "rank": "E-6", "quantity": 6, "team_size": 1, "priority": 1},
+            {"name": "Civil Affairs Specialist", "mos": "38B", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 10.0,  # Maximum - JSOC requirements inflexible
+            "cost": 6.0,  # High but not primary concern
+            "cohesion": 3.0,  # Low - individuals augmenting SOF teams
+            "cross_lev": 8.0  # High - specialized skillsets scarce
+        },
+
+        target_fill_rate=1.0,
+        max_cost=200000,
+        priority_focus="Qualification match - clearances and ASIs non-negotiable"
+    )
+
+
+@_register("opfor_aug", "OPFOR_AUGMENTATION")
+def _build_opfor_aug() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="opfor_aug",
+        name="CTE OPFOR Augmentation",
+        category="Installation Support",
+        duration_days=180,
+        location="Fort Irwin",
+
+        situation="""Fort Irwin OPFOR requires 200 augmentees for 6-month peak rotation
+        season (summer). Must source from non-rotating units. OPFOR training preferred but
+        not required. Focus on infantry, scouts, and culturally aware soldiers.""",
+
+        mission="""Augment 11th Armored Cavalry Regiment with 200 soldiers for 6 months
+        to support NTC rotations. Soldiers will role-play near-peer adversary conducting
+        combined arms operations against rotating BCTs.""",
+
+        execution="""Integration training (2 weeks), OPFOR certification (2 weeks), then
+        6x 30-day rotation cycles. Augmentees integrate into OPFOR companies. Preference
+        for soldiers with armor/mechanized experience and those who speak Russian/Arabic.""",
+
+        required_capabilities_summary="""Infantry (11B), scouts (19D), armor (19K),
+        with preference for deployment experience and cultural awareness. OPFOR experience
+        a plus.""",
+
+        force_size=200,
+        capabilities=[
+            {"name": "OPFOR Infantry Leader", "mos": "11B", "rank": "E-6", "quantity": 16, "team_size": 1, "priority": 1},
+            {"name": "OPFOR Infantryman", "mos": "11B", "rank": "E-4", "quantity": 80, "team_size": 2, "priority": 1},
+            {"name": "OPFOR Scout Leader", "mos": "19D", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
+            {"name": "OPFOR Scout", "mos": "19D", "rank": "E-4", "quantity": 32, "team_size": 1, "priority": 2},
+            {"name": "OPFOR Armor Crew", "mos": "19K", "rank": "E-5", "quantity": 24, "team_size": 1, "priority": 2},
+            {"name": "OPFOR Support", "mos": "92Y", "rank": "E-5", "quantity": 8, "team_size": 1, "priority": 3},
+        ],
+
+        optimization_weights={
+            "fill": 7.0,  # Important but can work with less
+            "cost": 4.0,  # Moderate - TDY to Irwin manageable
+            "cohesion": 2.0,  # Low - OPFOR builds new teams
+            "cross_lev": 3.0  # Low - distributed sourcing preferred
+        },
+
+        target_fill_rate=0.90,
+        max_cost=150000,
+        priority_focus="Balance - spread OPFOR duty across division fairly"
+    )
+
+
+@_register("edre", "EMERGENCY_EDRE")
+def _build_edre() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="edre",
+        name="Emergency Deployment Exercise",
+        category="Force Generation",
+        duration_days=1,
+        location="Corps-wide",
+
+        situation="""XVIII Airborne Corps conducts no-notice EDRE. All units must account
+        for deployable personnel within 12 hours. Corps G1 needs immediate readiness picture
+        across 4 divisions (~65,000 soldiers). Manual reports take 48+ hours.""",
+
+        mission="""Generate by-name deployment roster for entire XVIII Airborne Corps within
+        12 hours of EDRE alert. Identify all non-deployable personnel with reasons. Provide
+        commander accurate readiness assessment for COCOM reporting.""",
+
+        execution="""Real-time query of HR systems, medical databases, training records.
+        Filter soldiers by deployment criteria (medical, legal, training, family). Generate
+        unit-by-unit manifests. Provide rollup to Corps CDR.""",
+
+        required_capabilities_summary="""All MOSs across corps. Focus: identifying deployment-
+        ready vs. non-deployable soldiers across entire force structure in hours, not days.""",
+
+        force_size=65000,
+        capabilities=[
+            # This scenario is about rapid assessment, not specific capabilities
+            # Would use entire force pool and filter by readiness
+        ],
+
+        optimization_weights={
+            "fill": 10.0,  # N/A for this scenario - it's about speed/accuracy
+            "cost": 0.0,   # N/A - no actual movement
+            "cohesion": 0.0,  # N/A
+            "cross_lev": 0.0  # N/A
+        },
+
+        target_fill_rate=1.0,  # 100% accountability
+        max_cost=0,
+        priority_focus="Speed and accuracy - instant readiness reporting",
+        readiness_only=True
+    )
+
+
+@_register("hurricane_dsca", "HURRICANE_DSCA")
+def _build_hurricane_dsca() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="hurricane_dsca",
+        name="Hurricane DSCA Response",
+        category="Specialized Mission",
+        duration_days=30,
+        location="Puerto Rico",
+
+        situation="""Category 5 hurricane devastates Puerto Rico. ARNORTH requires 500-soldier
+        engineer-heavy task force within 96 hours for disaster response. Focus: infrastructure
+        repair, route clearance, emergency medical. Spanish speakers highly desired.""",
+
+        mission="""Deploy 500-soldier DSCA task force to San Juan within 96 hours to conduct
+        humanitarian assistance/disaster relief operations. Priority: restore critical
+        infrastructure, provide emergency medical care, distribute supplies.""",
+
+        execution="""Task organize: 2x Engineer Companies (heavy equipment), 1x Medical Company,
+        1x Logistics Company, HQ element. Coordinate through FEMA Region 2. 30-day initial
+        commitment with possible extension.""",
+
+        required_capabilities_summary="""Combat engineers (12B), heavy equipment operators
+        (12N), combat medics (68W), logistics specialists (92Y), civil affairs (38B). Spanish
+        language critical.""",
+
+        force_size=500,
+        capabilities=[
+            {"name": "Engineer Squad Leader", "mos": "12B", "rank": "E-6", "quantity": 20, "team_size": 1, "priority": 1},
+            {"name": "Combat Engineer", "mos": "12B", "rank": "E-4", "quantity": 120, "team_size": 2, "priority": 1},
+            {"name": "Heavy Equipment Operator", "mos": "12N", "rank": "E-5", "quantity": 40, "team_size": 1, "priority": 1},
+            {"name": "Medical Team Leader", "mos": "68W", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 1},
+            {"name": "Combat Medic", "mos": "68W", "rank": "E-4", "quantity": 40, "team_size": 1, "priority": 1},
+            {"name": "Civil Affairs", "mos": "38B", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 2},
+            {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 30, "team_size": 2, "priority": 1},
+            {"name": "Motor Transport Operator", "mos": "88M", "rank": "E-4", "quantity": 20, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 10.0,  # Maximum - lives at stake
+            "cost": 5.0,   # Moderate - emergency justifies expense
+            "cohesion": 6.0,  # Important for DSCA coordination
+            "cross_lev": 4.0  # Moderate - spread burden fairly
+        },
+
+        target_fill_rate=1.0,
+        max_cost=250000,
+        priority_focus="Humanitarian - speed and capability over cost"
+    )
+
+
+@_register("sfab", "SFAB_ADVISORS")
+def _build_sfab() -> ScenarioVignette:
+    return ScenarioVignette(
+        id="sfab",
+        name="SFAB Advisor Augmentation",
+        category="Specialized Mission",
+        duration_days=270,
+        location="Afghanistan",
+
+        situation="""1st Security Force Assistance Brigade requires 30 advisors for 9-month
+        train/advise/assist mission in Afghanistan. Need E-7+ with multiple deployments,
+        advisor training complete, cultural awareness. Will advise Afghan National Army.""",
+
+        mission="""Augment 1st SFAB with 30 experienced NCO advisors for 9-month rotation
+        conducting security force assistance operations. Advisors will embed with Afghan
+        National Army units at kandak (battalion) level.""",
+
+        execution="""Pre-deployment: 8-week advisor course, cultural training, language
+        orientation. Deployment: Embed with ANA units, advise on operations, logistics,
+        training. Coordinate through CJOA-A. High-risk environment.""",
+
+        required_capabilities_summary="""Experienced NCOs (E-7+) from combat arms (11B, 19D,
+        13F), logistics (92Y), medical (68W). Prior deployment and advisor experience essential.
+        Dari/Pashto speakers preferred.""",
+
+        force_size=30,
+        capabilities=[
+            {"name": "Senior Infantry Advisor", "mos": "11B", "rank": "E-8", "quantity": 8, "team_size": 1, "priority": 1},
+            {"name": "Infantry Advisor", "mos": "11B", "rank": "E-7", "quantity": 12, "team_size": 1, "priority": 1},
+            {"name": "Cavalry Advisor", "mos": "19D", "rank": "E-7", "quantity": 4, "team_size": 1, "priority": 1},
+            {"name": "Fire Support Advisor", "mos": "13F", "rank": "E-7", "quantity": 2, "team_size": 1, "priority": 2},
+            {"name": "Medical Advisor", "mos": "68W", "rank": "E-7", "quantity": 2, "team_size": 1, "priority": 1},
+            {"name": "Logistics Advisor", "mos": "92Y", "rank": "E-7", "quantity": 2, "team_size": 1, "priority": 2},
+        ],
+
+        optimization_weights={
+            "fill": 10.0,  # Maximum - high-visibility mission
+            "cost": 7.0,   # High - OCONUS combat deployment
+            "cohesion": 4.0,  # Lower - individual advisors
+            "cross_lev": 9.0  # Very high - senior NCOs scarce resource
+        },
+
+        target_fill_rate=1.0,
+        max_cost=350000,
+        priority_focus="Quality over quantity - select absolute best advisors"
+    )
 
 
-SOF_SUPPORT = ScenarioVignette(
-    id="sof_support",
-    name="SOF Support Package",
-    category="Specialized Mission",
-    duration_days=120,
-    location="OCONUS",
-
-    situation="""JSOC requests 40 conventional enablers to support 4-month special
-    operations. Need mature NCOs (E-6+) with specific ASIs/SQIs. All require TS/SCI
-    clearances and must meet SOF medical standards. High-OPTEMPO environment.""",
-
-    mission="""Provide 40-soldier enabler package to support JSOC task force conducting
-    counter-terrorism operations. Focus areas: medical, signal, intelligence, explosive
-    ordnance disposal.""",
-
-    execution="""Package consists of: 12x Special Operations Medics (SOF-M qualified
-    preferred), 10x Signal Intelligence, 8x All-Source Intelligence, 6x EOD, 4x Civil
-    Affairs. Soldiers must pass SOF screening.""",
-
-    required_capabilities_summary="""SOF medics (68W with W1/F1), SIGINT (35N/35S),
-    intelligence (35F), EOD (89D), civil affairs (38B). TS/SCI required for all.""",
-
-    force_size=40,
-    capabilities=[
-        {"name": "Special Operations Medic", "mos": "68W", "rank": "E-7", "quantity": 12, "team_size": 1, "priority": 1},
-        {"name": "SIGINT Analyst", "mos": "35N", "rank": "E-6", "quantity": 10, "team_size": 1, "priority": 1},
-        {"name": "All-Source Intelligence", "mos": "35F", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 1},
-        {"name": "EOD Technician", "mos": "89D", "rank": "E-6", "quantity": 6, "team_size": 1, "priority": 1},
-        {"name": "Civil Affairs Specialist", "mos": "38B", "rank": "E-6", "quantity": 4, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 10.0,  # Maximum - JSOC requirements inflexible
-        "cost": 6.0,  # High but not primary concern
-        "cohesion": 3.0,  # Low - individuals augmenting SOF teams
-        "cross_lev": 8.0  # High - specialized skillsets scarce
-    },
-
-    target_fill_rate=1.0,
-    max_cost=200000,
-    priority_focus="Qualification match - clearances and ASIs non-negotiable"
-)
+# ============================================================================
+# SCENARIO REGISTRY
+# ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _build_scenario(scenario_id: str) -> ScenarioVignette:
+    return _SCENARIO_BUILDERS[scenario_id]()
 
-OPFOR_AUGMENTATION = ScenarioVignette(
-    id="opfor_aug",
-    name="CTE OPFOR Augmentation",
-    category="Installation Support",
-    duration_days=180,
-    location="Fort Irwin",
-
-    situation="""Fort Irwin OPFOR requires 200 augmentees for 6-month peak rotation
-    season (summer). Must source from non-rotating units. OPFOR training preferred but
-    not required. Focus on infantry, scouts, and culturally aware soldiers.""",
-
-    mission="""Augment 11th Armored Cavalry Regiment with 200 soldiers for 6 months
-    to support NTC rotations. Soldiers will role-play near-peer adversary conducting
-    combined arms operations against rotating BCTs.""",
-
-    execution="""Integration training (2 weeks), OPFOR certification (2 weeks), then
-    6x 30-day rotation cycles. Augmentees integrate into OPFOR companies. Preference
-    for soldiers with armor/mechanized experience and those who speak Russian/Arabic.""",
-
-    required_capabilities_summary="""Infantry (11B), scouts (19D), armor (19K),
-    with preference for deployment experience and cultural awareness. OPFOR experience
-    a plus.""",
-
-    force_size=200,
-    capabilities=[
-        {"name": "OPFOR Infantry Leader", "mos": "11B", "rank": "E-6", "quantity": 16, "team_size": 1, "priority": 1},
-        {"name": "OPFOR Infantryman", "mos": "11B", "rank": "E-4", "quantity": 80, "team_size": 2, "priority": 1},
-        {"name": "OPFOR Scout Leader", "mos": "19D", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 2},
-        {"name": "OPFOR Scout", "mos": "19D", "rank": "E-4", "quantity": 32, "team_size": 1, "priority": 2},
-        {"name": "OPFOR Armor Crew", "mos": "19K", "rank": "E-5", "quantity": 24, "team_size": 1, "priority": 2},
-        {"name": "OPFOR Support", "mos": "92Y", "rank": "E-5", "quantity": 8, "team_size": 1, "priority": 3},
-    ],
-
-    optimization_weights={
-        "fill": 7.0,  # Important but can work with less
-        "cost": 4.0,  # Moderate - TDY to Irwin manageable
-        "cohesion": 2.0,  # Low - OPFOR builds new teams
-        "cross_lev": 3.0  # Low - distributed sourcing preferred
-    },
-
-    target_fill_rate=0.90,
-    max_cost=150000,
-    priority_focus="Balance - spread OPFOR duty across division fairly"
-)
 
+@functools.lru_cache(maxsize=None)
+def _all_scenarios() -> Mapping[str, ScenarioVignette]:
+    """Read-only id -> vignette registry, built (once) on first use."""
+    return MappingProxyType(
+        {scenario_id: _build_scenario(scenario_id) for scenario_id in _SCENARIO_BUILDERS}
+    )
 
-EMERGENCY_EDRE = ScenarioVignette(
-    id="edre",
-    name="Emergency Deployment Exercise",
-    category="Force Generation",
-    duration_days=1,
-    location="Corps-wide",
-
-    situation="""XVIII Airborne Corps conducts no-notice EDRE. All units must account
-    for deployable personnel within 12 hours. Corps G1 needs immediate readiness picture
-    across 4 divisions (~65,000 soldiers). Manual reports take 48+ hours.""",
-
-    mission="""Generate by-name deployment roster for entire XVIII Airborne Corps within
-    12 hours of EDRE alert. Identify all non-deployable personnel with reasons. Provide
-    commander accurate readiness assessment for COCOM reporting.""",
-
-    execution="""Real-time query of HR systems, medical databases, training records.
-    Filter soldiers by deployment criteria (medical, legal, training, family). Generate
-    unit-by-unit manifests. Provide rollup to Corps CDR.""",
-
-    required_capabilities_summary="""All MOSs across corps. Focus: identifying deployment-
-    ready vs. non-deployable soldiers across entire force structure in hours, not days.""",
-
-    force_size=65000,
-    capabilities=[
-        # This scenario is about rapid assessment, not specific capabilities
-        # Would use entire force pool and filter by readiness
-    ],
-
-    optimization_weights={
-        "fill": 10.0,  # N/A for this scenario - it's about speed/accuracy
-        "cost": 0.0,   # N/A - no actual movement
-        "cohesion": 0.0,  # N/A
-        "cross_lev": 0.0  # N/A
-    },
-
-    target_fill_rate=1.0,  # 100% accountability
-    max_cost=0,
-    priority_focus="Speed and accuracy - instant readiness reporting"
-)
 
+@functools.lru_cache(maxsize=None)
+def _scenarios_by_category() -> Mapping[str, Tuple[ScenarioVignette, ...]]:
+    """Read-only category -> vignettes index, in definition order."""
+    by_category = defaultdict(list)
+    for scenario in _all_scenarios().values():
+        by_category[scenario.category].append(scenario)
+    return MappingProxyType({category: tuple(group) for category, group in by_category.items()})
 
-HURRICANE_DSCA = ScenarioVignette(
-    id="hurricane_dsca",
-    name="Hurricane DSCA Response",
-    category="Specialized Mission",
-    duration_days=30,
-    location="Puerto Rico",
-
-    situation="""Category 5 hurricane devastates Puerto Rico. ARNORTH requires 500-soldier
-    engineer-heavy task force within 96 hours for disaster response. Focus: infrastructure
-    repair, route clearance, emergency medical. Spanish speakers highly desired.""",
-
-    mission="""Deploy 500-soldier DSCA task force to San Juan within 96 hours to conduct
-    humanitarian assistance/disaster relief operations. Priority: restore critical
-    infrastructure, provide emergency medical care, distribute supplies.""",
-
-    execution="""Task organize: 2x Engineer Companies (heavy equipment), 1x Medical Company,
-    1x Logistics Company, HQ element. Coordinate through FEMA Region 2. 30-day initial
-    commitment with possible extension.""",
-
-    required_capabilities_summary="""Combat engineers (12B), heavy equipment operators
-    (12N), combat medics (68W), logistics specialists (92Y), civil affairs (38B). Spanish
-    language critical.""",
-
-    force_size=500,
-    capabilities=[
-        {"name": "Engineer Squad Leader", "mos": "12B", "rank": "E-6", "quantity": 20, "team_size": 1, "priority": 1},
-        {"name": "Combat Engineer", "mos": "12B", "rank": "E-4", "quantity": 120, "team_size": 2, "priority": 1},
-        {"name": "Heavy Equipment Operator", "mos": "12N", "rank": "E-5", "quantity": 40, "team_size": 1, "priority": 1},
-        {"name": "Medical Team Leader", "mos": "68W", "rank": "E-6", "quantity": 8, "team_size": 1, "priority": 1},
-        {"name": "Combat Medic", "mos": "68W", "rank": "E-4", "quantity": 40, "team_size": 1, "priority": 1},
-        {"name": "Civil Affairs", "mos": "38B", "rank": "E-6", "quantity": 12, "team_size": 1, "priority": 2},
-        {"name": "Supply Specialist", "mos": "92Y", "rank": "E-5", "quantity": 30, "team_size": 2, "priority": 1},
-        {"name": "Motor Transport Operator", "mos": "88M", "rank": "E-4", "quantity": 20, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 10.0,  # Maximum - lives at stake
-        "cost": 5.0,   # Moderate - emergency justifies expense
-        "cohesion": 6.0,  # Important for DSCA coordination
-        "cross_lev": 4.0  # Moderate - spread burden fairly
-    },
-
-    target_fill_rate=1.0,
-    max_cost=250000,
-    priority_focus="Humanitarian - speed and capability over cost"
-)
 
+def __getattr__(name: str):
+    # Vignette constants, the registry mappings and DEMAND_DTYPE are built on access
+    if name == "DEMAND_DTYPE":
+        return _demand_dtype()
+    if name in _NAME_TO_ID:
+        return _build_scenario(_NAME_TO_ID[name])
+    if name in ("ALL_SCENARIOS", "SCENARIOS"):
+        return _all_scenarios()
+    if name in ("SCENARIOS_BY_CATEGORY", "BY_CATEGORY"):
+        return _scenarios_by_category()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-SFAB_ADVISORS = ScenarioVignette(
-    id="sfab",
-    name="SFAB Advisor Augmentation",
-    category="Specialized Mission",
-    duration_days=270,
-    location="Afghanistan",
-
-    situation="""1st Security Force Assistance Brigade requires 30 advisors for 9-month
-    train/advise/assist mission in Afghanistan. Need E-7+ with multiple deployments,
-    advisor training complete, cultural awareness. Will advise Afghan National Army.""",
-
-    mission="""Augment 1st SFAB with 30 experienced NCO advisors for 9-month rotation
-    conducting security force assistance operations. Advisors will embed with Afghan
-    National Army units at kandak (battalion) level.""",
-
-    execution="""Pre-deployment: 8-week advisor course, cultural training, language
-    orientation. Deployment: Embed with ANA units, advise on operations, logistics,
-    training. Coordinate through CJOA-A. High-risk environment.""",
-
-    required_capabilities_summary="""Experienced NCOs (E-7+) from combat arms (11B, 19D,
-    13F), logistics (92Y), medical (68W). Prior deployment and advisor experience essential.
-    Dari/Pashto speakers preferred.""",
-
-    force_size=30,
-    capabilities=[
-        {"name": "Senior Infantry Advisor", "mos": "11B", "rank": "E-8", "quantity": 8, "team_size": 1, "priority": 1},
-        {"name": "Infantry Advisor", "mos": "11B", "rank": "E-7", "quantity": 12, "team_size": 1, "priority": 1},
-        {"name": "Cavalry Advisor", "mos": "19D", "rank": "E-7", "quantity": 4, "team_size": 1, "priority": 1},
-        {"name": "Fire Support Advisor", "mos": "13F", "rank": "E-7", "quantity": 2, "team_size": 1, "priority": 2},
-        {"name": "Medical Advisor", "mos": "68W", "rank": "E-7", "quantity": 2, "team_size": 1, "priority": 1},
-        {"name": "Logistics Advisor", "mos": "92Y", "rank": "E-7", "quantity": 2, "team_size": 1, "priority": 2},
-    ],
-
-    optimization_weights={
-        "fill": 10.0,  # Maximum - high-visibility mission
-        "cost": 7.0,   # High - OCONUS combat deployment
-        "cohesion": 4.0,  # Lower - individual advisors
-        "cross_lev": 9.0  # Very high - senior NCOs scarce resource
-    },
-
-    target_fill_rate=1.0,
-    max_cost=350000,
-    priority_focus="Quality over quantity - select absolute best advisors"
-)
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# ============================================================================
-# SCENARIO REGISTRY
-# ============================================================================
 
-ALL_SCENARIOS = {
-    "ntc_brigade": NTC_BRIGADE_ROTATION,
-    "jrtc_short_notice": JRTC_SHORT_NOTICE,
-    "eucom_poland": EUCOM_POLAND,
-    "indopacom_guam": INDOPACOM_GUAM,
-    "drb_rotation": DIVISION_READY_BRIGADE,
-    "post_deployment": POST_DEPLOYMENT_REFIT,
-    "rimpac": RIMPAC_EXERCISE,
-    "sof_support": SOF_SUPPORT,
-    "opfor_aug": OPFOR_AUGMENTATION,
-    "edre": EMERGENCY_EDRE,
-    "hurricane_dsca": HURRICANE_DSCA,
-    "sfab": SFAB_ADVISORS,
-}
+@functools.lru_cache(maxsize=128)
+def get_scenario(scenario_id: str) -> Optional[ScenarioVignette]:
+    """Get a scenario by ID (built and cached on first request)."""
+    if scenario_id not in _SCENARIO_BUILDERS:
+        return None
+    return _build_scenario(scenario_id)
 
 
-SCENARIOS_BY_CATEGORY = {
-    "Combat Training Center": [NTC_BRIGADE_ROTATION, JRTC_SHORT_NOTICE],
-    "Operational Deployment": [EUCOM_POLAND, INDOPACOM_GUAM],
-    "Force Generation": [DIVISION_READY_BRIGADE, POST_DEPLOYMENT_REFIT, EMERGENCY_EDRE],
-    "Joint Operations": [RIMPAC_EXERCISE],
-    "Specialized Mission": [SOF_SUPPORT, HURRICANE_DSCA, SFAB_ADVISORS],
-    "Installation Support": [OPFOR_AUGMENTATION],
-}
+@functools.lru_cache(maxsize=32)
+def get_scenarios_by_category(category: str) -> Tuple[ScenarioVignette, ...]:
+    """Get all scenarios in a category (shared, immutable tuple)."""
+    return _scenarios_by_category().get(category, ())
 
 
-def get_scenario(scenario_id: str) -> ScenarioVignette:
-    """Get a scenario by ID."""
-    return ALL_SCENARIOS.get(scenario_id)
-
+def filter_scenarios(
+    category: Optional[str] = None,
+    max_duration: Optional[int] = None
+) -> List[ScenarioVignette]:
+    """
+    Get scenarios matching a category and/or a maximum duration in days.
 
-def get_scenarios_by_category(category: str) -> List[ScenarioVignette]:
-    """Get all scenarios in a category."""
-    return SCENARIOS_BY_CATEGORY.get(category, [])
+    Either filter may be omitted; with neither, every scenario is returned.
+    """
+    if category is not None:
+        candidates = _scenarios_by_category().get(category, ())
+    else:
+        candidates = _all_scenarios().values()
+    if max_duration is None:
+        return list(candidates)
+    return [s for s in candidates if s.duration_days <= max_duration]
 
 
-def get_all_scenario_names() -> List[str]:
-    """Get list of all scenario display names."""
-    return [s.name for s in ALL_SCENARIOS.values()]
+@functools.lru_cache(maxsize=None)
+def get_all_scenario_names() -> Tuple[str, ...]:
+    """Get all scenario display names (built once, in definition order)."""
+    return tuple(s.name for s in _all_scenarios().values())
 
 
 def load_scenario_to_session(scenario: ScenarioVignette, session_state):
@@ -675,10 +1041,14 @@ def load_scenario_to_session(scenario: ScenarioVignette, session_state):
         scenario: ScenarioVignette to load
         session_state: Streamlit session_state object
     """
-    session_state.capabilities = scenario.capabilities
-    session_state.workflow_data['weights'] = scenario.optimization_weights
-    session_state.workflow_data['location'] = scenario.location
-    session_state.workflow_data['duration_days'] = scenario.duration_days
-    session_state.workflow_data['template_used'] = scenario.name
-    session_state.workflow_data['scenario_id'] = scenario.id
+    # Editable copies; the vignette itself is shared and read-only
+    session_state.capabilities = [dict(cap) for cap in scenario.capabilities]
+    session_state.workflow_data.update({
+        'weights': dict(scenario.optimization_weights),
+        'location': scenario.location,
+        'duration_days': scenario.duration_days,
+        'template_used': scenario.name,
+        'scenario_id': scenario.id,
+        'readiness_only': scenario.readiness_only,
+    })
     session_state.exercise_location = scenario.location
@@ -16,14 +16,27 @@ Classes:
 """
 
 from __future__ import annotations
+import functools
+import importlib.util
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from unit_types import Unit, SoldierExtended, LeadershipLevel, calculate_unit_cohesion_penalty
 
+# Numba is imported (and its kernel compiled) only by the first update large enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+# Cohesion updates touching at least this many matrix cells use the Numba kernel when installed
+NUMBA_MIN_CELLS = 1_000_000
+
+# TaskOrganizer identifies teams on a thread pool once there are at least this many units
+PARALLEL_MIN_UNITS = 64
+
 
 @dataclass
 class OrganicTeam:
@@ -38,14 +51,25 @@ class OrganicTeam:
     member_ids: List[int]
     team_type: str  # "squad", "team", "section", "crew"
     mos: str  # Primary MOS of the team
+    _all: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _size: int = field(init=False, repr=False, compare=False)
+    _member_set: frozenset = field(init=False, repr=False, compare=False)
+    _member_arr: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Membership is fixed once the team is identified
+        self._all = (self.leader_id, *self.member_ids)
+        self._size = len(self._all)
+        self._member_set = frozenset(self._all)
+        self._member_arr = np.array(list(self._member_set))
 
     def size(self) -> int:
         """Total team size including leader."""
-        return 1 + len(self.member_ids)
+        return self._size
 
-    def all_members(self) -> List[int]:
-        """Get all member IDs including leader."""
-        return [self.leader_id] + self.member_ids
+    def all_members(self) -> Tuple[int, ...]:
+        """Get all member IDs including leader (leader first)."""
+        return self._all
 
 
 class TeamIdentifier:
@@ -59,7 +83,8 @@ class TeamIdentifier:
     def identify_teams(
         unit: Unit,
         soldiers_df: pd.DataFrame,
-        soldiers_ext: Dict[int, SoldierExtended]
+        soldiers_ext: Dict[int, SoldierExtended],
+        supervisor_map: Optional[Dict[int, List[int]]] = None
     ) -> List[OrganicTeam]:
         """
         Identify all organic teams within a unit.
@@ -69,6 +94,13 @@ class TeamIdentifier:
         2. Find all squad leaders (E-6, E-7 with leadership_level = SQUAD_LEADER)
         3. Group soldiers by their supervisor
 
+        Args:
+            unit: Unit to scan
+            soldiers_df: Soldiers (any superset of the unit's soldiers)
+            soldiers_ext: Extended soldier records
+            supervisor_map: This unit's supervisor_id -> [subordinate_ids], if
+                already built (see build_supervisor_maps)
+
         Returns:
             List of OrganicTeam objects
         """
@@ -76,14 +108,11 @@ class TeamIdentifier:
         unit_soldiers = soldiers_df[soldiers_df["uic"] == unit.uic]
 
         # Build supervisor map
-        supervisor_map = defaultdict(list)  # supervisor_id -> [subordinate_ids]
-        for soldier_id, soldier_ext in soldiers_ext.items():
-            if soldier_ext.uic == unit.uic and soldier_ext.supervisor_id:
-                supervisor_map[soldier_ext.supervisor_id].append(soldier_id)
+        if supervisor_map is None:
+            supervisor_map = TeamIdentifier.build_supervisor_maps(soldiers_ext).get(unit.uic, {})
 
         # Find team-level leaders (TL, SL)
-        for idx, soldier_row in unit_soldiers.iterrows():
-            soldier_id = soldier_row["soldier_id"]
+        for soldier_id, mos in zip(unit_soldiers["soldier_id"].tolist(), unit_soldiers["mos"].tolist()):
             soldier_ext = soldiers_ext.get(soldier_id)
 
             if not soldier_ext:
@@ -103,11 +132,27 @@ class TeamIdentifier:
                         leader_id=soldier_id,
                         member_ids=subordinates,
                         team_type=team_type,
-                        mos=soldier_row["mos"]
+                        mos=mos
                     ))
 
         return teams
 
+    @staticmethod
+    def build_supervisor_maps(
+        soldiers_ext: Dict[int, SoldierExtended]
+    ) -> Dict[str, Dict[int, List[int]]]:
+        """
+        Group subordinates by unit and supervisor in one pass.
+
+        Returns:
+            uic -> supervisor_id -> [subordinate_ids]
+        """
+        maps: Dict[str, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+        for soldier_id, soldier_ext in soldiers_ext.items():
+            if soldier_ext.supervisor_id:
+                maps[soldier_ext.uic][soldier_ext.supervisor_id].append(soldier_id)
+        return maps
+
     @staticmethod
     def find_intact_teams_for_requirement(
         requirement_mos: str,
@@ -156,7 +201,7 @@ class CohesionCalculator:
         - Percentage of team kept together
         - Team size (larger teams = bigger bonus)
         """
-        team_members = set(organic_team.all_members())
+        team_members = organic_team._member_set
         assigned_set = set(soldiers_assigned)
 
         # How many team members are being kept together?
@@ -182,21 +227,25 @@ class CohesionCalculator:
         If you take some (but not all) members of a team, there's a penalty
         for leaving gaps in the source unit.
         """
-        penalty = 0.0
+        if not all_teams:
+            return 0.0
 
-        for team in all_teams:
-            team_members = set(team.all_members())
-            taken_set = set(soldiers_taken)
-            taken_from_team = team_members.intersection(taken_set)
+        # Members taken per team, for all teams in one isin + bincount
+        team_sizes = np.array([len(team._member_set) for team in all_teams])
+        members = np.concatenate([team._member_arr for team in all_teams])
+        owner = np.repeat(np.arange(len(all_teams)), team_sizes)
+        taken = np.isin(members, np.asarray(list(soldiers_taken)))
+        n_taken = np.bincount(owner[taken], minlength=len(all_teams))
 
-            # Partial team taken (not all, not none)
-            if 0 < len(taken_from_team) < len(team_members):
-                pct_taken = len(taken_from_team) / len(team_members)
-                # Penalty is highest when ~50% taken (most disruptive)
-                disruption_factor = 1.0 - abs(pct_taken - 0.5) * 2
-                penalty += base_penalty * disruption_factor * len(team_members)
+        # Partial team taken (not all, not none)
+        partial = (n_taken > 0) & (n_taken < team_sizes)
+        pct_taken = n_taken[partial] / team_sizes[partial]
+        # Penalty is highest when ~50% taken (most disruptive)
+        disruption_factor = 1.0 - np.abs(pct_taken - 0.5) * 2
+        team_penalties = base_penalty * disruption_factor * team_sizes[partial]
 
-        return penalty
+        # Summed in team order, as the per-team loop did
+        return sum(team_penalties.tolist(), 0.0)
 
     @staticmethod
     def calculate_battalion_sourcing_penalty(
@@ -222,6 +271,90 @@ class CohesionCalculator:
         return base_penalty * (battalions - 1)
 
 
+class AvailableTeamIndex:
+    """
+    Sourcing candidates for TaskOrganizer.
+
+    Holds indices into the team list per MOS and per (UIC, MOS), in list
+    order, plus a boolean mask of teams already sourced, so each search
+    only visits unused teams of the required MOS.
+
+    mark_used is the only way a team becomes used; TaskOrganizer reads
+    used state from here rather than keeping its own copy.
+
+    Teams are only ever marked used, never released, so an intact-team
+    search for a given (MOS, size, UIC) resumes where the previous one
+    for that key stopped: every team before that point is used or too small.
+    """
+
+    def __init__(self, teams: List[OrganicTeam]):
+        self.teams = teams
+        self.used_mask = np.zeros(len(teams), dtype=bool)
+        self._used_ids: Set[str] = set()
+        self._search_cache: Dict[Tuple[str, int, Optional[str]], int] = {}
+
+        by_mos: Dict[str, List[int]] = defaultdict(list)
+        by_uic_mos: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        by_team_id: Dict[str, List[int]] = defaultdict(list)
+        for i, team in enumerate(teams):
+            by_mos[team.mos].append(i)
+            by_uic_mos[team.unit_uic, team.mos].append(i)
+            by_team_id[team.team_id].append(i)
+
+        self._team_idx_by_mos = {k: np.array(v, dtype=np.intp) for k, v in by_mos.items()}
+        self._team_idx_by_uic_mos = {k: np.array(v, dtype=np.intp) for k, v in by_uic_mos.items()}
+        self._team_idx_by_id = {k: np.array(v, dtype=np.intp) for k, v in by_team_id.items()}
+
+    def available(self, mos: str, uic: Optional[str] = None) -> List[OrganicTeam]:
+        """Unused teams of an MOS (optionally within one unit), in list order."""
+        if uic is None:
+            idx = self._team_idx_by_mos.get(mos)
+        else:
+            idx = self._team_idx_by_uic_mos.get((uic, mos))
+        if idx is None:
+            return []
+        return [self.teams[i] for i in idx[~self.used_mask[idx]].tolist()]
+
+    def find_intact(self, mos: str, size: int, uic: Optional[str] = None) -> Optional[OrganicTeam]:
+        """
+        First unused team of an MOS with at least `size` members.
+
+        Same result as TeamIdentifier.find_intact_teams_for_requirement over
+        the MOS (or UIC + MOS) bucket, resuming from the last search's position.
+        """
+        if uic is None:
+            idx = self._team_idx_by_mos.get(mos)
+        else:
+            idx = self._team_idx_by_uic_mos.get((uic, mos))
+        if idx is None:
+            return None
+
+        key = (mos, size, uic)
+        start = self._search_cache.get(key, 0)
+        for pos, i in enumerate(idx[start:].tolist(), start):
+            if not self.used_mask[i] and self.teams[i].size() >= size:
+                self._search_cache[key] = pos
+                return self.teams[i]
+        self._search_cache[key] = len(idx)
+        return None
+
+    def mark_used(self, team_id: str):
+        """Mark every team with this ID as sourced."""
+        self._used_ids.add(team_id)
+        idx = self._team_idx_by_id.get(team_id)
+        if idx is not None:
+            self.used_mask[idx] = True
+
+    def is_used(self, team_id: str) -> bool:
+        """Whether a team with this ID has been sourced."""
+        return team_id in self._used_ids
+
+    @property
+    def used_team_ids(self) -> frozenset:
+        """IDs of all sourced teams."""
+        return frozenset(self._used_ids)
+
+
 class TaskOrganizer:
     """
     Manages sourcing strategy for manning requirements.
@@ -240,13 +373,41 @@ class TaskOrganizer:
         self.soldiers_df = soldiers_df
         self.soldiers_ext = soldiers_ext
 
-        # Identify all teams
-        self.all_teams: List[OrganicTeam] = []
-        for unit in units.values():
-            teams = TeamIdentifier.identify_teams(unit, soldiers_df, soldiers_ext)
-            self.all_teams.extend(teams)
+        # Identify all teams (soldiers and supervisor links grouped by unit once)
+        soldiers_by_uic = dict(list(soldiers_df.groupby("uic", sort=False)))
+        supervisor_maps = TeamIdentifier.build_supervisor_maps(soldiers_ext)
+        no_soldiers = soldiers_df.iloc[:0]
+
+        def unit_teams(unit: Unit) -> List[OrganicTeam]:
+            return TeamIdentifier.identify_teams(
+                unit,
+                soldiers_by_uic.get(unit.uic, no_soldiers),
+                soldiers_ext,
+                supervisor_maps.get(unit.uic, {})
+            )
+
+        # Units are independent; large task forces scan them concurrently
+        # (map keeps unit order, so all_teams order is unchanged)
+        if len(units) >= PARALLEL_MIN_UNITS:
+            with ThreadPoolExecutor() as executor:
+                results = list(executor.map(unit_teams, units.values()))
+        else:
+            results = [unit_teams(unit) for unit in units.values()]
+        self.all_teams: List[OrganicTeam] = [team for teams in results for team in teams]
+
+        # Per-MOS candidate lists and used mask for sourcing searches
+        self.team_index = AvailableTeamIndex(self.all_teams)
+
+        # Soldier -> first team listing them (leaders also appear in their supervisor's team)
+        self.soldier_to_team: Dict[int, OrganicTeam] = {}
+        for team in self.all_teams:
+            for member_id in team.all_members():
+                self.soldier_to_team.setdefault(member_id, team)
 
-        self.used_team_ids: Set[str] = set()
+    @property
+    def used_team_ids(self) -> frozenset:
+        """IDs of teams sourced so far (read-only; use mark_team_used)."""
+        return self.team_index.used_team_ids
 
     def source_capability(
         self,
@@ -270,36 +431,34 @@ class TaskOrganizer:
         """
         # Strategy 1: Intact team from preferred unit
         if prefer_intact and prefer_from_uic:
-            unit_teams = [t for t in self.all_teams if t.unit_uic == prefer_from_uic]
-            team = TeamIdentifier.find_intact_teams_for_requirement(
-                mos_required, team_size, unit_teams, self.used_team_ids
-            )
+            team = self.team_index.find_intact(mos_required, team_size, prefer_from_uic)
             if team:
-                self.used_team_ids.add(team.team_id)
-                return team.all_members()[:team_size], "intact_team"
+                self.mark_team_used(team)
+                return list(team.all_members()[:team_size]), "intact_team"
 
         # Strategy 2: Intact team from any unit
         if prefer_intact:
-            team = TeamIdentifier.find_intact_teams_for_requirement(
-                mos_required, team_size, self.all_teams, self.used_team_ids
-            )
+            team = self.team_index.find_intact(mos_required, team_size)
             if team:
-                self.used_team_ids.add(team.team_id)
-                return team.all_members()[:team_size], "intact_team"
+                self.mark_team_used(team)
+                return list(team.all_members()[:team_size]), "intact_team"
 
         # Strategy 3: Partial team (if available)
         # Find teams with some availability
-        for team in self.all_teams:
-            if team.team_id not in self.used_team_ids and team.mos == mos_required:
-                available_count = min(team.size(), team_size)
-                if available_count >= team_size * 0.5:  # At least 50% of need
-                    self.used_team_ids.add(team.team_id)
-                    return team.all_members()[:available_count], "partial_team"
+        for team in self.team_index.available(mos_required):
+            available_count = min(team.size(), team_size)
+            if available_count >= team_size * 0.5:  # At least 50% of need
+                self.mark_team_used(team)
+                return list(team.all_members()[:available_count]), "partial_team"
 
         # Strategy 4: Individual backfill (last resort)
         # This would be handled by standard EMD optimization
         return [], "individuals"
 
+    def mark_team_used(self, team: OrganicTeam):
+        """Record a team as sourced so later requirements skip it."""
+        self.team_index.mark_used(team.team_id)
+
     def get_cohesion_adjustment(
         self,
         soldier_id: int,
@@ -327,30 +486,24 @@ class TaskOrganizer:
             return 0.0
 
         # Find soldier's team
-        soldier_team = None
-        for team in self.all_teams:
-            if soldier_id in team.all_members():
-                soldier_team = team
-                break
+        soldier_team = self.soldier_to_team.get(soldier_id)
 
         if not soldier_team:
             return 0.0  # Not part of a team
 
         # Check if other team members are in current assignment
-        team_members_assigned = [
-            sid for sid in current_assignment
-            if sid in soldier_team.all_members()
-        ]
+        team_members = soldier_team._member_set
+        n_assigned = sum(1 for sid in current_assignment if sid in team_members)
 
         # Bonus for keeping team together
-        if len(team_members_assigned) > 0:
+        if n_assigned > 0:
             # More team members together = bigger bonus
-            pct_together = (len(team_members_assigned) + 1) / soldier_team.size()
+            pct_together = (n_assigned + 1) / soldier_team.size()
             adjustment -= 300.0 * pct_together
 
         # Check if this would split the team in source unit
-        if soldier_team.team_id not in self.used_team_ids:
-            team_remaining = soldier_team.size() - len(team_members_assigned) - 1
+        if not self.team_index.is_used(soldier_team.team_id):
+            team_remaining = soldier_team.size() - n_assigned - 1
             if 0 < team_remaining < soldier_team.size():
                 # Penalty for leaving partial team
                 adjustment += 200.0
@@ -372,43 +525,73 @@ class TaskOrganizer:
                 "message": ["No UIC data available in assignments - using legacy soldier generation"]
             })
 
-        sourcing_data = []
-
         by_unit = assignments.groupby("uic")["soldier_id"].count()
 
-        for uic, count in by_unit.items():
-            unit = self.units.get(uic)
-            unit_name = unit.short_name if unit else uic
-
-            # Count intact teams from this unit
-            teams_from_unit = sum(
-                1 for team in self.all_teams
-                if team.team_id in self.used_team_ids and team.unit_uic == uic
-            )
-
-            sourcing_data.append({
-                "uic": uic,
-                "unit_name": unit_name,
-                "soldiers_contributed": count,
-                "intact_teams_sourced": teams_from_unit,
-                "fill_impact_pct": count / unit.assigned_strength if unit else 0.0
-            })
-
-        if not sourcing_data:
+        if by_unit.empty:
             return pd.DataFrame({
                 "message": ["No sourcing data available"]
             })
 
+        # Intact teams sourced per unit, counted once rather than per UIC
+        used_team_ids = self.used_team_ids
+        teams_used_per_uic = Counter(
+            team.unit_uic for team in self.all_teams if team.team_id in used_team_ids
+        )
+
+        uics = by_unit.index.tolist()
+        counts = by_unit.tolist()
+        units = [self.units.get(uic) for uic in uics]
+
+        sourcing_data = {
+            "uic": uics,
+            "unit_name": [unit.short_name if unit else uic for uic, unit in zip(uics, units)],
+            "soldiers_contributed": counts,
+            "intact_teams_sourced": [teams_used_per_uic.get(uic, 0) for uic in uics],
+            "fill_impact_pct": [count / unit.assigned_strength if unit else 0.0
+                                for count, unit in zip(counts, units)]
+        }
+
         df = pd.DataFrame(sourcing_data)
         return df.sort_values("soldiers_contributed", ascending=False)
 
 
+@functools.lru_cache(maxsize=None)
+def _row_bonus_kernel():
+    """Compile (or load from Numba's cache) the parallel row bonus kernel."""
+    from numba import njit, prange
+
+    @njit(["void(float64[:, :], int64[:], float64[:], int64[:])",
+           "void(float32[:, :], int64[:], float32[:], int64[:])"],
+          parallel=True, cache=True)
+    def _apply_row_bonus_numba(matrix, rows, bonus, cols):
+        """matrix[rows[k], cols] -= bonus[k], in place and in parallel over rows."""
+        for k in prange(rows.shape[0]):
+            r = rows[k]
+            b = bonus[k]
+            for c in cols:
+                matrix[r, c] -= b
+
+    return _apply_row_bonus_numba
+
+
+def _apply_row_bonus(matrix: np.ndarray, rows: np.ndarray, bonus: np.ndarray, cols: np.ndarray) -> None:
+    """Subtract a per-row bonus from the (rows x cols) block of matrix, in place."""
+    if len(rows) == 0 or len(cols) == 0:
+        return
+    if (NUMBA_AVAILABLE and matrix.dtype in (np.float32, np.float64)
+            and len(rows) * len(cols) >= NUMBA_MIN_CELLS):
+        _row_bonus_kernel()(matrix, rows.astype(np.int64), bonus.astype(matrix.dtype), cols.astype(np.int64))
+    else:
+        matrix[np.ix_(rows, cols)] -= bonus[:, None]
+
+
 def enhance_cost_matrix_with_cohesion(
     cost_matrix: np.ndarray,
     soldiers_df: pd.DataFrame,
     billets_df: pd.DataFrame,
     task_organizer: TaskOrganizer,
-    cohesion_weight: float = 1.0
+    cohesion_weight: float = 1.0,
+    inplace: bool = False
 ) -> np.ndarray:
     """
     Enhance existing cost matrix with cohesion adjustments.
@@ -422,69 +605,82 @@ def enhance_cost_matrix_with_cohesion(
         billets_df: Billets DataFrame (with capability metadata)
         task_organizer: TaskOrganizer instance
         cohesion_weight: How much to weight cohesion (1.0 = equal to other factors)
+        inplace: Adjust cost_matrix directly instead of a copy (saves an S x B copy)
 
     Returns:
-        Enhanced cost matrix
+        Enhanced cost matrix (cost_matrix itself when inplace=True)
     """
-    enhanced = cost_matrix.copy()
+    enhanced = cost_matrix if inplace else cost_matrix.copy()
+
+    # Adjustments are cast to the matrix's float dtype so float32 matrices
+    # are updated with float32 values and stay float32
+    adj_dtype = enhanced.dtype if np.issubdtype(enhanced.dtype, np.floating) else np.dtype(np.float64)
 
     # Reset indices to ensure they match matrix dimensions
     S = soldiers_df.reset_index(drop=True)
     B = billets_df.reset_index(drop=True)
 
     # Build soldier_id to matrix row index mapping
-    soldier_id_to_row = {row["soldier_id"]: idx for idx, row in S.iterrows()}
+    soldier_id_to_row = dict(zip(S["soldier_id"].tolist(), range(len(S))))
 
     # Add battalion-level bonuses for all capabilities
     # Group soldiers by battalion (first 4 chars of UIC)
     if "uic" in S.columns:
+        batt_bonus = adj_dtype.type(1000.0 * cohesion_weight)
         S["battalion"] = S["uic"].str[:4]
 
+        # Matrix row of every soldier; soldiers without a battalion are never grouped
+        soldier_rows = np.fromiter(
+            (soldier_id_to_row[sid] for sid in S["soldier_id"].tolist()), dtype=np.intp, count=len(S)
+        )
+        has_battalion = S["battalion"].notna().to_numpy()
+
         # For each capability, give bonuses to soldiers from same battalion
         for cap_name in B["capability_name"].unique() if "capability_name" in B.columns else []:
             cap_billets = B[B["capability_name"] == cap_name]
-            billet_indices = cap_billets.index.tolist()
+            billet_indices = cap_billets.index.to_numpy()
 
-            # Group soldiers by battalion for this capability's MOS
+            # Every battalion-grouped soldier of this capability's MOS gets the
+            # bonus once per matching row, on all of the capability's billets
             cap_mos = cap_billets.iloc[0]["mos"] if "mos" in cap_billets.columns else None
             if cap_mos:
-                for battalion, batt_soldiers in S[S["mos"] == cap_mos].groupby("battalion"):
-                    # Give bonus to all soldiers from same battalion
-                    for _, soldier_row in batt_soldiers.iterrows():
-                        soldier_idx = soldier_id_to_row.get(soldier_row["soldier_id"])
-                        if soldier_idx is not None:
-                            for billet_idx in billet_indices:
-                                # Strong bonus for same-battalion sourcing
-                                enhanced[soldier_idx, billet_idx] -= 1000.0 * cohesion_weight
-
-    # Group billets by capability (if keep_together flag set)
+                rows = soldier_rows[(S["mos"] == cap_mos).to_numpy() & has_battalion]
+                counts = np.bincount(rows, minlength=len(S))
+                bonus_rows = np.flatnonzero(counts)
+                # Strong bonus for same-battalion sourcing
+                _apply_row_bonus(enhanced, bonus_rows, (counts[bonus_rows] * batt_bonus).astype(adj_dtype), billet_indices)
+
+    # Group billets by capability (if keep_together flag set): every billet of a
+    # capability with any keep_together row. The flag may be object dtype (e.g.
+    # read back from JSON), and only a literal True counts.
+    keep_billets = np.empty(0, dtype=np.intp)
     if "capability_name" in B.columns and "keep_together" in B.columns:
-        for cap_name in B[B["keep_together"] == True]["capability_name"].unique():
-            cap_billets = B[B["capability_name"] == cap_name]
-            billet_indices = cap_billets.index.tolist()
-
-            # For each soldier, calculate team cohesion adjustment
-            for soldier_row_idx, soldier_row in S.iterrows():
-                soldier_id = soldier_row["soldier_id"]
-
-                # Find soldier's team
-                soldier_team = None
-                for team in task_organizer.all_teams:
-                    if soldier_id in team.all_members():
-                        soldier_team = team
-                        break
-
-                if soldier_team:
-                    # Get matrix row indices for all team members
-                    team_member_indices = [
-                        soldier_id_to_row[sid]
-                        for sid in soldier_team.all_members()
-                        if sid in soldier_id_to_row
-                    ]
-
-                    # Reduce cost for all team members on this capability
-                    for billet_idx in billet_indices:
-                        for team_member_idx in team_member_indices:
-                            enhanced[team_member_idx, billet_idx] -= 200.0 * cohesion_weight
+        keep_mask = B["keep_together"].eq(True).to_numpy(dtype=bool)
+        keep_caps = B.loc[keep_mask, "capability_name"].unique()
+        keep_billets = np.flatnonzero(B["capability_name"].isin(keep_caps).to_numpy())
+
+    if len(keep_billets):
+        # Every soldier on a team pulls all of that team's members toward the
+        # capability, so a member's row moves by 200 * (team soldiers in S).
+        team_hits: Dict[int, List] = {}  # id(team) -> [team, soldiers in S on it]
+        for soldier_id in S["soldier_id"]:
+            soldier_team = task_organizer.soldier_to_team.get(soldier_id)
+            if soldier_team:
+                team_hits.setdefault(id(soldier_team), [soldier_team, 0])[1] += 1
+
+        pull_counts = np.zeros(len(S))
+        for soldier_team, hits in team_hits.values():
+            team_member_indices = [
+                soldier_id_to_row[sid]
+                for sid in soldier_team.all_members()
+                if sid in soldier_id_to_row
+            ]
+            np.add.at(pull_counts, team_member_indices, hits)
+
+        pulled_rows = np.flatnonzero(pull_counts)
+        row_bonus = ((200.0 * cohesion_weight) * pull_counts[pulled_rows]).astype(adj_dtype)
+
+        # Reduce cost for all team members on every billet of a keep_together capability
+        _apply_row_bonus(enhanced, pulled_rows, row_bonus, keep_billets)
 
     return enhanced
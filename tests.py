@@ -1328,6 +1328,27 @@ except Exception as e:
     traceback.print_exc()
 
 print()
+
+# Test 16: Compiled criteria are cached per value type (a pytest test, run by the
+# pytest invocation at the end of this file)
+def test_criterion_cache_distinguishes_value_types():
+    """Equal values of different types (True, 1) do not share a compiled criterion."""
+    import pandas as pd
+    from qualifications import QualificationFilter, FilterCriterion
+
+    soldiers = pd.DataFrame({"soldier_id": range(4), "note": ["1", "True", "x1", "xTrue"]})
+    qf = QualificationFilter(soldiers)
+
+    as_bool = qf.apply_criterion(FilterCriterion("note", "contains", True))
+    as_int = qf.apply_criterion(FilterCriterion("note", "contains", 1))
+    assert as_bool["soldier_id"].tolist() == [1, 3]
+    assert as_int["soldier_id"].tolist() == [0, 2]
+
+
+FILTER_TESTS = [
+    test_criterion_cache_distinguishes_value_types,
+]
+
 print("="*80)
 print("[SUCCESS] All qualification filter tests complete!")
 print("="*80)
@@ -1531,6 +1552,49 @@ except Exception as e:
     import traceback
     traceback.print_exc()
 
+print()
+
+# Test 6: Qualification lookups follow replaced records (a pytest test, run by the
+# pytest invocation at the end of this file)
+def test_profile_record_updates_refresh_lookups():
+    """has_badge/has_license reflect records replaced or added after the first lookup."""
+    import dataclasses
+    from datetime import date, timedelta
+    import pytest
+    from qualifications import SoldierProfileExtended, MilitaryBadge, CivilianLicense, BadgeType
+
+    ranger = MilitaryBadge(code="RANGER", name="Ranger Tab", badge_type=BadgeType.SKILL)
+    profile = SoldierProfileExtended(
+        soldier_id="IDX-1",
+        badges=[ranger],
+        licenses=[CivilianLicense(license_type="CDL_A", license_name="CDL Class A",
+                                  expiration_date=date.today() - timedelta(days=1))],
+    )
+    assert profile.has_badge("RANGER")
+    assert not profile.has_license("CDL_A")
+
+    # Collections are tuples, so records can only change by reassignment or add_records
+    with pytest.raises(TypeError):
+        profile.badges[0] = ranger
+
+    profile.licenses = [dataclasses.replace(
+        profile.licenses[0], expiration_date=date.today() + timedelta(days=365)
+    )]
+    profile.badges = [MilitaryBadge(code="CIB", name="Combat Infantryman Badge",
+                                    badge_type=BadgeType.COMBAT)]
+    assert profile.has_license("CDL_A")
+    assert profile.has_badge("CIB")
+    assert not profile.has_badge("RANGER")
+
+    profile.add_records("badges", [ranger])
+    assert profile.has_badge("RANGER")
+    assert len(profile.badges) == 2
+
+
+PROFILE_TESTS = [
+    test_profile_record_updates_refresh_lookups,
+]
+
 print()
 print("="*80)
 print("[SUCCESS] Extended profile integration test complete!")
@@ -2399,6 +2463,7 @@ Tests:
 5. EMD Integration - End-to-end test with geographic penalties
 """
 
+import numpy as np
 from geolocation import (
     LocationDatabase, DistanceCalculator, TravelCostEstimator,
     calculate_distance_and_cost
@@ -2458,15 +2523,20 @@ def test_distance_calculations():
         ("Camp Humphreys", "Kadena AB", 739, 50),  # Korea to Okinawa
     ]
 
-    all_passed = True
-    for home, dest, expected_dist, tolerance in test_cases:
-        actual_dist = DistanceCalculator.calculate(home, dest, db)
-        diff = abs(actual_dist - expected_dist)
-        status = "[OK]" if diff <= tolerance else "[FAIL]"
-
-        if diff > tolerance:
-            all_passed = False
+    # All pairs in one vectorized haversine over the stacked coordinates
+    homes, dests, expected, tolerances = (np.array(col) for col in zip(*test_cases))
+    home_locs = [db.get(home) for home in homes]
+    dest_locs = [db.get(dest) for dest in dests]
+    actual = DistanceCalculator.haversine_array(
+        [loc.lat for loc in home_locs], [loc.lon for loc in home_locs],
+        [loc.lat for loc in dest_locs], [loc.lon for loc in dest_locs]
+    )
+    diffs = np.abs(actual - expected)
+    within = diffs <= tolerances
+    all_passed = bool(np.all(within))
 
+    for home, dest, actual_dist, expected_dist, diff, ok in zip(homes, dests, actual, expected, diffs, within):
+        status = "[OK]" if ok else "[FAIL]"
         print(f"{status} {home:20} -> {dest:20}: "
               f"{actual_dist:6.0f} mi (expected {expected_dist:6.0f}, diff {diff:.0f})")
 
@@ -2597,8 +2667,6 @@ def test_emd_integration():
     print("Testing EMD integration workflow...")
 
     # Simulate what would happen in EMD
-    from geolocation import LocationDatabase, DistanceCalculator
-
     db = LocationDatabase()
 
     # Simulate soldiers at different bases
@@ -2732,17 +2800,22 @@ Scenario:
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from emd_agent import EMD
 from advanced_profiles import StandardCONUSProfiles
-from geolocation import LocationDatabase
+from geolocation import LocationDatabase, DistanceCalculator, TravelCostEstimator
+
+
+@lru_cache(maxsize=None)
+def geo_db():
+    """LocationDatabase shared by the geographic tests (built once per run)."""
+    return LocationDatabase()
 
 
 def create_test_force():
     """Create a small test force from different bases."""
     from datetime import datetime, timedelta
 
-    soldiers = []
-
     # Base distribution (simulating different home stations)
     bases = [
         ("JBLM", 3),           # 3 from JBLM (Seattle area)
@@ -2751,44 +2824,40 @@ def create_test_force():
         ("Fort Drum", 2),      # 2 from Fort Drum (New York)
     ]
 
-    soldier_id = 1
-    for base, count in bases:
-        for i in range(count):
-            soldiers.append({
-                "soldier_id": f"S{soldier_id:03d}",
-                "name": f"Soldier_{soldier_id}",
-                "paygrade": "E-5",  # Use 'paygrade' not 'rank'
-                "mos": "11B",
-                "base": base,
-                "skill_level": 2,
-                "clearance": "None",
-                "airborne": 0,
-                "pme": "BLC",
-                "asi_ranger": 0,
-                "asi_sniper": 0,
-                "asi_jumpmaster": 0,
-                "driver_license": "HMMWV",
-                "med_cat": 1,
-                "dental_cat": 1,
-                "language": "None",
-                "dwell_months": 12,
-                "available_from": (datetime.today() - timedelta(days=30)).date(),
-                # Derived columns
-                "rank_num": 5,
-                "clear_num": 0,
-                "deployable": 1,
-                # Training columns for readiness
-                "weapons_qual": "YES",
-                "pha": "GREEN",
-                "acft": 540,
-                "heat_injury_prevention": "YES",
-                "laser_safety": "YES",
-                "tis_months": 60,
-                "tig_months": 24,
-            })
-            soldier_id += 1
-
-    return pd.DataFrame(soldiers)
+    # Built column-wise; scalar columns are broadcast to every soldier
+    soldier_ids = range(1, sum(count for _, count in bases) + 1)
+    return pd.DataFrame({
+        "soldier_id": [f"S{soldier_id:03d}" for soldier_id in soldier_ids],
+        "name": [f"Soldier_{soldier_id}" for soldier_id in soldier_ids],
+        "paygrade": "E-5",  # Use 'paygrade' not 'rank'
+        "mos": "11B",
+        "base": np.repeat([base for base, _ in bases], [count for _, count in bases]),
+        "skill_level": 2,
+        "clearance": "None",
+        "airborne": 0,
+        "pme": "BLC",
+        "asi_ranger": 0,
+        "asi_sniper": 0,
+        "asi_jumpmaster": 0,
+        "driver_license": "HMMWV",
+        "med_cat": 1,
+        "dental_cat": 1,
+        "language": "None",
+        "dwell_months": 12,
+        "available_from": (datetime.today() - timedelta(days=30)).date(),
+        # Derived columns
+        "rank_num": 5,
+        "clear_num": 0,
+        "deployable": 1,
+        # Training columns for readiness
+        "weapons_qual": "YES",
+        "pha": "GREEN",
+        "acft": 540,
+        "heat_injury_prevention": "YES",
+        "laser_safety": "YES",
+        "tis_months": 60,
+        "tig_months": 24,
+    })
 
 
 def create_test_requirements():
@@ -2796,6 +2865,7 @@ def create_test_requirements():
     from datetime import datetime, timedelta
 
     requirements = []
+    start_date = (datetime.today() + timedelta(days=30)).date()
 
     # Need 10 E-5 11B (matching our force exactly)
     for i in range(10):
@@ -2810,7 +2880,7 @@ def create_test_requirements():
             "clearance_req": "None",
             "airborne_required": 0,
             "language_required": "None",
-            "start_date": (datetime.today() + timedelta(days=30)).date(),
+            "start_date": start_date,
             "min_rank_num": 5,
             "max_rank_num": 5,
             "clear_req_num": 0,
@@ -2865,12 +2935,11 @@ def test_with_geographic():
     print(f"\nForce: {len(soldiers)} soldiers from 4 bases")
 
     # Show distances from each base to NTC
-    db = LocationDatabase()
-    from geolocation import DistanceCalculator
+    db = geo_db()
 
     print("\nDistances to NTC (Fort Irwin):")
-    for base in soldiers["base"].unique():
-        dist = DistanceCalculator.calculate(base, "NTC", db)
+    bases = soldiers["base"].unique()
+    for base, dist in zip(bases, DistanceCalculator.calculate_batch(bases, "NTC", db)):
         print(f"  {base:20}: {dist:6.0f} miles")
 
     # Create agent WITH exercise location (enables geographic penalties)
@@ -2897,13 +2966,8 @@ def test_with_geographic():
         print(f"  {base:20}: {count} soldiers")
 
     # Calculate total geographic cost
-    total_geo_cost = 0
-    for _, soldier_row in assignment.iterrows():
-        home_base = soldier_row["soldier_base"]
-        dist = DistanceCalculator.calculate(home_base, "NTC", db)
-        from geolocation import TravelCostEstimator
-        cost = TravelCostEstimator.estimate_travel_cost(dist, 30, False)
-        total_geo_cost += cost
+    dists = DistanceCalculator.calculate_batch(assignment["soldier_base"].to_numpy(), "NTC", db)
+    total_geo_cost = TravelCostEstimator.estimate_travel_cost_batch(dists, 30, False).sum()
 
     print(f"\nTotal Travel Cost: ${total_geo_cost:,.0f}")
     print(f"Average Cost per Soldier: ${total_geo_cost / len(assignment):,.0f}")
@@ -2926,24 +2990,15 @@ def compare_results():
 
     # Calculate costs for no-geo assignment
     assignment_no_geo = result_no_geo["assignment"]
-    db = LocationDatabase()
-    from geolocation import DistanceCalculator, TravelCostEstimator
+    db = geo_db()
 
-    total_cost_no_geo = 0
-    for _, soldier_row in assignment_no_geo.iterrows():
-        home_base = soldier_row["soldier_base"]
-        dist = DistanceCalculator.calculate(home_base, "NTC", db)
-        cost = TravelCostEstimator.estimate_travel_cost(dist, 30, False)
-        total_cost_no_geo += cost
+    dists_no_geo = DistanceCalculator.calculate_batch(assignment_no_geo["soldier_base"].to_numpy(), "NTC", db)
+    total_cost_no_geo = TravelCostEstimator.estimate_travel_cost_batch(dists_no_geo, 30, False).sum()
 
     # Calculate costs for geo assignment
     assignment_geo = result_geo["assignment"]
-    total_cost_geo = 0
-    for _, soldier_row in assignment_geo.iterrows():
-        home_base = soldier_row["soldier_base"]
-        dist = DistanceCalculator.calculate(home_base, "NTC", db)
-        cost = TravelCostEstimator.estimate_travel_cost(dist, 30, False)
-        total_cost_geo += cost
+    dists_geo = DistanceCalculator.calculate_batch(assignment_geo["soldier_base"].to_numpy(), "NTC", db)
+    total_cost_geo = TravelCostEstimator.estimate_travel_cost_batch(dists_geo, 30, False).sum()
 
     print(f"\nWithout Geographic Optimization:")
     print(f"  Total Travel Cost: ${total_cost_no_geo:,.0f}")
@@ -2990,8 +3045,13 @@ Comprehensive test suite for error handling and robustness in the
 EMD geographic optimization system.
 
 Tests edge cases, invalid inputs, and error recovery mechanisms.
+These are plain pytest tests; run them in parallel with pytest-xdist:
+
+    pytest -n auto tests.py -k "<test names>"
 """
 
+import importlib.util
+import logging
 import pytest
 import pandas as pd
 import numpy as np
@@ -2999,108 +3059,101 @@ from geolocation import LocationDatabase, DistanceCalculator, TravelCostEstimato
 from advanced_profiles import ProfileRegistry, AdvancedReadinessProfile, get_recommended_profile
 from error_handling import GeoConfig, validate_coordinates, validate_distance, validate_duration, validate_cost
 
+# Per-check detail, formatted only when debug logging is enabled (e.g. pytest --log-level=DEBUG)
+log = logging.getLogger(__name__)
 
-def test_invalid_coordinates():
-    """Test handling of invalid coordinates."""
-    print("\n[TEST] Invalid coordinates handling...")
 
-    # Test 1: Latitude too high
-    result = DistanceCalculator.haversine(200, 0, 0, 0)
-    assert result == GeoConfig.DEFAULT_DISTANCE, f"Expected {GeoConfig.DEFAULT_DISTANCE}, got {result}"
-    print("  [OK] Invalid latitude handled correctly")
+# Parametrized test cases
+INVALID_COORDINATE_CASES = [
+    (200, 0, 0, 0),      # Latitude too high
+    (0, -200, 0, 0),     # Longitude too low
+    ("bad", 0, 0, 0),    # Non-numeric coordinates
+]
+
+EXTREME_DISTANCE_CASES = [
+    GeoConfig.MAX_DISTANCE + 1000,
+    GeoConfig.MAX_DISTANCE * 10,
+]
+
+COORDINATE_VALIDATION_CASES = [
+    (47.6, -122.3, True),    # Valid coordinates
+    (100, -122.3, False),    # Invalid latitude
+    (47.6, -200, False),     # Invalid longitude
+]
 
-    # Test 2: Longitude too low
-    result = DistanceCalculator.haversine(0, -200, 0, 0)
-    assert result == GeoConfig.DEFAULT_DISTANCE
-    print("  [OK] Invalid longitude handled correctly")
+DISTANCE_VALIDATION_CASES = [
+    (1000.0, True),   # Valid distance
+    (-100, False),    # Negative distance
+    (20000, False),   # Extreme distance
+]
 
-    # Test 3: Non-numeric coordinates
-    result = DistanceCalculator.haversine("bad", 0, 0, 0)
-    assert result == GeoConfig.DEFAULT_DISTANCE
-    print("  [OK] Non-numeric coordinates handled correctly")
 
-    print("[PASS] Invalid coordinates test complete\n")
+@pytest.mark.parametrize("lat1,lon1,lat2,lon2", INVALID_COORDINATE_CASES)
+def test_invalid_coordinates(lat1, lon1, lat2, lon2):
+    """Test handling of invalid coordinates."""
+    result = DistanceCalculator.haversine(lat1, lon1, lat2, lon2)
+    assert result == GeoConfig.DEFAULT_DISTANCE, f"Expected {GeoConfig.DEFAULT_DISTANCE}, got {result}"
 
 
 def test_missing_location():
     """Test handling of missing location."""
-    print("\n[TEST] Missing location handling...")
-
     db = LocationDatabase()
 
     # Test exact match fails gracefully
     result = db.get("NonExistentLocation")
     assert result is None, "Missing location should return None"
-    print("  [OK] Missing location returns None")
+    log.debug("Missing location returns None")
 
     # Test get_safe returns default
     jblm = db.get("JBLM")  # Get a valid location to use as default
     result_safe = db.get_safe("NonExistentLocation", default_location=jblm)
     assert result_safe is not None, "get_safe should return default"
     assert result_safe == jblm, "Should return the default location"
-    print(f"  [OK] get_safe returns fallback: {result_safe.name}")
-
-    print("[PASS] Missing location test complete\n")
+    log.debug("get_safe returns fallback: %s", result_safe.name)
 
 
 def test_negative_distance():
     """Test handling of negative distance in cost estimation."""
-    print("\n[TEST] Negative distance handling...")
-
     # Should use default distance internally
     result = TravelCostEstimator.estimate_travel_cost(-100, 14, False)
     assert result > 0, "Should return positive cost even with negative distance"
     assert result == TravelCostEstimator.estimate_travel_cost(GeoConfig.DEFAULT_DISTANCE, 14, False)
-    print(f"  [OK] Negative distance handled: ${result:,.0f}")
-
-    print("[PASS] Negative distance test complete\n")
+    log.debug("Negative distance handled: $%.0f", result)
 
 
 def test_zero_duration():
     """Test handling of zero duration."""
-    print("\n[TEST] Zero duration handling...")
-
     result = TravelCostEstimator.estimate_travel_cost(1000, 0, False)
     assert result > 0, "Should return valid cost even with zero duration"
     # Should use default duration
     expected = TravelCostEstimator.estimate_travel_cost(1000, GeoConfig.DEFAULT_DURATION, False)
     assert result == expected, f"Expected {expected}, got {result}"
-    print(f"  [OK] Zero duration handled: ${result:,.0f}")
-
-    print("[PASS] Zero duration test complete\n")
+    log.debug("Zero duration handled: $%.0f", result)
 
 
-def test_extreme_distance():
+@pytest.mark.parametrize("extreme_distance", EXTREME_DISTANCE_CASES)
+def test_extreme_distance(extreme_distance):
     """Test handling of extremely large distance."""
-    print("\n[TEST] Extreme distance handling...")
-
-    # Test with distance larger than max allowed
-    extreme_distance = GeoConfig.MAX_DISTANCE + 1000
     result = TravelCostEstimator.estimate_travel_cost(extreme_distance, 14, False)
     # Should use default distance
     expected = TravelCostEstimator.estimate_travel_cost(GeoConfig.DEFAULT_DISTANCE, 14, False)
     assert result == expected, f"Extreme distance should be capped to default"
-    print(f"  [OK] Extreme distance handled: {extreme_distance:,.0f} mi -> ${result:,.0f}")
-
-    print("[PASS] Extreme distance test complete\n")
 
 
 def test_profile_validation():
     """Test profile validation."""
-    print("\n[TEST] Profile validation...")
-
     # Test 1: Get valid profile
     profile = ProfileRegistry.get_profile_safe("NTC Rotation")
     assert profile is not None
     is_valid, errors = profile.validate()
     assert is_valid, f"Valid profile failed validation: {errors}"
-    print(f"  [OK] Valid profile passes validation: {profile.profile_name}")
+    log.debug("Valid profile passes validation: %s", profile.profile_name)
 
     # Test 2: Get missing profile (should return default)
     fallback = ProfileRegistry.get_profile_safe("NonExistentProfile")
     assert fallback is not None
     assert fallback.profile_name == "Home_Station_Exercise"
-    print(f"  [OK] Missing profile returns fallback: {fallback.profile_name}")
+    log.debug("Missing profile returns fallback: %s", fallback.profile_name)
 
     # Test 3: Create invalid profile and validate
     invalid_profile = AdvancedReadinessProfile(
@@ -3114,79 +3167,41 @@ def test_profile_validation():
     is_valid, errors = invalid_profile.validate()
     assert not is_valid, "Invalid profile should fail validation"
     assert len(errors) > 0, "Should have error messages"
-    print(f"  [OK] Invalid profile detected: {len(errors)} errors found")
-
-    print("[PASS] Profile validation test complete\n")
+    log.debug("Invalid profile detected: %d errors found", len(errors))
 
 
 def test_empty_assignments():
     """Test handling of empty assignments DataFrame."""
-    print("\n[TEST] Empty assignments handling...")
-
     # Create empty DataFrame
     empty_df = pd.DataFrame()
 
-    # Test calculate_geographic_metrics with empty DF
+    # Test calculate_geographic_metrics with empty DF (dashboard needs streamlit)
+    calculate_geographic_metrics = pytest.importorskip("dashboard").calculate_geographic_metrics
     try:
-        from dashboard import calculate_geographic_metrics
         result = calculate_geographic_metrics(empty_df, "JBLM")
         assert result is None, "Empty assignments should return None"
-        print("  [OK] Empty assignments handled gracefully")
+        log.debug("Empty assignments handled gracefully")
     except Exception as e:
-        print(f"  [X] Error with empty assignments: {e}")
+        log.debug("Error with empty assignments: %s", e)
         raise
 
-    print("[PASS] Empty assignments test complete\n")
-
 
-def test_coordinate_validation():
+@pytest.mark.parametrize("lat,lon,expected_valid", COORDINATE_VALIDATION_CASES)
+def test_coordinate_validation(lat, lon, expected_valid):
     """Test coordinate validation function."""
-    print("\n[TEST] Coordinate validation...")
+    is_valid, msg = validate_coordinates(lat, lon, "Test Location")
+    assert is_valid == expected_valid, f"({lat}, {lon}): expected valid={expected_valid}, got {msg}"
 
-    # Valid coordinates
-    is_valid, msg = validate_coordinates(47.6, -122.3, "Test Location")
-    assert is_valid, f"Valid coordinates rejected: {msg}"
-    print("  [OK] Valid coordinates accepted")
 
-    # Invalid latitude
-    is_valid, msg = validate_coordinates(100, -122.3, "Test Location")
-    assert not is_valid, "Invalid latitude should be rejected"
-    print(f"  [OK] Invalid latitude rejected: {msg}")
-
-    # Invalid longitude
-    is_valid, msg = validate_coordinates(47.6, -200, "Test Location")
-    assert not is_valid, "Invalid longitude should be rejected"
-    print(f"  [OK] Invalid longitude rejected: {msg}")
-
-    print("[PASS] Coordinate validation test complete\n")
-
-
-def test_distance_validation():
+@pytest.mark.parametrize("distance,expected_valid", DISTANCE_VALIDATION_CASES)
+def test_distance_validation(distance, expected_valid):
     """Test distance validation function."""
-    print("\n[TEST] Distance validation...")
-
-    # Valid distance
-    is_valid, msg = validate_distance(1000.0)
-    assert is_valid, f"Valid distance rejected: {msg}"
-    print("  [OK] Valid distance accepted")
-
-    # Negative distance
-    is_valid, msg = validate_distance(-100)
-    assert not is_valid, "Negative distance should be rejected"
-    print(f"  [OK] Negative distance rejected: {msg}")
-
-    # Extreme distance
-    is_valid, msg = validate_distance(20000)
-    assert not is_valid, "Extreme distance should be rejected"
-    print(f"  [OK] Extreme distance rejected: {msg}")
-
-    print("[PASS] Distance validation test complete\n")
+    is_valid, msg = validate_distance(distance)
+    assert is_valid == expected_valid, f"{distance}: expected valid={expected_valid}, got {msg}"
 
 
 def test_location_is_valid():
     """Test GeoLocation.is_valid() method."""
-    print("\n[TEST] GeoLocation.is_valid()...")
-
     # Valid location
     valid_loc = GeoLocation(
         name="Test Base",
@@ -3197,7 +3212,7 @@ def test_location_is_valid():
         installation_type="Base"
     )
     assert valid_loc.is_valid(), "Valid location should pass is_valid()"
-    print("  [OK] Valid location passes is_valid()")
+    log.debug("Valid location passes is_valid()")
 
     # Invalid location
     invalid_loc = GeoLocation(
@@ -3209,95 +3224,65 @@ def test_location_is_valid():
         installation_type="Base"
     )
     assert not invalid_loc.is_valid(), "Invalid location should fail is_valid()"
-    print("  [OK] Invalid location fails is_valid()")
-
-    print("[PASS] GeoLocation.is_valid() test complete\n")
+    log.debug("Invalid location fails is_valid()")
 
 
 def test_fuzzy_location_matching():
     """Test fuzzy location name matching."""
-    print("\n[TEST] Fuzzy location matching...")
-
     db = LocationDatabase()
 
     # Test partial match
     result = db.get("Fort Lewis")  # Should match "JBLM" or similar
     if result:
-        print(f"  [OK] Fuzzy match found: 'Fort Lewis' -> {result.name}")
+        log.debug("Fuzzy match found: 'Fort Lewis' -> %s", result.name)
     else:
-        print("  [INFO] No fuzzy match for 'Fort Lewis'")
+        log.debug("No fuzzy match for 'Fort Lewis'")
 
     # Test search function
     results = db.search("Lewis")
     assert len(results) > 0, "Search should find JBLM"
-    print(f"  [OK] Search found {len(results)} results for 'Lewis'")
-
-    print("[PASS] Fuzzy matching test complete\n")
+    log.debug("Search found %d results for 'Lewis'", len(results))
 
 
 def test_recommended_profile_errors():
     """Test get_recommended_profile with invalid inputs."""
-    print("\n[TEST] Recommended profile error handling...")
-
     # Test with None location
     profile = get_recommended_profile(None, 14)
     assert profile is not None, "Should return fallback for None location"
     assert profile.profile_name == "TDY_Exercise", f"Expected TDY_Exercise, got {profile.profile_name}"
-    print(f"  [OK] None location handled: {profile.profile_name}")
+    log.debug("None location handled: %s", profile.profile_name)
 
     # Test with empty string
     profile = get_recommended_profile("", 14)
     assert profile is not None
-    print(f"  [OK] Empty string handled: {profile.profile_name}")
+    log.debug("Empty string handled: %s", profile.profile_name)
 
     # Test with invalid duration
     profile = get_recommended_profile("Korea", "bad_duration")
     assert profile is not None, "Should handle invalid duration"
-    print(f"  [OK] Invalid duration handled: {profile.profile_name}")
-
-    print("[PASS] Recommended profile error handling complete\n")
-
-
-def run_all_tests():
-    """Run all error handling tests."""
-    print("\n" + "="*80)
-    print("ERROR HANDLING AND ROBUSTNESS TEST SUITE")
-    print("="*80)
-
-    try:
-        test_invalid_coordinates()
-        test_missing_location()
-        test_negative_distance()
-        test_zero_duration()
-        test_extreme_distance()
-        test_profile_validation()
-        test_coordinate_validation()
-        test_distance_validation()
-        test_location_is_valid()
-        test_fuzzy_location_matching()
-        test_recommended_profile_errors()
-
-        # Try dashboard test if available
-        try:
-            test_empty_assignments()
-        except ImportError:
-            print("[SKIP] Dashboard tests skipped (streamlit not in test environment)\n")
-
-        print("="*80)
-        print("[SUCCESS] ALL ERROR HANDLING TESTS PASSED")
-        print("="*80)
-        return True
-
-    except Exception as e:
-        print("\n" + "="*80)
-        print(f"[FAIL] TEST FAILED: {e}")
-        print("="*80)
-        import traceback
-        traceback.print_exc()
-        return False
+    log.debug("Invalid duration handled: %s", profile.profile_name)
+
+
+ERROR_HANDLING_TESTS = [
+    test_invalid_coordinates,
+    test_missing_location,
+    test_negative_distance,
+    test_zero_duration,
+    test_extreme_distance,
+    test_profile_validation,
+    test_coordinate_validation,
+    test_distance_validation,
+    test_location_is_valid,
+    test_fuzzy_location_matching,
+    test_recommended_profile_errors,
+    test_empty_assignments,
+]
 
 
 if __name__ == "__main__":
-    import sys
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    # Let pytest collect and run the suite (in parallel when pytest-xdist is installed)
+    tests = FILTER_TESTS + PROFILE_TESTS + ERROR_HANDLING_TESTS
+    args = [f"{__file__}::{test.__name__}" for test in tests] + ["-q", "-p", "no:cacheprovider"]
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto"]
+    sys.exit(pytest.main(args))
@@ -235,6 +235,19 @@ class SoldierExtended:
         qualified = {eq.equipment_type for eq in self.equipment_quals if eq.is_valid()}
         return all(eq_type in qualified for eq_type in equipment_types)
 
+    def equipment_expiry_by_type(self) -> Dict[str, date]:
+        """
+        Latest expiry date per equipment type (date.max for quals that never expire).
+
+        A soldier is qualified on a type as of a date if it is <= the mapped expiry.
+        """
+        expiry_by_type: Dict[str, date] = {}
+        for eq in self.equipment_quals:
+            expiry = eq.expiry_date if eq.expiry_date is not None else date.max
+            if expiry > expiry_by_type.get(eq.equipment_type, date.min):
+                expiry_by_type[eq.equipment_type] = expiry
+        return expiry_by_type
+
     def last_deployment(self) -> Optional[DeploymentRecord]:
         """Get most recent deployment record."""
         if not self.deployment_history: